@@ -0,0 +1,76 @@
+"""
+Import-time benchmark for xenopoulos_system.
+
+Imports the module in fresh interpreter processes and reports the median
+wall time.  It also checks that the import stays side-effect free: nothing
+is printed and none of the plotting/tabular dependencies are loaded.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 7] [--max-ms 250]
+
+Exits with status 1 if the median import time exceeds --max-ms or if the
+import has side effects.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('matplotlib', 'pandas', 'seaborn', 'scipy')
+
+PROBE = r"""
+import io, contextlib, json, sys, time
+buf = io.StringIO()
+t0 = time.perf_counter()
+with contextlib.redirect_stdout(buf):
+    import xenopoulos_system
+elapsed = time.perf_counter() - t0
+heavy = [m for m in %r if m in sys.modules]
+sys.stdout.write(json.dumps({'seconds': elapsed, 'output': buf.getvalue(), 'heavy': heavy}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_once():
+    """Import the module in a fresh interpreter and return the probe result."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    out = subprocess.run([sys.executable, '-c', PROBE], cwd=REPO_ROOT, env=env,
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--max-ms', type=float, default=250.0,
+                        help='fail if the median import time exceeds this budget')
+    args = parser.parse_args(argv)
+
+    measure_once()  # warm the bytecode cache so only the import itself is timed
+    results = [measure_once() for _ in range(args.repeat)]
+    times_ms = [r['seconds'] * 1000 for r in results]
+    median_ms = statistics.median(times_ms)
+
+    print(f"import xenopoulos_system: median {median_ms:.1f} ms "
+          f"(min {min(times_ms):.1f}, max {max(times_ms):.1f}, n={args.repeat})")
+
+    failures = []
+    if median_ms > args.max_ms:
+        failures.append(f"median import time {median_ms:.1f} ms exceeds {args.max_ms:.1f} ms")
+    if any(r['output'] for r in results):
+        failures.append(f"import printed output: {results[0]['output']!r}")
+    heavy = sorted({m for r in results for m in r['heavy']})
+    if heavy:
+        failures.append(f"import loaded heavy dependencies: {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
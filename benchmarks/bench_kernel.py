@@ -0,0 +1,60 @@
+"""
+Step-kernel benchmark for xenopoulos_system.
+
+Simulates the same systems with the Python step loop and with the
+numba-compiled step kernel and reports the throughput of both and the
+speedup. The backends' equivalence is checked by tests/test_kernel.py.
+
+Usage:
+    python benchmarks/bench_kernel.py [--horizon 100000] [--seed 7]
+
+Exits with status 1 if numba is not installed.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xenopoulos_system as xs  # noqa: E402
+
+CONFIGS = (
+    {},
+    {'history_dtype': 'float32', 'aufhebung_threshold': 0.6, 'volatility_factor': 0.3,
+     'rolling_windows': {'negation_memory': 3, 'extremity_memory': 7}, 'trend_window': 4},
+)
+
+
+def run(backend, horizon, seed, config):
+    """Simulate one system; return (system, seconds)."""
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=horizon, seed=seed,
+                                                  verbose=False, **config)
+    t0 = time.perf_counter()
+    system.simulate_enhanced_historical_process(backend=backend)
+    return system, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--horizon', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if xs._jit_step_kernel() is None:
+        print("numba not installed: nothing to compare against the Python loop")
+        return 1
+    run('jit', 10, args.seed, {})  # compile (or load the cached kernel) outside the timings
+
+    for config in CONFIGS:
+        _, t_python = run('python', args.horizon, args.seed, config)
+        _, t_jit = run('jit', args.horizon, args.seed, config)
+        label = ', '.join(f'{k}={v}' for k, v in config.items()) or 'defaults'
+        print(f"{label}: python {args.horizon / t_python:,.0f} steps/s, "
+              f"jit {args.horizon / t_jit:,.0f} steps/s ({t_python / t_jit:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Update-rate benchmark for the live dashboard of xenopoulos_system.
+
+Feeds a system online with ``observe`` and redraws its LiveDashboard after
+every batch of steps on the non-interactive Agg canvas, then reports the
+sustained updates per second with and without the per-update steps.
+
+Usage:
+    python benchmarks/bench_live.py [--updates 300] [--steps-per-update 10]
+        [--window 500] [--min-rate 20]
+
+Exits with status 1 if the sustained update rate is below --min-rate.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import xenopoulos_system as xs  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--updates', type=int, default=300)
+    parser.add_argument('--steps-per-update', type=int, default=10)
+    parser.add_argument('--window', type=int, default=xs.LIVE_WINDOW_STEPS)
+    parser.add_argument('--retention', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--min-rate', type=float, default=20.0,
+                        help='fail if fewer updates per second are sustained')
+    args = parser.parse_args(argv)
+
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=args.updates, seed=args.seed,
+                                                  retention=args.retention, verbose=False)
+    live = system.create_live_dashboard(window=args.window)
+    observations = np.sin(np.arange(args.updates * args.steps_per_update) / 40.0) * 0.9
+    live.update()  # first full draw captures the static background
+
+    t0 = time.perf_counter()
+    for i in range(args.updates):
+        for value in observations[i * args.steps_per_update:(i + 1) * args.steps_per_update]:
+            system.observe(value)
+        live.update()
+    fed_rate = args.updates / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for _ in range(args.updates):
+        live.update()
+    draw_rate = args.updates / (time.perf_counter() - t0)
+    live.close()
+
+    print(f"live dashboard (window {args.window}): {fed_rate:.1f} updates/s with "
+          f"{args.steps_per_update} observed steps each, {draw_rate:.1f} updates/s redraw only")
+    if fed_rate < args.min_rate:
+        print(f"FAIL: {fed_rate:.1f} updates/s is below {args.min_rate:.1f}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Benchmark suite for the xenopoulos_system simulation core.
+
+Times simulate_enhanced_historical_process, enhanced_analysis_report,
+create_paradox_detection_dashboard (figure construction and PNG rendering)
+and export_comprehensive_analysis over a grid of horizons, and the
+vectorized ensemble over a grid of member counts. Every case runs in a
+fresh interpreter and reports, per phase, the wall time, the throughput in
+steps per second and the peak resident memory, plus the operator-profile
+breakdown of the report and plot phases (dashboard panels, export
+artifacts). Results are written as JSON and can be compared against a
+stored baseline.
+
+Usage:
+    python benchmarks/bench_suite.py [--quick] [--output bench_results.json]
+        [--baseline benchmarks/baseline.json] [--tolerance 0.5]
+        [--save-baseline benchmarks/baseline.json]
+
+Exits with status 1 if a case fails or if any phase is slower than the
+baseline by more than --tolerance.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+
+RESULTS_FORMAT = 'xenopoulos-bench'
+RESULTS_VERSION = 1
+
+HORIZONS = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+RENDER_HORIZONS = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+ENSEMBLE_MEMBERS = (1, 16, 256)
+ENSEMBLE_HORIZONS = (10 ** 2, 10 ** 3, 10 ** 4)
+
+QUICK_HORIZONS = (10 ** 2, 10 ** 3, 10 ** 4)
+QUICK_ENSEMBLE_MEMBERS = (1, 16)
+QUICK_ENSEMBLE_HORIZONS = (10 ** 2, 10 ** 3)
+
+
+# ============================================================================
+# WORKER (one case per interpreter)
+# ============================================================================
+
+def _reset_peak_rss():
+    """Reset the resident-set high-water mark; False where the OS does not allow it."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb():
+    """High-water mark of the resident set size, in MB."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _timed(phases, name, steps, func):
+    """Run ``func`` as phase ``name``, recording seconds, throughput and peak memory."""
+    resettable = _reset_peak_rss()
+    t0 = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - t0
+    phases[name] = {
+        'seconds': seconds,
+        'steps_per_sec': steps / seconds if seconds > 0 else None,
+        'peak_rss_mb': _peak_rss_mb(),
+        'peak_is_phase_local': resettable,
+    }
+    return result
+
+
+def run_case(case):
+    """Execute one benchmark case in this process and return its phases."""
+    import xenopoulos_system as xs
+
+    phases = {}
+    horizon = case['horizon']
+    if case['kind'] == 'ensemble':
+        members = case['members']
+        ensemble = xs.XenopoulosEnsemble(members, historical_horizon=horizon, seed=case['seed'],
+                                         verbose=False)
+        _timed(phases, 'simulate', members * horizon, ensemble.simulate_enhanced_historical_process)
+        return {'backend': 'python', 'phases': phases}
+
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=horizon, seed=case['seed'],
+                                                  verbose=False)
+    backend = 'python' if system._resolve_backend(case['backend']) is None else 'jit'
+    if backend == 'jit':
+        # compile (or load the cached kernel) outside the timings
+        xs.XenopoulosGeneticHistoricalSystem(historical_horizon=10, verbose=False) \
+            .simulate_enhanced_historical_process(backend='jit')
+    _timed(phases, 'simulate', horizon,
+           lambda: system.simulate_enhanced_historical_process(backend=case['backend']))
+    # Per-panel and per-artifact breakdown of the report and plot phases
+    # (enabled after simulate so the step operators run unwrapped)
+    system.enable_profiling()
+    _timed(phases, 'report', horizon, system.enhanced_analysis_report)
+    if case['render']:
+        fig = _timed(phases, 'dashboard', horizon, system.create_paradox_detection_dashboard)
+        _timed(phases, 'dashboard_render', horizon,
+               lambda: fig.savefig(io.BytesIO(), format='png', dpi=150, bbox_inches='tight',
+                                   facecolor='white'))
+        xs.plt.close(fig)
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                _timed(phases, 'export', horizon, system.export_comprehensive_analysis)
+            finally:
+                os.chdir(cwd)
+    return {'backend': backend, 'phases': phases, 'breakdown': system.profile.to_dict()}
+
+
+def worker_main(case_json):
+    """Entry point of the per-case interpreter: print the case result as JSON."""
+    case = json.loads(case_json)
+    sys.path.insert(0, REPO_ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_case(case)
+    sys.stdout.write(json.dumps(result))
+    return 0
+
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def build_cases(args):
+    """The benchmark grid selected by the command line."""
+    horizons = args.horizons or (QUICK_HORIZONS if args.quick else HORIZONS)
+    members = args.members or (QUICK_ENSEMBLE_MEMBERS if args.quick else ENSEMBLE_MEMBERS)
+    ensemble_horizons = QUICK_ENSEMBLE_HORIZONS if args.quick else ENSEMBLE_HORIZONS
+    cases = []
+    for horizon in horizons:
+        cases.append({'id': f'system/h={horizon}', 'kind': 'system', 'horizon': horizon,
+                      'members': 1, 'backend': args.backend, 'seed': args.seed,
+                      'render': horizon <= args.max_render_horizon})
+    for n in members:
+        for horizon in ensemble_horizons:
+            cases.append({'id': f'ensemble/n={n}/h={horizon}', 'kind': 'ensemble',
+                          'horizon': horizon, 'members': n, 'seed': args.seed})
+    return cases
+
+
+def measure_case(case, repeat):
+    """Run a case ``repeat`` times in fresh interpreters; keep the fastest time of each phase."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, MPLBACKEND='Agg')
+    best = None
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', json.dumps(case)],
+                             cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+        if out.returncode != 0:
+            return dict(case, error=out.stderr.strip().splitlines()[-1] if out.stderr.strip()
+                        else f'exit status {out.returncode}')
+        result = json.loads(out.stdout)
+        if best is None:
+            best = result
+            continue
+        for name, phase in result['phases'].items():
+            if phase['seconds'] < best['phases'][name]['seconds']:
+                best['phases'][name] = phase
+    best['total_seconds'] = sum(p['seconds'] for p in best['phases'].values())
+    return dict(case, **best)
+
+
+def environment_info():
+    """Interpreter and library versions recorded with the results."""
+    import numpy
+    info = {
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    for name in ('numba', 'matplotlib', 'pandas'):
+        try:
+            info[name] = __import__(name).__version__
+        except ImportError:
+            info[name] = None
+    return info
+
+
+def compare(results, baseline, tolerance, min_seconds):
+    """Phases slower than the baseline by more than ``tolerance``, as messages."""
+    reference = {case['id']: case for case in baseline['cases'] if 'phases' in case}
+    regressions = []
+    for case in results['cases']:
+        base = reference.get(case['id'])
+        if base is None or 'phases' not in case:
+            continue
+        for name, phase in case['phases'].items():
+            base_phase = base['phases'].get(name)
+            if base_phase is None or base_phase['seconds'] < min_seconds:
+                continue
+            ratio = phase['seconds'] / base_phase['seconds']
+            phase['vs_baseline'] = ratio
+            if ratio > 1 + tolerance:
+                regressions.append(f"{case['id']} {name}: {phase['seconds']:.3f}s vs "
+                                   f"{base_phase['seconds']:.3f}s baseline ({ratio:.2f}x)")
+    return regressions
+
+
+def print_table(results):
+    """Human-readable summary of the results."""
+    print(f"{'case':<26} {'phase':<17} {'seconds':>9} {'steps/s':>13} {'peak MB':>9} {'vs base':>8}")
+    for case in results['cases']:
+        if 'error' in case:
+            print(f"{case['id']:<26} ERROR: {case['error']}")
+            continue
+        for name, phase in case['phases'].items():
+            rate = f"{phase['steps_per_sec']:,.0f}" if phase['steps_per_sec'] else '-'
+            ratio = f"{phase['vs_baseline']:.2f}x" if 'vs_baseline' in phase else '-'
+            print(f"{case['id']:<26} {name:<17} {phase['seconds']:>9.3f} {rate:>13} "
+                  f"{phase['peak_rss_mb']:>9.1f} {ratio:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quick', action='store_true',
+                        help='small grid (horizons up to 10^4) for a fast smoke run')
+    parser.add_argument('--horizons', type=lambda s: [int(float(h)) for h in s.split(',')],
+                        help='comma-separated system horizons, e.g. 1e2,1e4,1e6')
+    parser.add_argument('--members', type=lambda s: [int(m) for m in s.split(',')],
+                        help='comma-separated ensemble sizes')
+    parser.add_argument('--max-render-horizon', type=float, default=max(RENDER_HORIZONS),
+                        help='largest horizon whose dashboard and export are timed')
+    parser.add_argument('--backend', default='auto', choices=('auto', 'python', 'jit'))
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='results file to compare against (skipped if missing)')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='fail if a phase is slower than the baseline by more than this fraction')
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help='ignore baseline phases shorter than this (timer noise)')
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help='also write the results as the new baseline')
+    parser.add_argument('--worker', metavar='CASE', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return worker_main(args.worker)
+
+    results = {
+        'format': RESULTS_FORMAT,
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'cases': [],
+    }
+    for case in build_cases(args):
+        print(f"running {case['id']} ...", flush=True)
+        results['cases'].append(measure_case(case, args.repeat))
+
+    failures = [f"{case['id']}: {case['error']}" for case in results['cases'] if 'error' in case]
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('format') != RESULTS_FORMAT:
+            raise SystemExit(f"{args.baseline} is not a benchmark results file")
+        results['baseline'] = {'path': args.baseline, 'created': baseline.get('created')}
+        failures += compare(results, baseline, args.tolerance, args.min_seconds)
+
+    print_table(results)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"results written to {path}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+
+@pytest.fixture
+def jit_kernel(monkeypatch):
+    """Run backend='jit' through the uncompiled kernel when numba is not installed."""
+    if xs._jit_step_kernel() is None:
+        monkeypatch.setattr(xs, '_JIT_KERNEL', xs._step_kernel)
+
+
+def _snapshot(system):
+    arrays = {f'history.{name}': system.history.column(name) for name in xs.HistoryStore.COLUMNS}
+    arrays['risk_events'] = system.risk_events.records
+    arrays['paradox_events'] = system.paradox_events.records
+    for attr in xs.CHECKPOINT_WINDOWS:
+        for field, value in xs._window_state(getattr(system, attr)).items():
+            arrays[f'window.{attr}.{field}'] = value
+    arrays['noise_pos'] = np.array(system._noise_pos)
+    return arrays
+
+
+@pytest.fixture
+def snapshot():
+    """Arrays describing a system's full simulation state: history, events, windows and noise cursor."""
+    return _snapshot
@@ -0,0 +1,71 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from xenopoulos_system import TrajectoryAggregator, XenopoulosGeneticHistoricalSystem
+
+HORIZON = 50
+
+
+def trajectories(seed, members):
+    rng = np.random.default_rng(seed)
+    return {
+        'XEPTQLRI': 3.0 * rng.beta(2.0, 5.0, size=(members, HORIZON)),
+        'A': np.clip(rng.normal(0.0, 0.5, size=(members, HORIZON)), -1.2, 1.2)
+    }
+
+
+def test_merged_partial_aggregators_match_a_single_one():
+    first, second = trajectories(1, 40), trajectories(2, 25)
+    whole = TrajectoryAggregator(HORIZON).update(first).update(second)
+    merged = TrajectoryAggregator(HORIZON).update(first).merge(TrajectoryAggregator(HORIZON).update(second))
+    for metric in ('XEPTQLRI', 'A'):
+        np.testing.assert_array_equal(merged.count[metric], whole.count[metric])
+        np.testing.assert_array_equal(merged.hist[metric], whole.hist[metric])
+        np.testing.assert_array_equal(merged.min[metric], whole.min[metric])
+        np.testing.assert_array_equal(merged.max[metric], whole.max[metric])
+        np.testing.assert_allclose(merged.mean[metric], whole.mean[metric], rtol=1e-12)
+        np.testing.assert_allclose(merged.m2[metric], whole.m2[metric], rtol=1e-10)
+        values = np.vstack([first[metric], second[metric]])
+        np.testing.assert_allclose(merged.mean[metric], values.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(merged.m2[metric], values.var(axis=0) * len(values), rtol=1e-10)
+
+
+@pytest.mark.parametrize('q', [0.05, 0.5, 0.95])
+def test_quantiles_are_within_one_bin_of_numpy(q):
+    values = trajectories(3, 500)
+    aggregator = TrajectoryAggregator(HORIZON).update(values)
+    for metric in ('XEPTQLRI', 'A'):
+        low, high = aggregator.ranges[metric]
+        width = (high - low) / aggregator.bins
+        # The sketch inverts the empirical CDF; numpy's default linear method
+        # can differ from it by the gap between two neighbouring samples
+        expected = np.quantile(values[metric], q, axis=0, method='inverted_cdf')
+        assert np.abs(aggregator.quantile(metric, q) - expected).max() <= width
+
+
+def test_out_of_range_values_are_counted_and_warned():
+    aggregator = TrajectoryAggregator(3, ranges={'tension': (0.0, 1.0)}, bins=10)
+    with pytest.warns(RuntimeWarning, match='tension'):
+        aggregator.update({'tension': [[0.5, 1.5, -0.2], [2.0, 0.1, 1.0]]})
+    np.testing.assert_array_equal(aggregator.clipped['tension'], [1, 1, 1])
+    np.testing.assert_array_equal(aggregator.hist['tension'][:, [0, -1]], [[0, 1], [0, 1], [1, 1]])
+    other = TrajectoryAggregator(3, ranges={'tension': (0.0, 1.0)}, bins=10)
+    with pytest.warns(RuntimeWarning):
+        other.update_step(0, {'tension': [3.0, 0.5]})
+    np.testing.assert_array_equal(aggregator.merge(other).clipped['tension'], [2, 1, 1])
+    np.testing.assert_array_equal(aggregator.envelope()['tension']['clipped'], [2, 1, 1])
+
+
+def test_default_ranges_cover_a_simulated_system():
+    system = XenopoulosGeneticHistoricalSystem(historical_horizon=600, volatility_factor=0.3,
+                                               initial_state_A=0.9, seed=4, verbose=False)
+    system.simulate_enhanced_historical_process(backend='python')
+    aggregator = TrajectoryAggregator(600)
+    assert {'A', 'anti_A'} <= set(aggregator.ranges)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        aggregator.update_system(system)
+    assert all(not clipped.any() for clipped in aggregator.clipped.values())
+    assert aggregator.count['anti_A'].tolist() == [1] * 600
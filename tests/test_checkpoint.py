@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+SEED = 11
+
+
+@pytest.mark.parametrize('config', [
+    {},
+    {'retention': 300, 'history_dtype': 'float32', 'trend_window': 4},
+])
+def test_checkpoint_round_trip_continues_identically(tmp_path, snapshot, config):
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=1000, seed=SEED, verbose=False,
+                                                  **config)
+    system.simulate_enhanced_historical_process()
+    path = system.save_checkpoint(str(tmp_path / 'system.npz'))
+    restored = xs.XenopoulosGeneticHistoricalSystem.load_checkpoint(path)
+    
+    feed = np.random.default_rng(SEED).uniform(-1.2, 1.2, 400)
+    for observation in feed:
+        assert restored.observe(observation, phase=3) == system.observe(observation, phase=3)
+    expected, actual = snapshot(system), snapshot(restored)
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        np.testing.assert_array_equal(actual[key], expected[key], err_msg=key)
+    assert list(restored.risk_events) == list(system.risk_events)
+    assert list(restored.paradox_events) == list(system.paradox_events)
+    assert restored.enhanced_analysis_report() == system.enhanced_analysis_report()
+
+
+@pytest.mark.parametrize('backend', ['python', 'jit'])
+def test_checkpoint_between_chunks_resumes_the_simulation(tmp_path, jit_kernel, snapshot, backend):
+    expected = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=2100, seed=SEED, verbose=False)
+    expected.simulate_enhanced_historical_process(backend=backend)
+    
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=2100, seed=SEED, verbose=False)
+    for _ in system.simulate_chunks(chunk_steps=700, backend=backend):
+        path = system.save_checkpoint(str(tmp_path / 'system.npz'))
+        break
+    restored = xs.XenopoulosGeneticHistoricalSystem.load_checkpoint(path)
+    restored.simulate_enhanced_historical_process(backend=backend)
+    
+    actual = snapshot(restored)
+    for key, value in snapshot(expected).items():
+        np.testing.assert_array_equal(actual[key], value, err_msg=key)
+    assert list(restored.risk_events) == list(expected.risk_events)
+    assert list(restored.paradox_events) == list(expected.paradox_events)
+    report, expected_report = restored.enhanced_analysis_report(), expected.enhanced_analysis_report()
+    for section in ('current_state', 'distribution', 'paradox_analysis', 'true_system_state'):
+        assert report[section] == expected_report[section]
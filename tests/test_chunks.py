@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from xenopoulos_system import HistoryStore, XenopoulosGeneticHistoricalSystem
+
+SEED = 5
+
+
+@pytest.mark.parametrize('horizon', [2150, 2800])
+def test_chunked_report_state_matches_in_memory_run(horizon):
+    expected = XenopoulosGeneticHistoricalSystem(historical_horizon=horizon, seed=SEED, verbose=False)
+    expected = expected.simulate_enhanced_historical_process(backend='python').enhanced_analysis_report()
+    system = XenopoulosGeneticHistoricalSystem(historical_horizon=horizon, seed=SEED, verbose=False)
+    for _ in system.simulate_chunks(chunk_steps=700, backend='python'):
+        assert len(system.history) <= 700 + 100
+    report = system.enhanced_analysis_report()
+    assert report['true_system_state'] == expected['true_system_state'] != 'INSUFFICIENT_DATA'
+    assert report['current_state'] == expected['current_state']
+    assert report['metrics']['stability_deception'] == expected['metrics']['stability_deception']
+    assert report['paradox_analysis'] == expected['paradox_analysis']
+    assert report['system_info']['total_steps'] == horizon
+
+
+def test_interrupted_stream_resumes_from_its_checkpoint(tmp_path):
+    path = str(tmp_path / 'stream.npz')
+    expected = XenopoulosGeneticHistoricalSystem(historical_horizon=3000, seed=SEED, verbose=False)
+    expected = list(expected.simulate_chunks(chunk_steps=700, backend='python'))
+    
+    system = XenopoulosGeneticHistoricalSystem(historical_horizon=3000, seed=SEED, verbose=False)
+    stream = system.simulate_chunks(chunk_steps=700, backend='python', checkpoint=path)
+    chunks = [next(stream), next(stream), next(stream)]
+    del system, stream  # interrupted while the third chunk was being consumed
+    
+    restored = XenopoulosGeneticHistoricalSystem.load_checkpoint(path)
+    chunks[2:] = restored.simulate_chunks(chunk_steps=700, backend='python', checkpoint=path)
+    assert [chunk['start'] for chunk in chunks] == [chunk['start'] for chunk in expected]
+    for chunk, expected_chunk in zip(chunks, expected):
+        for name in HistoryStore.COLUMNS + ('steps', 'risk_events', 'paradox_events'):
+            np.testing.assert_array_equal(chunk[name], expected_chunk[name], err_msg=name)
+    
+    finished = XenopoulosGeneticHistoricalSystem.load_checkpoint(path)
+    assert list(finished.simulate_chunks(chunk_steps=700)) == []
+    assert finished.enhanced_analysis_report()['paradox_analysis'] == \
+        restored.enhanced_analysis_report()['paradox_analysis']
@@ -0,0 +1,34 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+SEED = 11
+
+# Ensemble history columns by scalar history attribute
+ENSEMBLE_COLUMNS = {'A': 'history_A', 'anti_A': 'history_anti_A', 'tension': 'history_tension',
+                    'XEPTQLRI': 'history_XEPTQLRI', 'paradox_score': 'history_paradox_scores',
+                    'stage': 'history_stages'}
+
+
+@pytest.mark.parametrize('config', [
+    {},
+    {'aufhebung_threshold': [0.6, 0.85, 0.7, 0.95], 'volatility_factor': [0.3, 0.03, 0.1, 0.2]},
+])
+def test_ensemble_members_match_scalar_systems(config):
+    ensemble = xs.XenopoulosEnsemble(4, historical_horizon=1500, seed=SEED, **config)
+    ensemble.simulate_enhanced_historical_process()
+    for i in range(ensemble.n_members):
+        system = ensemble.member_system(i)
+        system.simulate_enhanced_historical_process()
+        for column, attr in ENSEMBLE_COLUMNS.items():
+            np.testing.assert_array_equal(ensemble.member_history(i)[column],
+                                          np.asarray(getattr(system, attr)), err_msg=f'member {i} {column}')
+        np.testing.assert_array_equal(ensemble.phase_history, np.asarray(system.phase_history))
+        assert ensemble.risk_event_counts[i] == len(system.risk_events)
+        assert ensemble.critical_event_counts[i] == sum(e['risk'] == 'CRITICAL' for e in system.risk_events)
+        counts = Counter(e['type'] for e in system.paradox_events)
+        assert {name: int(c[i]) for name, c in ensemble.paradox_event_counts.items()} == \
+            {name: counts[name] for name in ensemble.paradox_event_counts}
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from xenopoulos_system import PARADOX_EVENT_DTYPE, EventLog
+
+
+@pytest.mark.parametrize('prepare', [lambda log: log.clear(), lambda log: log.prune_before(5)])
+def test_adopted_read_only_records_are_never_written(prepare):
+    records = np.zeros(8, dtype=PARADOX_EVENT_DTYPE)
+    records['step'] = np.arange(8)
+    records.flags.writeable = False
+    log = EventLog(PARADOX_EVENT_DTYPE)
+    log.adopt(records)
+    prepare(log)
+    n = len(log)
+    log.append(9, 2, 0.9, 0.9, 0.95, 6)
+    assert len(log) == n + 1
+    assert log.records['step'][-1] == 9
+    np.testing.assert_array_equal(records['step'], np.arange(8))
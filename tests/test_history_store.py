@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from xenopoulos_system import HistoryStore
+
+
+def read_only_columns(n, dtype=np.float64):
+    columns = {}
+    for name in HistoryStore.COLUMNS:
+        column = np.arange(n, dtype=dtype if name in HistoryStore.FLOAT_COLUMNS else np.int8)
+        column.flags.writeable = False
+        columns[name] = column
+    return columns
+
+
+ROW = dict(A=0.5, anti_A=-0.5, tension=0.25, XEPTQLRI=0.1, true_XEPTQLRI=0.1, stage=3, true_stage=3,
+           paradox_score=0.2, phase=1, raw_XEPTQLRI=0.05)
+
+
+@pytest.mark.parametrize('prepare', [
+    lambda store: store.clear(),
+    lambda store: store.trim(2),
+    lambda store: store.restore(read_only_columns(3)),
+])
+def test_adopted_read_only_columns_are_never_written(prepare):
+    store = HistoryStore()
+    columns = read_only_columns(6)
+    store.adopt(columns, first_step=10)
+    prepare(store)
+    n = len(store)
+    store.append(**ROW)
+    assert len(store) == n + 1
+    assert store.column('A')[-1] == ROW['A']
+    np.testing.assert_array_equal(columns['A'], np.arange(6))
+
+
+def test_adopted_columns_under_retention_compact_into_owned_storage():
+    store = HistoryStore(retention=3)
+    store.adopt(read_only_columns(6), first_step=0)
+    store.trim(3)
+    for _ in range(4):
+        store.append(**ROW)
+    assert len(store) == 3
+    assert store.total_steps == 10
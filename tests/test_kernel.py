@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+HORIZON = 3000
+SEED = 7
+
+CONFIGS = {
+    'defaults': {},
+    'phase_schedule': {
+        'history_dtype': 'float32', 'aufhebung_threshold': 0.6, 'volatility_factor': 0.3,
+        'rolling_windows': {'negation_memory': 3, 'extremity_memory': 7}, 'trend_window': 4,
+        'phase_schedule': xs.PhaseSchedule([400, 1100, 1500, 2600, 3000], [3, 0, 5, 2, 6],
+                                           params={5: {'pressure': 0.9, 'frequency': 0.2}}),
+    },
+}
+
+
+def simulate(backend, config):
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=HORIZON, seed=SEED,
+                                                  verbose=False, **config)
+    return system.simulate_enhanced_historical_process(backend=backend)
+
+
+@pytest.mark.parametrize('name', CONFIGS)
+def test_jit_kernel_matches_python_loop(jit_kernel, snapshot, name):
+    expected = snapshot(simulate('python', CONFIGS[name]))
+    actual = snapshot(simulate('jit', CONFIGS[name]))
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        np.testing.assert_array_equal(actual[key], expected[key], err_msg=key)
+
+
+@pytest.mark.parametrize('name', CONFIGS)
+def test_compiled_jit_kernel_matches_python_loop(snapshot, name):
+    numba = pytest.importorskip('numba')
+    kernel = xs._jit_step_kernel()
+    assert isinstance(kernel, numba.core.dispatcher.Dispatcher)
+    expected = snapshot(simulate('python', CONFIGS[name]))
+    actual = snapshot(simulate('jit', CONFIGS[name]))
+    assert kernel.signatures
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        np.testing.assert_array_equal(actual[key], expected[key], err_msg=key)
+
+
+def test_jit_backend_rejects_retention(jit_kernel):
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=100, seed=SEED, retention=50,
+                                                  verbose=False)
+    with pytest.raises(ValueError):
+        system.simulate_enhanced_historical_process(backend='jit')
+
+
+@pytest.mark.parametrize('backend', ['python', 'jit'])
+def test_chunked_simulation_matches_in_memory_run(jit_kernel, backend):
+    config = CONFIGS['phase_schedule']
+    expected = simulate('python', config)
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=HORIZON, seed=SEED,
+                                                  verbose=False, **config)
+    chunks = list(system.simulate_chunks(chunk_steps=700, backend=backend))
+    for name in xs.HistoryStore.COLUMNS:
+        np.testing.assert_array_equal(np.concatenate([chunk[name] for chunk in chunks]),
+                                      expected.history.column(name), err_msg=name)
+    for log in ('risk_events', 'paradox_events'):
+        np.testing.assert_array_equal(np.concatenate([chunk[log] for chunk in chunks]),
+                                      getattr(expected, log).records, err_msg=log)
@@ -0,0 +1,30 @@
+import matplotlib
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+
+@pytest.fixture
+def live():
+    matplotlib.use('Agg')
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=100, seed=3, verbose=False)
+    dashboard = system.create_live_dashboard(window=200)
+    yield dashboard
+    dashboard.close()
+
+
+def feed(system, n, seed):
+    for observation in np.random.default_rng(seed).uniform(-1, 1, n):
+        system.observe(observation)
+
+
+def test_update_after_reset_drops_the_old_trajectory(live):
+    system = live.system
+    feed(system, 50, seed=1)
+    live.update()
+    system.reset_system()
+    feed(system, 80, seed=2)
+    live.update()
+    assert live._n == 80
+    np.testing.assert_array_equal(live._buffer[2, :live._n], system.history_XEPTQLRI)
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from xenopoulos_system import XenopoulosGeneticHistoricalSystem
+
+HORIZON = 3000
+SEED = 7
+
+
+@pytest.fixture(scope='module')
+def rescored():
+    system = XenopoulosGeneticHistoricalSystem(historical_horizon=HORIZON, seed=SEED, verbose=False)
+    system.simulate_enhanced_historical_process()
+    return system.rescore([0.6, 0.75, 0.85, 0.95])
+
+
+def test_rescore_matches_resimulation(rescored):
+    for k, threshold in enumerate(rescored['thresholds']):
+        system = XenopoulosGeneticHistoricalSystem(historical_horizon=HORIZON, seed=SEED,
+                                                   aufhebung_threshold=threshold, verbose=False)
+        system.simulate_enhanced_historical_process()
+        np.testing.assert_array_equal(rescored['XEPTQLRI'][k], system.history_XEPTQLRI)
+        np.testing.assert_array_equal(rescored['stages'][k], system.history_stages)
+        np.testing.assert_array_equal(rescored['risk_events'][k].records, system.risk_events.records)
+        np.testing.assert_array_equal(rescored['paradox_events'][k].records, system.paradox_events.records)
+        report = system.enhanced_analysis_report()
+        assert rescored['reports'][k]['paradox_analysis'] == report['paradox_analysis']
+        assert rescored['reports'][k]['distribution'] == report['distribution']
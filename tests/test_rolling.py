@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from xenopoulos_system import CategoryWindow, RollingTrend, RollingWindow
+
+SEED = 3
+
+
+def test_rolling_window_matches_slices_across_resyncs():
+    values = np.random.default_rng(SEED).normal(0.5, 0.3, 3 * RollingWindow.RESYNC_EVERY + 100)
+    window = RollingWindow(50, squares=True)
+    for i, x in enumerate(values):
+        window.push(x)
+        recent = values[max(i - 49, 0):i + 1]
+        assert window.count == len(recent)
+        assert window.mean() == pytest.approx(np.mean(recent), abs=1e-12)
+        assert np.sqrt(max(window.variance(), 0.0)) == pytest.approx(np.std(recent), abs=1e-9)
+
+
+def test_rolling_window_counts_flags_exactly():
+    flags = np.random.default_rng(SEED).uniform(-1.2, 1.2, 2 * RollingWindow.RESYNC_EVERY) > 0.8
+    window = RollingWindow(50)
+    for i, flag in enumerate(flags):
+        window.push(flag)
+        assert window.total == np.count_nonzero(flags[max(i - 49, 0):i + 1])
+
+
+def test_rolling_window_batch_matches_scalar_lanes():
+    values = np.random.default_rng(SEED).normal(size=(RollingWindow.RESYNC_EVERY + 10, 3))
+    batch = RollingWindow(7, shape=(3,), squares=True)
+    lanes = [RollingWindow(7, squares=True) for _ in range(3)]
+    for row in values:
+        batch.push(row)
+        for lane, x in zip(lanes, row):
+            lane.push(x)
+    np.testing.assert_array_equal(batch.mean(), [lane.mean() for lane in lanes])
+    np.testing.assert_array_equal(batch.variance(), [lane.variance() for lane in lanes])
+
+
+@pytest.mark.parametrize('window', [2, 10, 37])
+def test_rolling_trend_matches_polyfit_across_resyncs(window):
+    rng = np.random.default_rng(SEED)
+    values = np.cumsum(rng.normal(size=20 * RollingTrend.RESYNC_WINDOWS * window)) + 1000.0
+    trend = RollingTrend(window)
+    for i, y in enumerate(values):
+        trend.push(y)
+        if trend.full:
+            expected = np.polyfit(np.arange(window), values[i - window + 1:i + 1], 1)[0]
+            assert trend.slope() == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_category_window_matches_set_and_variance_of_slices():
+    codes = np.random.default_rng(SEED).integers(0, 10, 5000)
+    window = CategoryWindow(20, 10)
+    for i, code in enumerate(codes):
+        window.push(code)
+        recent = codes[max(i - 19, 0):i + 1].tolist()
+        assert window.distinct == len(set(recent))
+        assert window.variance() == pytest.approx(np.var(recent), abs=1e-12)
@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from xenopoulos_system import XenopoulosGeneticHistoricalSystem, member_seed_sequence
+
+SEED = 2024
+N_SYSTEMS = 4
+
+
+def simulate(index):
+    system = XenopoulosGeneticHistoricalSystem(historical_horizon=600, seed=member_seed_sequence(SEED, index),
+                                               verbose=False)
+    system.simulate_enhanced_historical_process(backend='python')
+    return system.history_A.copy(), system.history_XEPTQLRI.copy(), system.history_stages.copy()
+
+
+def test_results_do_not_depend_on_the_executor():
+    expected = [simulate(i) for i in range(N_SYSTEMS)]
+    for executor in (ThreadPoolExecutor(N_SYSTEMS), ProcessPoolExecutor(2)):
+        with executor:
+            # Reverse order so that no run happens to follow its serial schedule
+            results = list(executor.map(simulate, range(N_SYSTEMS - 1, -1, -1)))[::-1]
+        for got, want in zip(results, expected):
+            for a, b in zip(got, want):
+                np.testing.assert_array_equal(a, b)
+
+
+def test_systems_built_together_do_not_share_a_stream():
+    alone = XenopoulosGeneticHistoricalSystem(historical_horizon=300, seed=2, verbose=False)
+    alone.simulate_enhanced_historical_process()
+    
+    first = XenopoulosGeneticHistoricalSystem(historical_horizon=300, seed=1, verbose=False)
+    second = XenopoulosGeneticHistoricalSystem(historical_horizon=300, seed=2, verbose=False)
+    np.random.seed(0)
+    np.random.random(1000)  # the legacy global stream is not used either
+    first.simulate_enhanced_historical_process()
+    second.simulate_enhanced_historical_process()
+    np.testing.assert_array_equal(second.history_A, alone.history_A)
+    np.testing.assert_array_equal(second.history_XEPTQLRI, alone.history_XEPTQLRI)
+    assert not np.array_equal(first.history_A, second.history_A)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+import xenopoulos_system as xs
+
+SEED = 11
+
+
+@pytest.mark.parametrize('config', [
+    {},
+    {'aufhebung_threshold': 0.6, 'volatility_factor': 0.3, 'trend_window': 4},
+    {'retention': 700, 'volatility_factor': 0.3},
+    {'aufhebung_threshold': 0.6, 'volatility_factor': 0.3,
+     'phase_schedule': xs.PhaseSchedule([400, 1100, 1500, 2600, 3000], [3, 0, 5, 2, 6],
+                                        params={5: {'pressure': 0.9, 'volatility': 0.6}})},
+])
+def test_classify_history_stages_matches_recorded_stages(config):
+    system = xs.XenopoulosGeneticHistoricalSystem(historical_horizon=3000, seed=SEED, verbose=False,
+                                                  **config)
+    system.simulate_enhanced_historical_process()
+    np.testing.assert_array_equal(system.classify_history_stages(), system.history_stages)
+
+
+def stepwise_stages(tension, abs_A, abs_anti, paradox_score, threshold, window, iterate=True):
+    """Per-step classifier on plain slices; without ``iterate`` τ₈ only sees non-τ₈ stages."""
+    stages, unmarked = [], []
+    for i in range(len(tension)):
+        if abs_A[i] > 0.8 and abs_anti[i] > 0.8 and tension[i] < 0.4:
+            override = 6
+        elif tension[i] < 0.3 and (abs_A[i] > 0.7 or abs_anti[i] > 0.7):
+            override = 7
+        else:
+            override = None
+        if paradox_score[i] > 0.8 and tension[i] > 0.6:
+            stage = 9
+        else:
+            stage = int(np.searchsorted([0.15, 0.35, 0.55, 0.75, threshold], tension[i], side='right'))
+        if override is None and i > window:
+            recent = (stages if iterate else unmarked)[i - window:i]
+            total, total_sq = sum(recent), sum(s * s for s in recent)
+            if len(set(recent)) >= 4 and (window * total_sq - total * total) / window ** 2 > 1.5 ** 2:
+                override = 8
+        unmarked.append(stage if override in (None, 8) else override)
+        stages.append(stage if override is None else override)
+    return np.array(stages)
+
+
+def test_classify_stages_resolves_chained_permanent_dialectics():
+    rng = np.random.default_rng(SEED)
+    n, window, threshold = 4000, 20, 0.85
+    tension = rng.uniform(0, 1, n)
+    abs_A, abs_anti = rng.uniform(0, 0.9, n), rng.uniform(0, 0.9, n)
+    paradox_score = rng.uniform(0, 1, n)
+    expected = stepwise_stages(tension, abs_A, abs_anti, paradox_score, threshold, window)
+    # τ₈ steps change later τ₈ windows, so a single pass is not enough here
+    assert not np.array_equal(
+        expected, stepwise_stages(tension, abs_A, abs_anti, paradox_score, threshold, window, iterate=False))
+    np.testing.assert_array_equal(
+        xs.classify_stages(tension, abs_A, -abs_anti, paradox_score, threshold, window), expected)
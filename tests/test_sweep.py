@@ -0,0 +1,65 @@
+import json
+
+import pandas as pd
+import pytest
+
+from xenopoulos_system import expand_parameter_grid, parameter_sweep
+
+GRID = {'aufhebung_threshold': [0.7, 0.85], 'volatility_factor': [0.03, 0.1, 0.3]}
+BASE = {'historical_horizon': 150}
+
+
+def sweep(path, **kwargs):
+    kwargs.setdefault('seed', 9)
+    return parameter_sweep(GRID, base_params=BASE, processes=1, checkpoint=str(path), verbose=False,
+                           **kwargs)
+
+
+def test_expand_parameter_grid_is_a_cartesian_product_in_order():
+    assert expand_parameter_grid({'a': [1, 2], 'b': ['x', 'y', 'z']}) == [
+        {'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'}, {'a': 1, 'b': 'z'},
+        {'a': 2, 'b': 'x'}, {'a': 2, 'b': 'y'}, {'a': 2, 'b': 'z'},
+    ]
+    assert expand_parameter_grid({}) == [{}]
+
+
+def test_resume_after_a_truncated_line_reproduces_the_sweep(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    expected = sweep(path)
+    lines = path.read_text(encoding='utf-8').splitlines(keepends=True)
+    assert len(lines) == 1 + len(expected)
+    # Interrupted while writing the fifth row
+    path.write_text(''.join(lines[:5]) + lines[5][:20], encoding='utf-8')
+
+    resumed = sweep(path, seed=None)
+    pd.testing.assert_frame_equal(resumed, expected)
+    rows = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()[1:]]
+    assert sorted(row['sample_id'] for row in rows) == list(range(len(expected)))
+
+
+def test_resume_rejects_a_different_seed(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    sweep(path)
+    with pytest.raises(ValueError, match='different seed'):
+        sweep(path, seed=10)
+    sweep(path, seed=9)
+
+
+def test_resume_rejects_rows_of_other_parameters(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    sweep(path)
+    lines = path.read_text(encoding='utf-8').splitlines()
+    row = json.loads(lines[2])
+    row['volatility_factor'] = 0.5
+    lines[2] = json.dumps(row)
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    with pytest.raises(ValueError, match='does not match'):
+        sweep(path)
+
+
+def test_resume_rejects_a_checkpoint_of_another_sweep(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    sweep(path)
+    with pytest.raises(ValueError, match='different sweep'):
+        parameter_sweep({'aufhebung_threshold': [0.7]}, base_params=BASE, processes=1,
+                        checkpoint=str(path), verbose=False)
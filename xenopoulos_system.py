@@ -8,34 +8,2406 @@ GitHub: https://github.com/kxenopoulou/epistemology-of-logic
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import warnings
 import json
-import pandas as pd
-import matplotlib
-from matplotlib.patches import Rectangle, FancyBboxPatch
-from matplotlib.lines import Line2D
-from matplotlib.colors import LinearSegmentedColormap
-import seaborn as sns
-from scipy import stats
+import copy
+import functools
+import importlib
+import os
+import shutil
 import sys
+import tempfile
+import time
+import warnings
 from datetime import datetime
 import hashlib
 import traceback
+from collections import deque
+
+
+class _LazyModule:
+    """Module proxy that defers the actual import until first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# Plotting and tabular dependencies are only needed by the dashboard, export
+# and sweep functions; importing the simulation core must not pay for them.
+plt = _LazyModule('matplotlib.pyplot')
+pd = _LazyModule('pandas')
+
+# Style applied to every figure this module creates (a seaborn "whitegrid"
+# equivalent plus Unicode/layout settings).  It is scoped with rc_context so
+# importing or plotting never changes the caller's global rcParams.
+PLOT_STYLE = {
+    'axes.unicode_minus': False,
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['DejaVu Sans', 'Liberation Sans', 'Arial'],
+    'figure.constrained_layout.use': True,
+    'figure.dpi': 100,
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '.8',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.labelcolor': '.15',
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'xtick.top': False,
+    'ytick.right': False,
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+}
+
+
+def _with_plot_style(func):
+    """Run a plotting function under PLOT_STYLE."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with plt.rc_context(PLOT_STYLE):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+# Most points drawn per series in a dashboard panel; longer series go through
+# min/max decimation (about two points per pixel column of the widest panel)
+PLOT_MAX_POINTS = 4000
+
+
+def _envelope_indices(y, max_points=PLOT_MAX_POINTS):
+    """
+    Positions kept by a min/max decimation of ``y``, in time order.
+    
+    The series is cut into ``max_points // 2`` equal buckets, each keeping
+    the positions of its minimum and maximum, so the drawn envelope and
+    every spike survive however long the series is. Series of at most
+    ``max_points`` values (or ``max_points=None``) are kept whole.
+    """
+    y = np.asarray(y)
+    n = len(y)
+    if max_points is None or n <= max_points:
+        return np.arange(n)
+    size = -(-n // (max_points // 2))
+    m = -(-n // size)
+    padded = np.empty(m * size, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]  # repeats of an earlier value never win argmin/argmax
+    blocks = padded.reshape(m, size)
+    lo, hi = blocks.argmin(axis=1), blocks.argmax(axis=1)
+    offsets = np.arange(m) * size
+    return np.column_stack((offsets + np.minimum(lo, hi), offsets + np.maximum(lo, hi))).ravel()
+
+
+def _decimate(y, max_points=PLOT_MAX_POINTS):
+    """(positions, values) of the min/max decimation of ``y``."""
+    positions = _envelope_indices(y, max_points)
+    return positions, np.asarray(y)[positions]
+
+
+def _thin_positions(positions, n, max_points=PLOT_MAX_POINTS):
+    """Keep the first of the sorted ``positions`` in each of ``max_points`` columns of 0 .. n - 1."""
+    positions = np.asarray(positions)
+    if max_points is None or len(positions) <= max_points:
+        return positions
+    columns = positions * max_points // max(n, 1)
+    return positions[np.flatnonzero(np.diff(columns, prepend=-1))]
+
+
+# Scatter panels (phase space, tension vs paradox) of longer histories are
+# drawn as a binned 2-D density on a DENSITY_BINS x DENSITY_BINS grid
+DENSITY_MIN_POINTS = 5000
+DENSITY_BINS = 120
+
+
+def _density_mesh(ax, x, y, values, statistic='mean', extent=None, bins=DENSITY_BINS, **kwargs):
+    """
+    Draw ``values`` aggregated over a 2-D grid of (x, y) with ``pcolormesh``.
+    
+    Each bin is colored by the mean of the values of its points
+    (``statistic='mean'``) or by their most frequent integer value
+    (``statistic='mode'``, for categories such as stages); empty bins stay
+    transparent. The aggregation is a single NumPy histogram pass, so the
+    drawn mesh has the same size for any number of points. ``extent`` is
+    ((xmin, xmax), (ymin, ymax)); points outside it are ignored. Extra
+    keyword arguments go to ``pcolormesh``.
+    """
+    x, y, values = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(values)
+    if extent is None:
+        extent = [(v.min(), v.max()) if v.max() > v.min() else (v.min() - 0.5, v.max() + 0.5)
+                  for v in (x, y)]
+    if statistic == 'mean':
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=extent)
+        sums, _, _ = np.histogram2d(x, y, bins=bins, range=extent, weights=values)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            grid = sums / counts
+    elif statistic == 'mode':
+        codes = values.astype(np.int64)
+        low, high = int(codes.min()), int(codes.max())
+        counts, (x_edges, y_edges, _) = np.histogramdd(
+            (x, y, codes), bins=(bins, bins, high - low + 1),
+            range=(*extent, (low - 0.5, high + 0.5)))
+        grid = np.where(counts.sum(axis=2) > 0, counts.argmax(axis=2) + low, np.nan)
+    else:
+        raise ValueError(f"Unknown density statistic: {statistic!r}")
+    return ax.pcolormesh(x_edges, y_edges, np.ma.masked_invalid(grid.T), **kwargs)
+
+
+def print_banner():
+    """Print the system banner (formerly printed when the module was imported)."""
+    print("="*80)
+    print("XENOPOULOS GENETIC-HISTORICAL LOGIC SYSTEM v2.0")
+    print("Enhanced with Paradoxical Transcendence Detection")
+    print("="*80)
+
+
+# ============================================================================
+# RANDOM STREAMS
+# ============================================================================
+
+def _as_seed_sequence(seed):
+    """Coerce None, an int or a SeedSequence into a SeedSequence."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def member_seed_sequence(seed, index):
+    """
+    SeedSequence of ensemble member ``index`` under the root ``seed``.
+    
+    Identical to ``np.random.SeedSequence(seed).spawn(n)[index]`` for any
+    n > index, but computed independently, so any worker can rebuild the
+    stream of any member without spawning the others.
+    """
+    root = _as_seed_sequence(seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=tuple(root.spawn_key) + (int(index),),
+                                  pool_size=root.pool_size)
+
+
+def spawn_seed_sequences(seed, n, offset=0):
+    """SeedSequences of members ``offset`` .. ``offset + n - 1`` under the root ``seed``."""
+    root = _as_seed_sequence(seed)
+    return [member_seed_sequence(root, offset + i) for i in range(n)]
+
+
+# Spawn-key component reserved for the scoring stream of a system (the last
+# 32-bit key, far beyond any ensemble member index)
+SCORING_STREAM_KEY = 2 ** 32 - 1
+
+
+def scoring_seed_sequence(seed):
+    """
+    SeedSequence of the scoring stream paired with the dynamics stream ``seed``.
+    
+    The XEPTQLRI stochastic factor draws from this stream, so the scoring
+    noise never shares draws with the state dynamics. The reserved spawn
+    key keeps it disjoint from the member streams spawned under ``seed``.
+    """
+    return member_seed_sequence(seed, SCORING_STREAM_KEY)
+
+
+# ============================================================================
+# STOCHASTIC NOISE TAPE
+# ============================================================================
+
+# Every step of the dialectical process consumes one row of a "noise tape":
+# one uniform draw (preservation factor of ¬ᴰ) and five standard normals.
+# Rows are drawn in fixed-size blocks so that the scalar system and the
+# vectorized ensemble consume identical random sequences. The uniform and the
+# first four normals come from the dynamics stream; the XEPTQLRI normal comes
+# from the separate scoring stream (see ``scoring_seed_sequence``).
+NOISE_BLOCK_STEPS = 128
+NOISE_NORMALS = 5
+Z_PARADOX_FEEDBACK = 0
+Z_NEGATION = 1
+Z_CONJUNCTION = 2
+Z_SYSTEMIC = 3
+Z_XEPTQLRI = 4  # last column: the only one drawn from the scoring stream
+
+# Phase parameters of the exogenous historical process
+PHASE_BOUNDARY_FRACTIONS = (0.2, 0.4, 0.6, 0.75, 0.85, 0.95, 1.0)
+PHASE_PARAMS = {
+    0: {"pressure": 0.02, "volatility": 0.01},
+    1: {"pressure": 0.05, "volatility": 0.03},
+    2: {"pressure": 0.10, "volatility": 0.05},
+    3: {"pressure": 0.15, "volatility": 0.08},
+    4: {"pressure": 0.20, "volatility": 0.12},
+    5: {"pressure": 0.25, "volatility": 0.15},
+    6: {"pressure": 0.30, "volatility": 0.20}
+}
+PHASE_TREND = {
+    0: (0.01, 0.05),
+    1: (0.02, 0.08),
+    2: (0.03, 0.12),
+    3: (0.04, 0.18),
+    4: (0.05, 0.25),
+    5: (0.06, 0.35),
+    6: (0.03, 0.10)
+}
+
+
+def _phase_boundaries(horizon):
+    """Step boundaries of the seven historical phases for a given horizon."""
+    return [int(horizon * f) for f in PHASE_BOUNDARY_FRACTIONS[:-1]] + [horizon]
+
+
+# Rolling windows read by the per-step operators
+DEFAULT_WINDOWS = {
+    'negation_memory': 10,        # recent A mean in ¬ᴰ
+    'paradox_feedback': 5,        # recent paradox score mean in ¬ᴰ
+    'paradox_persistence': 10,    # persistence term of the paradox score
+    'permanent_dialectics': 20,   # τ₈ stage variability
+    'extremity_memory': 50        # extremity boost of XEPTQLRI
+}
+
+
+def _resolve_windows(rolling_windows):
+    """Merge user window sizes with DEFAULT_WINDOWS."""
+    windows = dict(DEFAULT_WINDOWS)
+    if rolling_windows:
+        unknown = set(rolling_windows) - set(DEFAULT_WINDOWS)
+        if unknown:
+            raise ValueError(f"Unknown rolling windows: {sorted(unknown)}")
+        windows.update({k: int(v) for k, v in rolling_windows.items()})
+    for name, size in windows.items():
+        if size < 1:
+            raise ValueError(f"Rolling window '{name}' must be at least 1, got {size}")
+    return windows
+
+
+# ============================================================================
+# EXOGENOUS PHASE SCHEDULES
+# ============================================================================
+
+def _runs(values):
+    """Run-length encoding of a 1-D array: (starts, stops, values) of its constant runs."""
+    values = np.asarray(values).ravel()
+    if len(values) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, values
+    starts = np.append(0, np.flatnonzero(values[1:] != values[:-1]) + 1)
+    stops = np.append(starts[1:], len(values))
+    return starts, stops, values[starts]
+
+
+class PhaseSchedule:
+    """
+    Exogenous phase schedule of the historical process.
+    
+    The schedule is a sequence of runs: run ``k`` covers the steps before
+    ``boundaries[k]`` not covered by an earlier run and is in phase
+    ``phases[k]`` (steps past the last boundary stay in the last run). Every
+    phase has a dialectical pressure, a systemic volatility and a sinusoidal
+    trend ``amplitude * sin(step * frequency)``, taken from PHASE_PARAMS and
+    PHASE_TREND unless overridden.
+    
+    ``segment`` compiles a range of steps into per-step arrays in a few
+    vectorized operations, so the simulation loops never look phases up
+    step by step, and the schedule itself stays as small as its run count.
+    """
+    
+    FIELDS = ('pressure', 'volatility', 'amplitude', 'frequency')
+    
+    def __init__(self, boundaries, phases=None, params=None):
+        """
+        Parameters:
+        -----------
+        boundaries : sequence of int
+            Non-decreasing end step (exclusive) of every run
+        phases : sequence of int, optional
+            Phase index (0-6) of every run; defaults to 0, 1, 2, ...
+        params : dict, optional
+            Per-phase overrides, ``{phase: {field: value}}`` with fields
+            from FIELDS
+        """
+        self.boundaries = np.asarray(boundaries, dtype=np.int64).ravel()
+        self.phases = np.asarray(np.arange(len(self.boundaries)) if phases is None else phases,
+                                 dtype=np.int64).ravel()
+        if len(self.boundaries) == 0 or len(self.phases) != len(self.boundaries):
+            raise ValueError(f"Expected one phase per boundary, got {len(self.phases)} phases "
+                             f"and {len(self.boundaries)} boundaries")
+        if self.boundaries[0] < 0 or np.any(np.diff(self.boundaries) < 0):
+            raise ValueError("Phase boundaries must be non-negative and non-decreasing")
+        n_phases = len(PHASE_PARAMS)
+        if self.phases.min() < 0 or self.phases.max() >= n_phases:
+            raise ValueError(f"Phase indices must lie in 0..{n_phases - 1}")
+        self.phases = self.phases.astype(np.int8)
+        
+        # One row per phase: pressure, volatility, amplitude, frequency
+        self.table = np.array([[PHASE_PARAMS[p]['pressure'], PHASE_PARAMS[p]['volatility'],
+                                *PHASE_TREND[p]] for p in range(n_phases)])
+        for phase, overrides in (params or {}).items():
+            phase = int(phase)
+            if not 0 <= phase < n_phases:
+                raise ValueError(f"Phase indices must lie in 0..{n_phases - 1}")
+            unknown = set(overrides) - set(self.FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown phase parameters: {sorted(unknown)}")
+            for field, value in overrides.items():
+                self.table[phase, self.FIELDS.index(field)] = float(value)
+    
+    @classmethod
+    def default(cls, horizon):
+        """The seven historical phases at PHASE_BOUNDARY_FRACTIONS of ``horizon``."""
+        return cls(_phase_boundaries(horizon))
+    
+    @classmethod
+    def from_phases(cls, phases, params=None):
+        """
+        Data-driven schedule from one phase index per step.
+        
+        Consecutive equal phases are collapsed into runs, so e.g. a regime
+        series of a million steps with a few hundred regime changes is
+        stored as a few hundred runs.
+        """
+        phases = np.asarray(phases).ravel()
+        if len(phases) == 0:
+            raise ValueError("A phase series needs at least one step")
+        _, stops, values = _runs(phases)
+        return cls(stops, values, params)
+    
+    @classmethod
+    def from_dict(cls, spec):
+        """Schedule from the mapping written by ``to_dict``."""
+        return cls(spec['boundaries'], spec.get('phases'), spec.get('params'))
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Load a schedule from a file.
+        
+        ``.json`` files hold the ``to_dict`` mapping (boundaries, phases and
+        optional params); ``.npy`` files and text/CSV files hold one phase
+        index per step and are read with ``from_phases``.
+        """
+        if path.endswith('.json'):
+            with open(path, encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        if path.endswith('.npy'):
+            return cls.from_phases(np.load(path, allow_pickle=False))
+        delimiter = ',' if path.endswith('.csv') else None
+        return cls.from_phases(np.loadtxt(path, dtype=np.int64, delimiter=delimiter, ndmin=1))
+    
+    def to_dict(self):
+        """JSON-serializable description of the schedule."""
+        return {
+            'boundaries': self.boundaries.tolist(),
+            'phases': self.phases.tolist(),
+            'params': {str(p): dict(zip(self.FIELDS, row.tolist())) for p, row in enumerate(self.table)}
+        }
+    
+    def save(self, path):
+        """Write the schedule as JSON (readable by ``load``)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+    
+    def segment(self, start, stop):
+        """
+        Compile steps ``start`` .. ``stop - 1`` into per-step arrays.
+        
+        Returns:
+        --------
+        tuple of numpy.ndarray
+            (phase index (int8), pressure, volatility, trend)
+        """
+        steps = np.arange(start, stop)
+        run = np.searchsorted(self.boundaries, steps, side='right')
+        phase = self.phases[np.minimum(run, len(self.boundaries) - 1)]
+        amplitude, frequency = self.table[phase, 2], self.table[phase, 3]
+        return phase, self.table[phase, 0], self.table[phase, 1], amplitude * np.sin(steps * frequency)
+
+
+def _as_phase_schedule(schedule, horizon):
+    """Coerce None, a PhaseSchedule, a ``to_dict`` mapping or a file path into a PhaseSchedule."""
+    if schedule is None:
+        return PhaseSchedule.default(horizon)
+    if isinstance(schedule, PhaseSchedule):
+        return schedule
+    if isinstance(schedule, dict):
+        return PhaseSchedule.from_dict(schedule)
+    if isinstance(schedule, (str, os.PathLike)):
+        return PhaseSchedule.load(os.fspath(schedule))
+    raise TypeError(f"Cannot use {type(schedule).__name__} as a phase schedule")
+
+# ============================================================================
+# ROLLING-WINDOW STATISTICS
+# ============================================================================
+
+class RollingWindow:
+    """
+    Ring buffer of the last ``window`` values with running sums.
+    
+    ``shape=()`` tracks a single system; ``shape=(n,)`` tracks a batch of
+    systems with the same element-wise arithmetic, so both give identical
+    results. Queries are O(1) whatever the window size. Float sums are
+    recomputed from the buffer every RESYNC_EVERY pushes to bound drift.
+    """
+    
+    RESYNC_EVERY = 4096
+    STATE_FIELDS = ('buffer', 'total', 'total_sq', 'count', '_pos', '_pushes')
+    
+    def __init__(self, window, shape=(), squares=False):
+        self.window = int(window)
+        self.shape = tuple(shape)
+        self.squares = squares
+        self.buffer = np.zeros((self.window,) + self.shape)
+        self.clear()
+    
+    def clear(self):
+        """Empty the window."""
+        self.buffer[...] = 0.0
+        self.total = np.zeros(self.shape)[()]
+        self.total_sq = np.zeros(self.shape)[()]
+        self.count = 0
+        self._pos = 0
+        self._pushes = 0
+    
+    def push(self, x):
+        """Append the newest value(s), dropping the oldest once full."""
+        i = self._pos
+        old = self.buffer[i].copy()
+        self.buffer[i] = x
+        self.total = self.total - old + x
+        if self.squares:
+            self.total_sq = self.total_sq - old * old + x * x
+        if self.count < self.window:
+            self.count += 1
+        self._pos = (i + 1) % self.window
+        self._pushes += 1
+        if self._pushes % self.RESYNC_EVERY == 0:
+            self._resync()
+    
+    def _resync(self):
+        total = self.buffer[0].copy()
+        total_sq = total * total
+        for row in self.buffer[1:]:
+            total = total + row
+            total_sq = total_sq + row * row
+        self.total = total
+        if self.squares:
+            self.total_sq = total_sq
+    
+    @property
+    def full(self):
+        return self.count == self.window
+    
+    def mean(self):
+        """Mean of the values currently in the window."""
+        return self.total / self.count
+    
+    def variance(self):
+        """Population variance of the values currently in the window."""
+        m = self.total / self.count
+        return self.total_sq / self.count - m * m
+
+
+class RollingTrend:
+    """
+    Least-squares slope of the last ``window`` values in O(1) per step.
+    
+    Keeps running Σy and Σx·y over the window (x = 0 for the oldest value),
+    so ``slope`` equals ``np.polyfit(range(window), values, 1)[0]`` within
+    floating-point tolerance. Supports ``shape=()`` or a batch ``shape=(n,)``.
+    Rounding errors of Σy feed into Σx·y at every slide, so both sums are
+    recomputed from the buffer every RESYNC_WINDOWS windows.
+    """
+    
+    RESYNC_WINDOWS = 8
+    STATE_FIELDS = ('buffer', 'sum_y', 'sum_xy', 'count', '_pos', '_pushes')
+    
+    def __init__(self, window, shape=()):
+        self.window = int(window)
+        if self.window < 2:
+            raise ValueError(f"Trend window must be at least 2, got {self.window}")
+        self.shape = tuple(shape)
+        self.buffer = np.zeros((self.window,) + self.shape)
+        w = self.window
+        self._x_mean = (w - 1) / 2
+        self._sxx = w * (w * w - 1) / 12
+        self._resync_every = max(self.RESYNC_WINDOWS * w, 64)
+        self.clear()
+    
+    def clear(self):
+        """Empty the window."""
+        self.buffer[...] = 0.0
+        self.sum_y = np.zeros(self.shape)[()]
+        self.sum_xy = np.zeros(self.shape)[()]
+        self.count = 0
+        self._pos = 0
+        self._pushes = 0
+    
+    def push(self, y):
+        """Append the newest value(s), dropping the oldest once full."""
+        i = self._pos
+        if self.count == self.window:
+            old = self.buffer[i].copy()
+            # Every remaining value moves one position towards x = 0
+            self.sum_xy = self.sum_xy - (self.sum_y - old) + (self.window - 1) * y
+            self.sum_y = self.sum_y - old + y
+        else:
+            self.sum_xy = self.sum_xy + self.count * y
+            self.sum_y = self.sum_y + y
+            self.count += 1
+        self.buffer[i] = y
+        self._pos = (i + 1) % self.window
+        self._pushes += 1
+        if self._pushes % self._resync_every == 0:
+            self._resync()
+    
+    def _resync(self):
+        sum_y = np.zeros(self.shape)[()]
+        sum_xy = np.zeros(self.shape)[()]
+        start = self._pos if self.count == self.window else 0
+        for x in range(self.count):
+            y = self.buffer[(start + x) % self.window]
+            sum_y = sum_y + y
+            sum_xy = sum_xy + x * y
+        self.sum_y = sum_y
+        self.sum_xy = sum_xy
+    
+    @property
+    def full(self):
+        return self.count == self.window
+    
+    def slope(self):
+        """Least-squares slope over a full window."""
+        return (self.sum_xy - self._x_mean * self.sum_y) / self._sxx
+
+
+class CategoryWindow:
+    """
+    Ring buffer of the last ``window`` integer codes with per-category counts.
+    
+    Keeps the number of distinct codes and exact integer sums and sums of
+    squares, so distinct counts and variances are O(1) queries. Supports
+    ``shape=()`` or a batch ``shape=(n,)`` like RollingWindow.
+    """
+    
+    STATE_FIELDS = ('buffer', 'counts', 'distinct', 'total', 'total_sq', 'count', '_pos')
+    
+    def __init__(self, window, n_categories, shape=()):
+        self.window = int(window)
+        self.n_categories = int(n_categories)
+        self.shape = tuple(shape)
+        self._rows = (np.arange(self.shape[0]),) if self.shape else ()
+        self.buffer = np.zeros((self.window,) + self.shape, dtype=np.int64)
+        self.counts = np.zeros(self.shape + (self.n_categories,), dtype=np.int64)
+        self.clear()
+    
+    def clear(self):
+        """Empty the window."""
+        self.buffer[...] = 0
+        self.counts[...] = 0
+        self.distinct = np.zeros(self.shape, dtype=np.int64)[()]
+        self.total = np.zeros(self.shape, dtype=np.int64)[()]
+        self.total_sq = np.zeros(self.shape, dtype=np.int64)[()]
+        self.count = 0
+        self._pos = 0
+    
+    def push(self, code):
+        """Append the newest code(s), dropping the oldest once full."""
+        i = self._pos
+        if self.count == self.window:
+            old = self.buffer[i].copy()
+            idx = self._rows + (old,)
+            self.counts[idx] -= 1
+            self.distinct = self.distinct - (self.counts[idx] == 0)
+            self.total = self.total - old
+            self.total_sq = self.total_sq - old * old
+        else:
+            self.count += 1
+        self.buffer[i] = code
+        code = self.buffer[i]
+        idx = self._rows + (code,)
+        self.counts[idx] += 1
+        self.distinct = self.distinct + (self.counts[idx] == 1)
+        self.total = self.total + code
+        self.total_sq = self.total_sq + code * code
+        self._pos = (i + 1) % self.window
+    
+    @property
+    def full(self):
+        return self.count == self.window
+    
+    def variance(self):
+        """Exact population variance of the codes currently in the window."""
+        n = self.count
+        return (n * self.total_sq - self.total * self.total) / (n * n)
+
+
+_WINDOW_COUNTERS = ('count', '_pos', '_pushes')
+
+
+def _window_state(window):
+    """Copy the mutable state of a rolling window as arrays."""
+    return {name: np.array(getattr(window, name)) for name in window.STATE_FIELDS}
+
+
+def _load_window_state(window, state):
+    """Restore the state captured by ``_window_state`` into a window of the same size."""
+    for name in window.STATE_FIELDS:
+        value = np.array(state[name])
+        if value.shape != np.shape(getattr(window, name)):
+            raise ValueError(f"Window state '{name}' has shape {value.shape}, "
+                             f"expected {np.shape(getattr(window, name))}")
+        setattr(window, name, int(value) if name in _WINDOW_COUNTERS else value[()])
+
+
+# ============================================================================
+# HISTORY STORAGE
+# ============================================================================
+
+class HistoryStore:
+    """
+    Preallocated struct-of-arrays storage of the dialectical history.
+    
+    Value columns use a float dtype (float64 by default, float32 to halve
+    memory); stage and phase columns use int8. Capacity grows geometrically
+    when exceeded, and ``column`` returns zero-copy views of the filled part.
+    
+    With a ``retention`` of R steps only the most recent R steps are kept:
+    the columns never grow beyond 2R rows and the retained rows are moved to
+    the front whenever the buffer fills, so memory stays constant and views
+    stay contiguous at O(1) amortized cost per step.
+    
+    ``version`` increases on every modification, so derived results can be
+    cached against it. ``epoch`` increases whenever the contents are
+    replaced rather than appended to (``clear``, ``restore``, ``adopt``),
+    so readers that follow the appended steps can detect a reset.
+    """
+    
+    FLOAT_COLUMNS = ('A', 'anti_A', 'tension', 'XEPTQLRI', 'true_XEPTQLRI', 'paradox_scores',
+                     'raw_XEPTQLRI')
+    INT_COLUMNS = ('stages', 'true_stages', 'phase')
+    COLUMNS = FLOAT_COLUMNS + INT_COLUMNS
+    GROWTH_FACTOR = 2
+    
+    def __init__(self, capacity=200, dtype=np.float64, retention=None):
+        self.dtype = np.dtype(dtype)
+        self.retention = None if retention is None else max(int(retention), 1)
+        self._size = 0
+        self._start = 0
+        self._offset = 0
+        self.version = 0
+        self.epoch = 0
+        capacity = max(int(capacity), 1)
+        if self.retention is not None:
+            capacity = min(capacity, 2 * self.retention)
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity):
+        """Allocate columns of the given capacity, keeping the filled rows."""
+        old = getattr(self, '_columns', None)
+        columns = {}
+        for name in self.COLUMNS:
+            dtype = self.dtype if name in self.FLOAT_COLUMNS else np.int8
+            columns[name] = np.empty(capacity, dtype=dtype)
+            if old is not None:
+                columns[name][:self._size] = old[name][:self._size]
+        self._columns = columns
+        self._column_list = [columns[name] for name in self.COLUMNS]
+        self.capacity = capacity
+        self._adopted = False
+    
+    def _own(self):
+        """Replace adopted (possibly read-only) columns by owned copies before writing in place."""
+        if self._adopted:
+            self._allocate(self.capacity)
+    
+    def _compact(self):
+        """Move the retained rows to the front of the columns."""
+        self._own()
+        start, n = self._start, self._size
+        for col in self._columns.values():
+            col[:n - start] = col[start:n]
+        self._offset += start
+        self._size = n - start
+        self._start = 0
+    
+    def __len__(self):
+        return self._size - self._start
+    
+    @property
+    def first_step(self):
+        """Absolute step index of the oldest retained row."""
+        return self._offset + self._start
+    
+    @property
+    def total_steps(self):
+        """Number of steps ever appended, including those no longer retained."""
+        return self._offset + self._size
+    
+    def steps(self):
+        """Absolute step indices of the retained rows."""
+        return np.arange(self.first_step, self.total_steps)
+    
+    def append(self, A, anti_A, tension, XEPTQLRI, true_XEPTQLRI, stage, true_stage,
+               paradox_score, phase, raw_XEPTQLRI):
+        """Append one historical step; return True if the oldest step was evicted."""
+        if self._size == self.capacity:
+            if self.retention is not None and self.capacity >= 2 * self.retention:
+                self._compact()
+            else:
+                capacity = self.capacity * self.GROWTH_FACTOR
+                if self.retention is not None:
+                    capacity = min(capacity, 2 * self.retention)
+                self._allocate(capacity)
+        n = self._size
+        c = self._columns
+        c['A'][n] = A
+        c['anti_A'][n] = anti_A
+        c['tension'][n] = tension
+        c['XEPTQLRI'][n] = XEPTQLRI
+        c['true_XEPTQLRI'][n] = true_XEPTQLRI
+        c['stages'][n] = stage
+        c['true_stages'][n] = true_stage
+        c['paradox_scores'][n] = paradox_score
+        c['raw_XEPTQLRI'][n] = raw_XEPTQLRI
+        c['phase'][n] = phase
+        self._size = n + 1
+        self.version += 1
+        if self.retention is not None and self._size - self._start > self.retention:
+            self._start += 1
+            return True
+        return False
+    
+    def extend(self, columns):
+        """
+        Append a block of steps given as equal-length arrays for every column.
+        
+        Only for histories without retention (eviction is per step).
+        """
+        if self.retention is not None:
+            raise ValueError("extend is not supported with a retention window")
+        n = len(columns[self.COLUMNS[0]])
+        needed = self._size + n
+        if needed > self.capacity:
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= self.GROWTH_FACTOR
+            self._allocate(capacity)
+        for name in self.COLUMNS:
+            self._columns[name][self._size:needed] = columns[name]
+        self._size = needed
+        self.version += 1
+    
+    def trim(self, keep=0):
+        """
+        Drop all but the most recent ``keep`` rows; step indices are unchanged.
+        
+        Unlike eviction under a retention window this does not notify the
+        report aggregates, which keep describing every appended step.
+        """
+        drop = len(self) - max(int(keep), 0)
+        if drop > 0:
+            self._start += drop
+            self._compact()
+            self.version += 1
+    
+    def row(self, index=-1):
+        """Stored values of one retained step, as a list in COLUMNS order."""
+        i = (self._size if index < 0 else self._start) + index
+        return [col.item(i) for col in self._column_list]
+    
+    def evicted_row(self):
+        """Stored values of the step evicted by the last ``append``."""
+        i = self._start - 1
+        return [col.item(i) for col in self._column_list]
+    
+    def column(self, name):
+        """Zero-copy view of the retained part of a column."""
+        return self._columns[name][self._start:self._size]
+    
+    def restore(self, columns, first_step=0):
+        """Replace the contents with the given retained columns."""
+        n = len(columns[self.COLUMNS[0]])
+        if self.retention is not None and n > self.retention:
+            raise ValueError(f"{n} rows exceed the retention of {self.retention} steps")
+        if n > self.capacity or self._adopted:
+            self._size = 0
+            self._allocate(max(n, self.capacity))
+        for name in self.COLUMNS:
+            self._columns[name][:n] = columns[name]
+        self._size = n
+        self._start = 0
+        self._offset = int(first_step)
+        self.version += 1
+        self.epoch += 1
+    
+    def adopt(self, columns, first_step=0):
+        """
+        Use the given equal-length arrays as the columns, without copying.
+        
+        The arrays may be read-only (e.g. memory-mapped); they are never
+        written to: the first append, ``clear``, ``restore`` or compaction
+        reallocates owned columns.
+        """
+        n = len(columns[self.COLUMNS[0]])
+        if n == 0:
+            self.clear()
+            self._offset = int(first_step)
+            return
+        self._columns = {name: columns[name] for name in self.COLUMNS}
+        self._column_list = [self._columns[name] for name in self.COLUMNS]
+        self.capacity = n
+        self._adopted = True
+        self._size = n
+        self._start = 0
+        self._offset = int(first_step)
+        self.version += 1
+        self.epoch += 1
+    
+    def clear(self):
+        """Forget all recorded steps, keeping the allocated capacity (adopted columns are released)."""
+        self._size = 0
+        self._start = 0
+        self._offset = 0
+        self._own()
+        self.version += 1
+        self.epoch += 1
+    
+    @property
+    def nbytes(self):
+        """Bytes allocated by all columns."""
+        return sum(col.nbytes for col in self._columns.values())
+
+
+# ============================================================================
+# EVENT LOG
+# ============================================================================
+
+PARADOX_EVENT_TYPES = ('SIMULTANEOUS_EXTREMITY', 'FALSE_STABILITY', 'META_PARADOX')
+PARADOX_EVENT_DESCRIPTIONS = (
+    'Both A and ¬A at extreme values simultaneously',
+    'System appears stable but is at extreme values',
+    'Extreme paradox score detected'
+)
+RISK_LEVELS = ('HIGH', 'CRITICAL')
+
+RISK_EVENT_DTYPE = np.dtype([
+    ('step', np.int64),
+    ('XEPTQLRI', np.float64),
+    ('true_XEPTQLRI', np.float64),
+    ('tension', np.float64),
+    ('stage', np.int8),
+    ('risk', np.int8),
+    ('phase', np.int8),
+    ('paradox_score', np.float64)
+])
+
+PARADOX_EVENT_DTYPE = np.dtype([
+    ('step', np.int64),
+    ('type', np.int8),
+    ('A_value', np.float64),
+    ('anti_A_value', np.float64),
+    ('paradox_score', np.float64),
+    ('stage', np.int8)
+])
+
+
+class EventLog:
+    """
+    Append-only columnar event log backed by a structured NumPy array.
+    
+    Categorical fields (event type, risk level, stage, phase) are stored as
+    small integer codes; ``labels`` maps such a field to the sequence of its
+    names, and ``derived`` adds dict keys looked up from a coded field (e.g.
+    descriptions stored once per event type). ``records`` is a zero-copy
+    view for vectorized work, while indexing and iteration yield the legacy
+    dict view of each event. Steps are non-decreasing, so old events can be
+    pruned in O(1) amortized time.
+    
+    Parameters:
+    -----------
+    dtype : numpy dtype
+        Structured dtype of one event (must contain a 'step' field)
+    labels : dict, optional
+        Field name -> sequence (or dict) of names indexed by code
+    derived : dict, optional
+        Extra dict key -> (coded field, sequence of values by code)
+    type_field : str, optional
+        Categorical field matched by ``select(types=...)``
+    score_field : str, optional
+        Float field compared by ``select(min_score=...)``
+    """
+    
+    GROWTH_FACTOR = 2
+    
+    def __init__(self, dtype, labels=None, derived=None, type_field=None, score_field=None,
+                 capacity=64):
+        self.dtype = np.dtype(dtype)
+        self.labels = dict(labels or {})
+        self.derived = dict(derived or {})
+        self.type_field = type_field
+        self.score_field = score_field
+        self._fields = self.dtype.names
+        self._decode = [(self._fields.index(field), names) for field, names in self.labels.items()]
+        self._derive = [(key, self._fields.index(field), values)
+                        for key, (field, values) in self.derived.items()]
+        self._data = np.zeros(max(int(capacity), 1), dtype=self.dtype)
+        self._adopted = False
+        self._start = 0
+        self._size = 0
+    
+    def __len__(self):
+        return self._size - self._start
+    
+    def __bool__(self):
+        return self._size > self._start
+    
+    @property
+    def records(self):
+        """Zero-copy structured view of the retained events."""
+        return self._data[self._start:self._size]
+    
+    def _reserve(self, k):
+        """Make room for ``k`` more events, compacting or growing geometrically."""
+        if self._size + k <= len(self._data):
+            return
+        n = self._size - self._start
+        if (not self._adopted and 0 < self._start and self._start >= self._size // 2
+                and n + k <= len(self._data)):
+            self._data[:n] = self._data[self._start:self._size]
+        else:
+            data = np.zeros(max(len(self._data) * self.GROWTH_FACTOR, n + k), dtype=self.dtype)
+            data[:n] = self._data[self._start:self._size]
+            self._data = data
+            self._adopted = False
+        self._start, self._size = 0, n
+    
+    def append(self, *values):
+        """Append one event given its field values in dtype order."""
+        if self._size == len(self._data):
+            self._reserve(1)
+        self._data[self._size] = values
+        self._size += 1
+    
+    def extend(self, records):
+        """Append a structured array of events."""
+        records = np.asarray(records, dtype=self.dtype)
+        self._reserve(len(records))
+        self._data[self._size:self._size + len(records)] = records
+        self._size += len(records)
+    
+    def extend_dicts(self, events):
+        """Append events given in the dict view, encoding labelled fields."""
+        codes = {field: {name: code for code, name in self._label_items(field)}
+                 for field in self.labels}
+        for event in events:
+            self.append(*[codes[f][event[f]] if f in codes else event[f] for f in self._fields])
+    
+    def _label_items(self, field):
+        names = self.labels[field]
+        return names.items() if isinstance(names, dict) else enumerate(names)
+    
+    def adopt(self, records):
+        """Use a structured array of events as the log, without copying (appends reallocate)."""
+        self._data = records
+        self._adopted = True
+        self._start = 0
+        self._size = len(records)
+    
+    def clear(self):
+        """Forget all events, keeping the allocated capacity (adopted records are released)."""
+        if self._adopted:
+            self._data = np.zeros(max(len(self._data), 1), dtype=self.dtype)
+            self._adopted = False
+        self._start = 0
+        self._size = 0
+    
+    def prune_before(self, step):
+        """
+        Drop events before ``step``.
+        
+        Returns the dropped records as a view that stays valid until the
+        next ``append``.
+        """
+        steps = self._data['step']
+        start = i = self._start
+        if i < self._size and steps.item(i) < step:
+            i = start + int(np.searchsorted(steps[start:self._size], step))
+        self._start = i
+        return self._data[start:i]
+    
+    def code(self, field, name):
+        """Integer code of a label name of ``field``."""
+        for code, label in self._label_items(field):
+            if label == name:
+                return code
+        raise KeyError(f"Unknown {field} label: {name!r}")
+    
+    def mask(self, types=None, step_range=None, min_score=None):
+        """
+        Vectorized boolean mask over ``records``.
+        
+        Parameters:
+        -----------
+        types : str, int or iterable of them, optional
+            Keep only these values of ``type_field`` (names or codes)
+        step_range : (start, stop), optional
+            Keep only steps with start <= step < stop (None leaves a side open)
+        min_score : float, optional
+            Keep only events with ``score_field`` >= min_score
+        """
+        records = self.records
+        keep = np.ones(len(records), dtype=bool)
+        if types is not None:
+            if isinstance(types, (str, int, np.integer)):
+                types = [types]
+            codes = [self.code(self.type_field, t) if isinstance(t, str) else int(t) for t in types]
+            keep &= np.isin(records[self.type_field], codes)
+        if step_range is not None:
+            start, stop = step_range
+            if start is not None:
+                keep &= records['step'] >= start
+            if stop is not None:
+                keep &= records['step'] < stop
+        if min_score is not None:
+            keep &= records[self.score_field] >= min_score
+        return keep
+    
+    def select(self, types=None, step_range=None, min_score=None):
+        """Structured array of the events matching ``mask`` (see there)."""
+        return self.records[self.mask(types, step_range, min_score)]
+    
+    def counts(self, field=None):
+        """Event counts per code of a categorical field (``type_field`` by default)."""
+        field = field or self.type_field
+        return np.bincount(self.records[field], minlength=len(self.labels.get(field, ())))
+    
+    def as_dict(self, record):
+        """Dict view of one record, with labelled fields decoded."""
+        raw = record.item()
+        event = dict(zip(self._fields, raw))
+        for index, names in self._decode:
+            event[self._fields[index]] = names[raw[index]]
+        for key, index, values in self._derive:
+            event[key] = values[raw[index]]
+        return event
+    
+    def since(self, step):
+        """Dict views of the events at or after ``step``, scanning back from the end."""
+        steps = self._data['step']
+        i = self._size
+        while i > self._start and steps.item(i - 1) >= step:
+            i -= 1
+        return self.to_dicts(self._data[i:self._size])
+    
+    def to_dicts(self, records=None):
+        """Dict views of ``records`` (all retained events by default)."""
+        records = self.records if records is None else records
+        return [self.as_dict(record) for record in records]
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_dicts(self.records[index])
+        return self.as_dict(self.records[index])
+    
+    def __iter__(self):
+        return iter(self.to_dicts())
+    
+    @property
+    def nbytes(self):
+        """Bytes allocated for the records."""
+        return self._data.nbytes
+
+
+# ============================================================================
+# REPORT AGGREGATES
+# ============================================================================
+
+class ReportAggregates:
+    """
+    Running counters and moments behind ``enhanced_analysis_report``.
+    
+    Every recorded step is added, and every step leaving a retention window
+    removed, so the report costs O(1) whatever the history length. The
+    XEPTQLRI mean and variance use Welford's update (reversible on removal);
+    maxima and minima use monotonic deques of (step, value), which stay
+    exact under eviction. Rows are taken from the HistoryStore, so the
+    aggregates see exactly the stored (possibly float32) values. Under
+    eviction the float moments are recomputed from the retained rows once
+    per max(n, RESYNC_MIN) removals to bound drift (O(1) amortized).
+    """
+    
+    RISK_EDGES = (0.5, 1.0, 2.0)
+    EXTREME_THRESHOLD = 0.8
+    PARADOX_THRESHOLD = 0.7
+    RESYNC_MIN = 1024
+    EXTREMA = ('max_XEPTQLRI', 'min_XEPTQLRI', 'max_tension', 'max_paradox_score')
+    SCALAR_FIELDS = ('n', 'first_step', 'mean_XEPTQLRI', 'm2_XEPTQLRI', 'sum_tension',
+                     'sum_paradox_score', 'extreme_count', 'simultaneous_extreme_count',
+                     'persistent_paradox_count', 'removals_since_resync')
+    COUNT_FIELDS = ('risk_counts', 'stage_counts', 'phase_counts', 'paradox_event_counts')
+    
+    def __init__(self, n_stages, n_phases):
+        self.n_stages = n_stages
+        self.n_phases = n_phases
+        self.clear()
+    
+    def clear(self, first_step=0):
+        """Reset to an empty history starting at ``first_step``."""
+        self.n = 0
+        self.first_step = first_step
+        self.mean_XEPTQLRI = 0.0
+        self.m2_XEPTQLRI = 0.0
+        self.sum_tension = 0.0
+        self.sum_paradox_score = 0.0
+        self.extreme_count = 0
+        self.simultaneous_extreme_count = 0
+        self.persistent_paradox_count = 0
+        self.removals_since_resync = 0
+        self.risk_counts = [0] * (len(self.RISK_EDGES) + 1)
+        self.stage_counts = [0] * self.n_stages
+        self.phase_counts = [0] * self.n_phases
+        self.paradox_event_counts = [0] * len(PARADOX_EVENT_TYPES)
+        self._extrema = {name: deque() for name in self.EXTREMA}
+    
+    def _risk_level(self, XEPTQLRI):
+        e1, e2, e3 = self.RISK_EDGES
+        return (XEPTQLRI >= e1) + (XEPTQLRI >= e2) + (XEPTQLRI >= e3)
+    
+    def _flags(self, A, anti_A):
+        extreme = abs(A) > self.EXTREME_THRESHOLD
+        return extreme, extreme and abs(anti_A) > self.EXTREME_THRESHOLD
+    
+    def add(self, row):
+        """Add one HistoryStore row (see ``HistoryStore.row``)."""
+        A, anti_A, tension, XEPTQLRI, _, paradox_score, _, stage, _, phase = row
+        step = self.first_step + self.n
+        self.n += 1
+        delta = XEPTQLRI - self.mean_XEPTQLRI
+        self.mean_XEPTQLRI += delta / self.n
+        self.m2_XEPTQLRI += delta * (XEPTQLRI - self.mean_XEPTQLRI)
+        self.sum_tension += tension
+        self.sum_paradox_score += paradox_score
+        extreme, simultaneous = self._flags(A, anti_A)
+        self.extreme_count += extreme
+        self.simultaneous_extreme_count += simultaneous
+        self.persistent_paradox_count += paradox_score > self.PARADOX_THRESHOLD
+        self.risk_counts[self._risk_level(XEPTQLRI)] += 1
+        self.stage_counts[stage] += 1
+        self.phase_counts[phase] += 1
+        
+        extrema = self._extrema
+        for name, value in (('max_XEPTQLRI', XEPTQLRI), ('max_tension', tension),
+                            ('max_paradox_score', paradox_score)):
+            dq = extrema[name]
+            while dq and dq[-1][1] <= value:
+                dq.pop()
+            dq.append((step, value))
+        dq = extrema['min_XEPTQLRI']
+        while dq and dq[-1][1] >= XEPTQLRI:
+            dq.pop()
+        dq.append((step, XEPTQLRI))
+    
+    def remove(self, row):
+        """
+        Remove the oldest step, given its HistoryStore row.
+        
+        Returns True when the float moments are due for ``resync``.
+        """
+        A, anti_A, tension, XEPTQLRI, _, paradox_score, _, stage, _, phase = row
+        step = self.first_step
+        self.first_step += 1
+        self.n -= 1
+        if self.n == 0:
+            self.mean_XEPTQLRI = 0.0
+            self.m2_XEPTQLRI = 0.0
+        else:
+            delta = XEPTQLRI - self.mean_XEPTQLRI
+            self.mean_XEPTQLRI -= delta / self.n
+            if self.n == 1:
+                self.m2_XEPTQLRI = 0.0
+            else:
+                self.m2_XEPTQLRI -= delta * (XEPTQLRI - self.mean_XEPTQLRI)
+        self.sum_tension -= tension
+        self.sum_paradox_score -= paradox_score
+        extreme, simultaneous = self._flags(A, anti_A)
+        self.extreme_count -= extreme
+        self.simultaneous_extreme_count -= simultaneous
+        self.persistent_paradox_count -= paradox_score > self.PARADOX_THRESHOLD
+        self.risk_counts[self._risk_level(XEPTQLRI)] -= 1
+        self.stage_counts[stage] -= 1
+        self.phase_counts[phase] -= 1
+        for dq in self._extrema.values():
+            if dq and dq[0][0] == step:
+                dq.popleft()
+        self.removals_since_resync += 1
+        return self.removals_since_resync >= max(self.n, self.RESYNC_MIN)
+    
+    def resync(self, history):
+        """Recompute the float moments from the rows retained in ``history``."""
+        XEPTQLRI = history.column('XEPTQLRI').astype(np.float64)
+        self.mean_XEPTQLRI = float(np.mean(XEPTQLRI))
+        self.m2_XEPTQLRI = float(np.sum((XEPTQLRI - self.mean_XEPTQLRI) ** 2))
+        self.sum_tension = float(np.sum(history.column('tension'), dtype=np.float64))
+        self.sum_paradox_score = float(np.sum(history.column('paradox_scores'), dtype=np.float64))
+        self.removals_since_resync = 0
+    
+    def count_paradox_event(self, type_code, delta=1):
+        """Track paradox events (by PARADOX_EVENT_TYPES code) as they are emitted or pruned."""
+        self.paradox_event_counts[type_code] += delta
+    
+    def extremum(self, name):
+        """Current value of one of EXTREMA."""
+        return self._extrema[name][0][1]
+    
+    def std_XEPTQLRI(self):
+        """Population standard deviation of the retained XEPTQLRI values."""
+        return float(np.sqrt(max(self.m2_XEPTQLRI, 0.0) / self.n))
+    
+    def rebuild(self, history, paradox_events, XEPTQLRI=None, stages=None):
+        """
+        Recompute the aggregates from a history and its paradox EventLog at once.
+        
+        ``XEPTQLRI`` and ``stages`` replace the stored columns of the same
+        name (what-if rescoring). The moments are computed by NumPy
+        reductions, so they may differ from the running ones in the last bits.
+        """
+        self.clear(history.first_step)
+        columns = {name: history.column(name) for name in HistoryStore.COLUMNS}
+        if XEPTQLRI is not None:
+            columns['XEPTQLRI'] = XEPTQLRI
+        if stages is not None:
+            columns['stages'] = stages
+        self.add_block(columns)
+        self.paradox_event_counts = paradox_events.counts().tolist()
+    
+    def add_block(self, columns):
+        """
+        Add a block of consecutive steps given as HistoryStore columns.
+        
+        Equivalent to ``add`` for every row, with the moments merged by
+        Chan's parallel update (equal up to floating-point rounding).
+        """
+        XEPTQLRI = np.asarray(columns['XEPTQLRI'], dtype=np.float64)
+        n = len(XEPTQLRI)
+        if n == 0:
+            return
+        tension = columns['tension']
+        paradox_score = columns['paradox_scores']
+        extreme = np.abs(columns['A']) > self.EXTREME_THRESHOLD
+        
+        mean = float(np.mean(XEPTQLRI))
+        m2 = float(np.sum((XEPTQLRI - mean) ** 2))
+        if self.n == 0:
+            self.mean_XEPTQLRI, self.m2_XEPTQLRI = mean, m2
+        else:
+            total = self.n + n
+            delta = mean - self.mean_XEPTQLRI
+            self.mean_XEPTQLRI += delta * n / total
+            self.m2_XEPTQLRI += m2 + delta * delta * self.n * n / total
+        first = self.first_step + self.n
+        self.n += n
+        self.sum_tension += float(np.sum(tension, dtype=np.float64))
+        self.sum_paradox_score += float(np.sum(paradox_score, dtype=np.float64))
+        self.extreme_count += int(np.count_nonzero(extreme))
+        self.simultaneous_extreme_count += int(np.count_nonzero(
+            extreme & (np.abs(columns['anti_A']) > self.EXTREME_THRESHOLD)))
+        self.persistent_paradox_count += int(np.count_nonzero(paradox_score > self.PARADOX_THRESHOLD))
+        for counts, codes, length in (
+                (self.risk_counts, np.searchsorted(self.RISK_EDGES, XEPTQLRI, side='right'), len(self.risk_counts)),
+                (self.stage_counts, columns['stages'], self.n_stages),
+                (self.phase_counts, columns['phase'], self.n_phases)):
+            for code, count in enumerate(np.bincount(codes, minlength=length).tolist()):
+                counts[code] += count
+        
+        for name, values in (('max_XEPTQLRI', XEPTQLRI), ('min_XEPTQLRI', -XEPTQLRI),
+                             ('max_tension', tension), ('max_paradox_score', paradox_score)):
+            # The monotonic deque keeps the steps strictly above every later value
+            sign = -1 if name.startswith('min') else 1
+            later_max = np.append(np.maximum.accumulate(values[::-1])[::-1][1:], -np.inf)
+            keep = np.flatnonzero(values > later_max)
+            dq = self._extrema[name]
+            block_max = values.max()
+            while dq and sign * dq[-1][1] <= block_max:
+                dq.pop()
+            dq.extend(zip((first + keep).tolist(), (sign * values[keep]).tolist()))
+    
+    def get_state(self):
+        """Copy the aggregates as a dict of arrays."""
+        state = {name: np.array(getattr(self, name)) for name in self.SCALAR_FIELDS + self.COUNT_FIELDS}
+        for name, dq in self._extrema.items():
+            state[name] = np.array(list(dq), dtype=np.float64).reshape(-1, 2)
+        return state
+    
+    def set_state(self, state):
+        """Restore aggregates captured by ``get_state``."""
+        for name in self.SCALAR_FIELDS:
+            setattr(self, name, np.array(state[name]).item())
+        for name in self.COUNT_FIELDS:
+            setattr(self, name, np.array(state[name]).tolist())
+        self._extrema = {name: deque((int(step), value) for step, value in np.asarray(state[name]).tolist())
+                         for name in self.EXTREMA}
+
+
+# ============================================================================
+# VECTORIZED STAGE CLASSIFICATION
+# ============================================================================
+
+def _permanent_dialectics_rule(distinct, total, total_sq, window):
+    """τ₈ test on window statistics, with CategoryWindow's variance expression."""
+    variance = (window * total_sq - total * total) / (window * window)
+    return (distinct >= 4) & (variance > 1.5 ** 2)
+
+
+def _permanent_dialectics_mask(context, window, offset):
+    """τ₈ condition for every position of ``context[offset:]`` via cumulative sums."""
+    idx = np.arange(offset, len(context))
+    lo = np.maximum(idx - window, 0)
+    
+    def window_sum(values):
+        csum = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+        return csum[idx] - csum[lo]
+    
+    distinct = np.zeros(len(idx), dtype=np.int64)
+    for code in range(10):
+        distinct += window_sum(context == code) > 0
+    return _permanent_dialectics_rule(distinct, window_sum(context),
+                                      window_sum(context.astype(np.int64) ** 2), window)
+
+
+def _permanent_dialectics_at(context, positions, window, chunk=65536):
+    """τ₈ condition at selected positions of ``context`` (all >= window) by gathering windows."""
+    result = np.empty(len(positions), dtype=bool)
+    for lo in range(0, len(positions), chunk):
+        windows = context[positions[lo:lo + chunk, None] - window + np.arange(window)]
+        distinct = (windows[:, :, None] == np.arange(10)).any(axis=1).sum(axis=1)
+        result[lo:lo + chunk] = _permanent_dialectics_rule(
+            distinct, windows.sum(axis=1), (windows * windows).sum(axis=1), window)
+    return result
+
+
+def classify_stages(tension, state, anti_state, paradox_score, aufhebung_threshold=0.85,
+                    window=DEFAULT_WINDOWS['permanent_dialectics'], first_step=0, prior_stages=None):
+    """
+    Classify a whole trajectory at once; array version of the step-wise classifier.
+    
+    The result equals what ``_enhanced_stage_classification`` returns step
+    by step for the same inputs. The history-dependent τ₈ rule depends on
+    the preceding stages, so it is resolved by fixed-point iteration: a
+    first pass evaluates it everywhere with rolling distinct counts and
+    variances from cumulative sums, then each further pass re-evaluates
+    only the steps whose window contains a stage changed by the previous
+    pass, until nothing changes.
+    
+    Parameters:
+    -----------
+    tension, state, anti_state, paradox_score : array_like
+        Per-step tension, A, ¬ᴰA and paradox score
+    aufhebung_threshold : float
+        Critical tension threshold separating τ₄ from τ₅
+    window : int
+        Window of the τ₈ (Permanent Dialectics) rule
+    first_step : int
+        Absolute step index of the first element
+    prior_stages : array_like, optional
+        Stages of the steps preceding ``first_step`` (at least
+        ``min(window, first_step)`` of them); required when first_step > 0
+    
+    Returns:
+    --------
+    numpy.ndarray
+        int8 stage codes
+    """
+    tension = np.asarray(tension, dtype=np.float64)
+    abs_A = np.abs(np.asarray(state, dtype=np.float64))
+    abs_anti = np.abs(np.asarray(anti_state, dtype=np.float64))
+    paradox_score = np.asarray(paradox_score, dtype=np.float64)
+    n = len(tension)
+    
+    prior = np.asarray(prior_stages if prior_stages is not None else [], dtype=np.int64)
+    if len(prior) < min(window, first_step):
+        raise ValueError(f"Classifying from step {first_step} needs the "
+                         f"{min(window, first_step)} preceding stages")
+    prior = prior[len(prior) - min(len(prior), window):]
+    
+    stage = np.select(
+        [tension < 0.15, tension < 0.35, tension < 0.55, tension < 0.75, tension < aufhebung_threshold],
+        [0, 1, 2, 3, 4], default=5
+    )
+    stage = np.where((paradox_score > 0.8) & (tension > 0.6), 9, stage)
+    
+    # τ₆/τ₇ take precedence over τ₈; τ₈ needs more than ``window`` recorded steps
+    overriding = np.full(n, -1)
+    overriding = np.where((tension < 0.3) & ((abs_A > 0.7) | (abs_anti > 0.7)), 7, overriding)
+    overriding = np.where((abs_A > 0.8) & (abs_anti > 0.8) & (tension < 0.4), 6, overriding)
+    base = np.where(overriding >= 0, overriding, stage)
+    eligible = (overriding < 0) & (first_step + np.arange(n) > window)
+    
+    offset = len(prior)
+    context = np.concatenate((prior, base)).astype(np.int64)
+    stages = context[offset:]
+    permanent = eligible & _permanent_dialectics_mask(context, window, offset)
+    changed = np.flatnonzero(permanent)
+    stages[changed] = 8
+    while len(changed) > 0:
+        # Steps whose τ₈ window contains a changed stage
+        affected = np.zeros(n + window + 1, dtype=np.int64)
+        np.add.at(affected, changed + 1, 1)
+        np.add.at(affected, changed + window + 1, -1)
+        dirty = np.flatnonzero((np.cumsum(affected[:n]) > 0) & eligible)
+        if len(dirty) == 0:
+            break
+        updated = np.where(_permanent_dialectics_at(context, offset + dirty, window), 8, base[dirty])
+        flipped = updated != stages[dirty]
+        changed = dirty[flipped]
+        stages[changed] = updated[flipped]
+    
+    return stages.astype(np.int8)
+
+
+# ============================================================================
+# XEPTQLRI SCALING
+# ============================================================================
+
+XEPTQLRI_CAP = 3.0
+
+
+def scale_XEPTQLRI(raw_XEPTQLRI, aufhebung_threshold):
+    """
+    XEPTQLRI from its threshold-free (raw) value.
+    
+    The Aufhebung threshold enters the index only through this final
+    scaling, so a stored raw trajectory can be rescored for any threshold.
+    Broadcasts, e.g. raw values of shape (T,) against thresholds of shape
+    (K, 1) give a (K, T) array.
+    """
+    return np.clip(raw_XEPTQLRI / aufhebung_threshold, 0, XEPTQLRI_CAP)
+
+
+# ============================================================================
+# ACCELERATED STEP KERNEL
+# ============================================================================
+
+# Terms of the continued fraction in _tanh (ample for |x| <= 1.2, the range
+# of the state means it is applied to)
+TANH_TERMS = 12
+
+# Horizons from which backend='auto' uses the compiled kernel (below it the
+# one-off compilation costs more than it saves)
+JIT_MIN_STEPS = 10_000
+
+# Steps per kernel call: bounds the temporary noise and output buffers
+KERNEL_CHUNK_STEPS = 64 * NOISE_BLOCK_STEPS
+
+# Default chunk size of simulate_chunks
+STREAM_CHUNK_STEPS = 1 << 20
+
+# Trailing steps simulate_chunks keeps between chunks: the lookback of the
+# report's true-state analysis (at least the τ₈ and trend windows are kept too)
+STREAM_CONTEXT_STEPS = 100
+
+# Rolling windows packed into the kernel's float-window arrays, in order
+KERNEL_FLOAT_WINDOWS = ('_roll_A', '_roll_paradox', '_roll_abs_A', '_roll_abs_anti_A', '_roll_extreme_A')
+
+# Bits of the per-step event flags returned by the kernel
+FLAG_RISK = 1
+FLAG_PARADOX_SHIFT = 1  # paradox event type code c is flagged by bit c + 1
+
+
+def _tanh(x):
+    """
+    Hyperbolic tangent by Lambert's continued fraction.
+    
+    Uses only IEEE-754 +, * and /, so scalars, NumPy arrays and the compiled
+    kernel give bitwise identical results (library tanh implementations
+    differ in the last bits).
+    """
+    x2 = x * x
+    d = 2.0 * TANH_TERMS + 1.0
+    for k in range(TANH_TERMS - 1, -1, -1):
+        d = (2 * k + 1) + x2 / d
+    return x / d
+
+
+def _step_kernel(A, step0, total0, u, z, pressure, phase_volatility, exogenous_trend,
+                 aufhebung_threshold, volatility, trend_window,
+                 rw_buf, rw_size, rw_total, rw_int, rw_resync_every,
+                 cat_buf, cat_counts, cat_int,
+                 tr_buf, tr_sums, tr_int, tr_x_mean, tr_sxx, tr_resync_every,
+                 out_A, out_anti_A, out_tension, out_paradox, out_raw, out_XEPTQLRI,
+                 out_stage, out_flags):
+    """
+    Run ``len(u)`` steps of the dialectical recurrence over flat arrays.
+    
+    Step-for-step the same arithmetic as the operators of
+    XenopoulosGeneticHistoricalSystem (negation, conjunction, paradox score,
+    XEPTQLRI, stage classification, event detection, rolling windows), so
+    it reproduces ``simulate_enhanced_historical_process`` bitwise. Window
+    state arrays are updated in place; returns the final A.
+    Compiled by numba when available (see ``_jit_step_kernel``).
+    """
+    w_A = rw_size[0]
+    w_paradox = rw_size[1]
+    w_abs = rw_size[2]
+    w_extreme = rw_size[4]
+    w_cat = cat_buf.shape[0]
+    w_tr = tr_buf.shape[0]
+    for j in range(u.shape[0]):
+        step = step0 + j
+        total_steps = total0 + j
+        
+        # ¬ᴰ: enhanced dialectical negation
+        preservation_factor = 0.8 + 0.2 * u[j]
+        historical_effect = 0.0
+        if rw_int[0, 0] > 0:
+            x = rw_total[0] / rw_int[0, 0]
+            x2 = x * x
+            d = 2.0 * TANH_TERMS + 1.0
+            for k in range(TANH_TERMS - 1, -1, -1):
+                d = (2 * k + 1) + x2 / d
+            historical_effect = 0.1 * (x / d)
+        paradox_feedback = 0.0
+        if rw_int[1, 0] > 0 and rw_total[1] / rw_int[1, 0] > 0.7:
+            paradox_feedback = 0.05 * z[j, Z_PARADOX_FEEDBACK]
+        enhanced_negation = -A * preservation_factor * (1 + historical_effect + paradox_feedback)
+        anti_A = (enhanced_negation + volatility * 0.1 * z[j, Z_NEGATION]) * (1 + 0.003 * step)
+        
+        # A ∧ᴰ ¬ᴰA: conjunction intensity
+        raw_intensity = abs(A * anti_A)
+        if abs(A) > 0.8 and abs(anti_A) > 0.8:
+            complexity_factor = 1.5 + volatility * z[j, Z_CONJUNCTION]
+        else:
+            complexity_factor = 1 + volatility * z[j, Z_CONJUNCTION]
+        tension = min(max(raw_intensity * complexity_factor, 0.0), 1.0)
+        
+        # State update under the exogenous phase schedule
+        A = A + tension * pressure[j] + exogenous_trend[j] + phase_volatility[j] * z[j, Z_SYSTEMIC]
+        A = min(max(A, -1.2), 1.2)
+        abs_A = abs(A)
+        abs_anti_A = abs(anti_A)
+        
+        recent_trend = 0.0
+        if step > trend_window and tr_int[0] == w_tr:
+            recent_trend = (tr_sums[1] - tr_x_mean * tr_sums[0]) / tr_sxx
+        
+        # Paradox score
+        extremity_score = min(abs_A, abs_anti_A)
+        symmetry_score = 1 - abs(abs_A - abs_anti_A)
+        tension_paradox = 0.5 if (extremity_score > 0.7 and tension < 0.3) else 0.0
+        persistence_score = 0.0
+        if total_steps > w_abs:
+            if rw_total[2] / rw_int[2, 0] > 0.7 and rw_total[3] / rw_int[3, 0] > 0.7:
+                persistence_score = 0.3
+        paradox_score = (extremity_score * 0.4 + symmetry_score * 0.3 +
+                         tension_paradox * 0.2 + persistence_score * 0.1)
+        paradox_score = min(max(paradox_score, 0.0), 1.0)
+        
+        # XEPTQLRI
+        trend_factor = 1.5 if recent_trend > 0.1 else 1.0
+        paradox_factor = 1.0
+        if paradox_score > 0.7:
+            paradox_factor = 1.8 if tension < 0.3 else 2.0
+        extremity_multiplier = 1.5 if (abs_A > 0.8 and abs_anti_A > 0.8) else 1.0
+        raw_XEPTQLRI = tension * trend_factor * paradox_factor * extremity_multiplier
+        raw_XEPTQLRI = raw_XEPTQLRI * (1 + volatility * 0.3 * z[j, Z_XEPTQLRI])
+        if total_steps > w_extreme and rw_total[4] / rw_int[4, 0] > 0.7:
+            raw_XEPTQLRI *= 1.3
+        XEPTQLRI = min(max(raw_XEPTQLRI / aufhebung_threshold, 0.0), XEPTQLRI_CAP)
+        
+        # Stage classification
+        n = cat_int[3]
+        if abs_A > 0.8 and abs_anti_A > 0.8 and tension < 0.4:
+            stage = 6
+        elif tension < 0.3 and (abs_A > 0.7 or abs_anti_A > 0.7):
+            stage = 7
+        elif (total_steps > w_cat and cat_int[0] >= 4 and
+              (n * cat_int[2] - cat_int[1] * cat_int[1]) / (n * n) > 1.5 ** 2):
+            stage = 8
+        elif paradox_score > 0.8 and tension > 0.6:
+            stage = 9
+        elif tension < 0.15:
+            stage = 0
+        elif tension < 0.35:
+            stage = 1
+        elif tension < 0.55:
+            stage = 2
+        elif tension < 0.75:
+            stage = 3
+        elif tension < aufhebung_threshold:
+            stage = 4
+        else:
+            stage = 5
+        
+        # Event flags (risk, then paradox event codes of PARADOX_EVENT_TYPES)
+        flags = 0
+        if XEPTQLRI > 0.7:
+            flags |= FLAG_RISK
+        if abs_A > 0.85 and abs_anti_A > 0.85:
+            flags |= 1 << (0 + FLAG_PARADOX_SHIFT)
+        if stage == 7:
+            flags |= 1 << (1 + FLAG_PARADOX_SHIFT)
+        if paradox_score > 0.9:
+            flags |= 1 << (2 + FLAG_PARADOX_SHIFT)
+        
+        out_A[j] = A
+        out_anti_A[j] = anti_A
+        out_tension[j] = tension
+        out_paradox[j] = paradox_score
+        out_raw[j] = raw_XEPTQLRI
+        out_XEPTQLRI[j] = XEPTQLRI
+        out_stage[j] = stage
+        out_flags[j] = flags
+        
+        # RollingTrend.push(tension)
+        i = tr_int[1]
+        if tr_int[0] == w_tr:
+            old = tr_buf[i]
+            tr_sums[1] = tr_sums[1] - (tr_sums[0] - old) + (w_tr - 1) * tension
+            tr_sums[0] = tr_sums[0] - old + tension
+        else:
+            tr_sums[1] = tr_sums[1] + tr_int[0] * tension
+            tr_sums[0] = tr_sums[0] + tension
+            tr_int[0] += 1
+        tr_buf[i] = tension
+        tr_int[1] = (i + 1) % w_tr
+        tr_int[2] += 1
+        if tr_int[2] % tr_resync_every == 0:
+            start = tr_int[1] if tr_int[0] == w_tr else 0
+            sum_y = 0.0
+            sum_xy = 0.0
+            for x in range(tr_int[0]):
+                y = tr_buf[(start + x) % w_tr]
+                sum_y = sum_y + y
+                sum_xy = sum_xy + x * y
+            tr_sums[0] = sum_y
+            tr_sums[1] = sum_xy
+        
+        # RollingWindow.push for each of KERNEL_FLOAT_WINDOWS
+        for k in range(5):
+            if k == 0:
+                value = A
+            elif k == 1:
+                value = paradox_score
+            elif k == 2:
+                value = abs_A
+            elif k == 3:
+                value = abs_anti_A
+            else:
+                value = 1.0 if abs_A > 0.8 else 0.0
+            w = rw_size[k]
+            i = rw_int[k, 1]
+            old = rw_buf[k, i]
+            rw_buf[k, i] = value
+            rw_total[k] = rw_total[k] - old + value
+            if rw_int[k, 0] < w:
+                rw_int[k, 0] += 1
+            rw_int[k, 1] = (i + 1) % w
+            rw_int[k, 2] += 1
+            if rw_int[k, 2] % rw_resync_every == 0:
+                total = rw_buf[k, 0]
+                for r in range(1, w):
+                    total = total + rw_buf[k, r]
+                rw_total[k] = total
+        
+        # CategoryWindow.push(stage); cat_int = (distinct, total, total_sq, count, pos)
+        i = cat_int[4]
+        if cat_int[3] == w_cat:
+            old_code = cat_buf[i]
+            cat_counts[old_code] -= 1
+            if cat_counts[old_code] == 0:
+                cat_int[0] -= 1
+            cat_int[1] -= old_code
+            cat_int[2] -= old_code * old_code
+        else:
+            cat_int[3] += 1
+        cat_buf[i] = stage
+        cat_counts[stage] += 1
+        if cat_counts[stage] == 1:
+            cat_int[0] += 1
+        cat_int[1] += stage
+        cat_int[2] += stage * stage
+        cat_int[4] = (i + 1) % w_cat
+    return A
+
+
+_JIT_KERNEL = None
+
+
+def _jit_step_kernel():
+    """``_step_kernel`` compiled with numba, or None when numba is not installed."""
+    global _JIT_KERNEL
+    if _JIT_KERNEL is None:
+        try:
+            import numba
+        except ImportError:
+            _JIT_KERNEL = False
+        else:
+            _JIT_KERNEL = numba.njit(cache=True, nogil=True)(_step_kernel)
+    return _JIT_KERNEL or None
+
+
+# ============================================================================
+# OPERATOR PROFILING
+# ============================================================================
+
+# Methods timed while profiling is enabled, by profile entry name. The timing
+# wrappers are installed on the instance only while profiling is on, so a
+# system that never enables it runs the plain class methods.
+PROFILED_METHODS = {
+    'step.noise': '_next_step_noise',
+    'step.negation': '_enhanced_dialectical_negation',
+    'step.conjunction': '_dialectical_conjunction_intensity',
+    'step.paradox_score': '_calculate_paradox_score',
+    'step.XEPTQLRI': '_calculate_raw_XEPTQLRI',
+    'step.classification': '_enhanced_stage_classification',
+    'step.paradox_event_detection': '_detect_paradox_events',
+    'step.risk_event_detection': '_detect_risk_event',
+    'step.recording': '_record_step',
+    'simulate': 'simulate_enhanced_historical_process',
+    'observe': 'observe',
+    'rescore': 'rescore',
+    'report': 'enhanced_analysis_report',
+    'report.compute': '_compute_analysis_report',
+    'dashboard': 'create_paradox_detection_dashboard',
+    'render_dashboard': 'render_dashboard',
+    'export': 'export_comprehensive_analysis',
+    'export.individual_visualizations': '_export_individual_visualizations',
+}
+
+
+class OperatorProfile:
+    """
+    Cumulative wall time and call counts of profiled operators and stages.
+    
+    Entries are named like PROFILED_METHODS keys; sub-stages timed with
+    ``laps`` are named ``<stage>.<lap>`` (e.g. ``dashboard.panel_5``).
+    Times are inclusive: a report computed inside an export counts towards
+    both ``report`` and ``export``.
+    """
+    
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+    
+    def add(self, name, seconds, calls=1):
+        """Accumulate ``calls`` calls taking ``seconds`` in total under ``name``."""
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+    
+    def wrap(self, name, func):
+        """``func`` with every call timed under ``name``."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(name, time.perf_counter() - t0)
+        return timed
+    
+    def laps(self, stage):
+        """Lap timer: ``lap(name)`` records the time since the previous lap as ``stage.name``."""
+        last = time.perf_counter()
+        
+        def lap(name):
+            nonlocal last
+            now = time.perf_counter()
+            self.add(f'{stage}.{name}', now - last)
+            last = now
+        return lap
+    
+    def reset(self):
+        """Forget all timings."""
+        self.seconds.clear()
+        self.calls.clear()
+    
+    def to_dict(self):
+        """Timings by entry name, slowest first: calls, seconds and mean microseconds per call."""
+        return {
+            name: {
+                'calls': self.calls[name],
+                'seconds': seconds,
+                'mean_us': seconds / self.calls[name] * 1e6
+            }
+            for name, seconds in sorted(self.seconds.items(), key=lambda item: -item[1])
+        }
+    
+    def summary(self):
+        """The timings as an aligned text table."""
+        lines = [f"{'entry':<36} {'calls':>10} {'seconds':>10} {'mean µs':>10}"]
+        for name, entry in self.to_dict().items():
+            lines.append(f"{name:<36} {entry['calls']:>10} {entry['seconds']:>10.4f} "
+                         f"{entry['mean_us']:>10.2f}")
+        return "\n".join(lines)
+    
+    def save(self, path):
+        """Write ``to_dict`` as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+
+def _no_lap(name):
+    """Lap timer used while profiling is disabled."""
+
+
+# ============================================================================
+# PARALLEL FIGURE RENDERING
+# ============================================================================
+
+# Figures of an export by export key: (file name suffix, rendering method)
+EXPORT_FIGURES = {
+    'dashboard_png': ('_dashboard.png', '_save_dashboard'),
+    'phase_space_png': ('_phase_space.png', '_save_phase_space'),
+    'timeseries_png': ('_timeseries.png', '_save_timeseries'),
+    'stages_png': ('_stages.png', '_save_stage_distribution'),
+}
+INDIVIDUAL_FIGURES = ('phase_space_png', 'timeseries_png', 'stages_png')
+
+# Arrays shared with rendering processes are memory-mapped files, in RAM
+# where the platform has a tmpfs for it
+SHARED_ARRAY_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _share_arrays(arrays, directory):
+    """Write arrays as .npy files in ``directory``; return their paths for ``_attach_arrays``."""
+    paths = {}
+    for i, (key, value) in enumerate(arrays.items()):
+        paths[key] = os.path.join(directory, f'{i}.npy')
+        np.save(paths[key], np.ascontiguousarray(value))
+    return paths
+
+
+def _attach_arrays(paths):
+    """Memory-map the arrays written by ``_share_arrays`` (read-only, zero-copy)."""
+    return {key: np.asarray(np.load(path, mmap_mode='r')) for key, path in paths.items()}
+
+
+def _init_render_worker():
+    """Select the non-interactive Agg backend in a rendering process."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _render_task(task):
+    """Process-pool work unit: render one export figure; return its key and seconds."""
+    key, path, state, paths = task
+    t0 = time.perf_counter()
+    system = XenopoulosGeneticHistoricalSystem._render_view(state, _attach_arrays(paths))
+    system._render_figure(key, path)
+    return key, time.perf_counter() - t0
+
+
+def render_pool(processes=None):
+    """
+    Process pool for rendering export figures.
+    
+    Passing one pool to every ``export_comprehensive_analysis`` call of a
+    batch (e.g. all systems of a parameter sweep) pays the worker start-up
+    and the matplotlib import only once.
+    
+    Parameters:
+    -----------
+    processes : int, optional
+        Worker processes (default: CPU count)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=processes or os.cpu_count() or 1,
+                               initializer=_init_render_worker)
+
+
+# ============================================================================
+# RENDER CACHE
+# ============================================================================
+
+# Part of every render-cache key: bump when a change to the figure or export
+# code changes what is drawn for the same history
+RENDER_CACHE_VERSION = 1
+DEFAULT_RENDER_CACHE_BYTES = 1 << 30
+
+
+class RenderCache:
+    """
+    Size-bounded on-disk store of rendered figures and exported data.
+    
+    Entries are files named ``<key><suffix>``, where the key is a content
+    digest of everything the artifact is drawn from (see
+    ``XenopoulosGeneticHistoricalSystem.content_digest``). Reading an entry
+    refreshes its modification time and storing one evicts the least
+    recently used entries beyond ``max_bytes``. Entries are written under a
+    temporary name and renamed, so processes can share a directory.
+    
+    Parameters:
+    -----------
+    directory : str, optional
+        Store location (default: $XENOPOULOS_RENDER_CACHE, else
+        ~/.cache/xenopoulos/render)
+    max_bytes : int
+        Size bound of the store
+    """
+    
+    def __init__(self, directory=None, max_bytes=DEFAULT_RENDER_CACHE_BYTES):
+        if directory is None:
+            directory = (os.environ.get('XENOPOULOS_RENDER_CACHE')
+                         or os.path.join(os.path.expanduser('~'), '.cache', 'xenopoulos', 'render'))
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        os.makedirs(directory, exist_ok=True)
+    
+    def path(self, key, suffix):
+        """File name of the entry ``key`` (whether stored or not)."""
+        return os.path.join(self.directory, f'{key}{suffix}')
+    
+    def get(self, key, suffix):
+        """Path of a stored entry, marking it as recently used; None if absent."""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+    
+    def copy_to(self, key, suffix, dest):
+        """Copy a stored entry to ``dest``; False if absent."""
+        path = self.get(key, suffix)
+        if path is None:
+            return False
+        try:
+            shutil.copyfile(path, dest)
+        except FileNotFoundError:  # evicted by another process in between
+            return False
+        return True
+    
+    def put(self, key, suffix, write):
+        """Store the file written by ``write(path)`` as an entry; return the entry path."""
+        path = self.path(key, suffix)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict(keep=path)
+        return path
+    
+    def _entries(self):
+        """(mtime, size, path) of every stored entry, least recently used first."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        return sorted(entries)
+    
+    def evict(self, keep=None):
+        """Delete least recently used entries (except ``keep``) until the store fits ``max_bytes``."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+    
+    @property
+    def nbytes(self):
+        """Bytes held by the stored entries."""
+        return sum(size for _, size, _ in self._entries())
+    
+    def __len__(self):
+        return len(self._entries())
+    
+    def clear(self):
+        """Delete every entry."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+_DEFAULT_RENDER_CACHE = None
+
+
+def _as_render_cache(cache):
+    """Resolve a ``cache`` argument: a RenderCache, a directory, True (the default store) or None/False."""
+    global _DEFAULT_RENDER_CACHE
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        if _DEFAULT_RENDER_CACHE is None:
+            _DEFAULT_RENDER_CACHE = RenderCache()
+        return _DEFAULT_RENDER_CACHE
+    if isinstance(cache, RenderCache):
+        return cache
+    return RenderCache(cache)
+
 
-warnings.filterwarnings('ignore')
+# ============================================================================
+# LIVE DASHBOARD
+# ============================================================================
+
+# Steps drawn at full resolution in the scrolling panels of a live dashboard,
+# and buckets of the decimated envelope of the whole history
+LIVE_WINDOW_STEPS = 500
+LIVE_HISTORY_POINTS = 1000
+# Seconds between refreshes of the status text (text is by far the most
+# expensive artist to rasterize)
+LIVE_STATUS_INTERVAL = 0.2
+
+
+class _StreamingEnvelope:
+    """
+    Min/max envelope of a growing series in at most ``points`` buckets.
+    
+    Buckets double in width (merging neighbours) whenever they run out, so
+    memory and drawing cost stay constant however long the series grows.
+    """
+    
+    def __init__(self, points=LIVE_HISTORY_POINTS):
+        self.points = max(int(points) // 2 * 2, 2)
+        self.lo = np.empty(self.points)
+        self.hi = np.empty(self.points)
+        self.clear()
+    
+    def _merge(self):
+        """Merge neighbouring buckets pairwise, doubling the bucket width."""
+        half = self.n // 2
+        self.lo[:half] = np.minimum(self.lo[0:self.n:2], self.lo[1:self.n:2])
+        self.hi[:half] = np.maximum(self.hi[0:self.n:2], self.hi[1:self.n:2])
+        self.n = half
+        self.width *= 2
+    
+    def add(self, values):
+        """Append a block of values."""
+        values = np.asarray(values, dtype=np.float64)
+        i, end = 0, len(values)
+        while i < end:
+            if self._fill or end - i < self.width:
+                # top up the partial last bucket
+                block = values[i:i + self.width - self._fill]
+                self._lo = min(self._lo, block.min())
+                self._hi = max(self._hi, block.max())
+                self._fill += len(block)
+                i += len(block)
+                if self._fill == self.width:
+                    if self.n == self.points:
+                        self._merge()  # the bucket stays partial at the doubled width
+                    else:
+                        self.lo[self.n], self.hi[self.n] = self._lo, self._hi
+                        self.n += 1
+                        self._fill, self._lo, self._hi = 0, np.inf, -np.inf
+                continue
+            k = min((end - i) // self.width, self.points - self.n)
+            if k == 0:
+                self._merge()
+                continue
+            block = values[i:i + k * self.width].reshape(k, self.width)
+            self.lo[self.n:self.n + k] = block.min(axis=1)
+            self.hi[self.n:self.n + k] = block.max(axis=1)
+            self.n += k
+            i += k * self.width
+        self.count += end
+    
+    def clear(self):
+        """Forget the series."""
+        self.width = 1
+        self.n = 0
+        self.count = 0
+        self._fill = 0
+        self._lo = np.inf
+        self._hi = -np.inf
+    
+    def envelope(self):
+        """(centers, lows, highs) of the buckets, including a partial last one."""
+        centers = (np.arange(self.n) + 0.5) * self.width
+        lo, hi = self.lo[:self.n], self.hi[:self.n]
+        if self._fill:
+            centers = np.append(centers, self.n * self.width + self._fill / 2)
+            lo, hi = np.append(lo, self._lo), np.append(hi, self._hi)
+        return centers, lo, hi
+
+
+class LiveDashboard:
+    """
+    In-place updating dashboard of a system fed online.
+    
+    Shows system state, XEPTQLRI, paradox score and stage timeline over a
+    fixed-width window of the latest steps, plus a min/max envelope of the
+    whole XEPTQLRI history decimated to a constant number of points. The
+    axes, threshold lines, legends and the system info box are drawn once
+    into a cached background; ``update`` only moves the data of persistent
+    line artists and blits them over that background, so it sustains tens
+    of updates per second. The panels use fixed limits with the window in
+    "steps before latest" coordinates, which is what keeps them static
+    while the view scrolls. The status text, the costliest artist to draw,
+    is refreshed at most every LIVE_STATUS_INTERVAL seconds.
+    
+    ``update`` reads the steps appended to ``system.history`` since the
+    previous update (by ``observe``, ``simulate_chunks`` or a simulation).
+    Call it at least once per retention window, if the history has one,
+    or the steps evicted in between are missed.
+    
+    Parameters:
+    -----------
+    system : XenopoulosGeneticHistoricalSystem
+        System to monitor
+    window : int
+        Latest steps drawn at full resolution
+    history_points : int
+        Buckets of the whole-history envelope
+    """
+    
+    COLUMNS = ('A', 'anti_A', 'XEPTQLRI', 'paradox_scores', 'stages')
+    
+    def __init__(self, system, window=LIVE_WINDOW_STEPS, history_points=LIVE_HISTORY_POINTS):
+        self.system = system
+        self.window = max(int(window), 1)
+        self._x = np.arange(1 - self.window, 1)
+        self._buffer = np.empty((len(self.COLUMNS), 2 * self.window))
+        self._n = 0
+        self._seen = system.history.first_step
+        self._epoch = system.history.epoch
+        self._envelope = _StreamingEnvelope(history_points)
+        self._times = deque(maxlen=50)
+        self._status_time = -np.inf
+        self._background = None
+        self.updates = 0
+        self._build()
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    @_with_plot_style
+    def _build(self):
+        """Create the figure, its static elements and the persistent animated artists."""
+        system = self.system
+        # A fixed layout: the blitted regions must not move between redraws
+        self.fig = fig = plt.figure(figsize=(16, 10), layout='none')
+        fig.suptitle(f'LIVE PARADOX MONITOR: {system.system_name}  (System ID: {system.system_id})',
+                     fontsize=14, fontweight='bold')
+        gs = fig.add_gridspec(5, 3, hspace=0.75, wspace=0.15, height_ratios=[1.2, 1, 1, 1, 0.8],
+                              left=0.05, right=0.98, top=0.92, bottom=0.06)
+        xlim = (1 - self.window, 0)
+        
+        ax_state = fig.add_subplot(gs[0, :2])
+        line_A, = ax_state.plot([], [], 'b-', linewidth=1.5, label='A (System State)')
+        line_anti, = ax_state.plot([], [], 'r--', linewidth=1.5, alpha=0.8,
+                                   label='¬ᴰA (Dialectical Negation)')
+        ax_state.axhline(y=0.8, color='orange', linestyle=':', alpha=0.5, label='Extreme Threshold (±0.8)')
+        ax_state.axhline(y=-0.8, color='orange', linestyle=':', alpha=0.5)
+        ax_state.set(xlim=xlim, ylim=(-1.25, 1.25), ylabel='Value')
+        ax_state.set_title('System State', fontsize=12, fontweight='bold')
+        ax_state.legend(loc='upper left', fontsize=8, ncol=3)
+        
+        ax_risk = fig.add_subplot(gs[1, :2], sharex=ax_state)
+        line_risk, = ax_risk.plot([], [], 'darkgreen', linewidth=1.5)
+        ax_risk.axhline(y=1.0, color='darkred', linestyle='-', alpha=0.7, label='Critical (1.0)')
+        ax_risk.axhline(y=0.7, color='orange', linestyle='--', alpha=0.7, label='Warning (0.7)')
+        ax_risk.axhline(y=2.0, color='black', linestyle=':', alpha=0.7, label='Extreme (2.0)')
+        ax_risk.set(ylim=(0, 3.1), ylabel='XEPTQLRI')
+        ax_risk.set_title('Enhanced XEPTQLRI', fontsize=12, fontweight='bold')
+        ax_risk.legend(loc='upper left', fontsize=8, ncol=3)
+        
+        ax_paradox = fig.add_subplot(gs[2, :2], sharex=ax_state)
+        line_paradox, = ax_paradox.plot([], [], 'purple', linewidth=1.5)
+        ax_paradox.axhline(y=0.7, color='red', linestyle='--', alpha=0.7, label='Paradox Threshold (0.7)')
+        ax_paradox.set(ylim=(0, 1.1), ylabel='Paradox Score')
+        ax_paradox.set_title('Paradox Score', fontsize=12, fontweight='bold')
+        ax_paradox.legend(loc='upper left', fontsize=8)
+        
+        ax_stage = fig.add_subplot(gs[3, :2], sharex=ax_state)
+        line_stage, = ax_stage.plot([], [], 'k-', linewidth=1.5, drawstyle='steps-post')
+        ax_stage.set(ylim=(-0.5, len(system.stages) - 0.5), ylabel='Stage',
+                     xlabel=f'Steps before latest (window of {self.window})')
+        ax_stage.set_yticks(range(len(system.stages)))
+        ax_stage.set_yticklabels([f'τ{i}' for i in range(len(system.stages))], fontsize=8)
+        ax_stage.set_title('Stage Timeline', fontsize=12, fontweight='bold')
+        
+        ax_history = fig.add_subplot(gs[4, :2])
+        line_hi, = ax_history.plot([], [], 'darkgreen', linewidth=1, label='Max')
+        line_lo, = ax_history.plot([], [], 'lightgreen', linewidth=1, label='Min')
+        window_start = ax_history.axvline(x=0, color='gray', linestyle='--', alpha=0.7,
+                                          label='Live window')
+        ax_history.set(xlim=(0, 1), ylim=(0, 3.1), xlabel='Fraction of elapsed steps',
+                       ylabel='XEPTQLRI')
+        ax_history.set_title('Whole-History XEPTQLRI Envelope', fontsize=12, fontweight='bold')
+        ax_history.legend(loc='upper left', fontsize=8, ncol=3)
+        
+        ax_text = fig.add_subplot(gs[:, 2])
+        ax_text.axis('off')
+        ax_text.text(0.02, 0.98,
+                     f"SYSTEM\n"
+                     f"• Name: {system.system_name}\n"
+                     f"• ID: {system.system_id}\n"
+                     f"• Aufhebung Threshold: {system.aufhebung_threshold:.2f}\n"
+                     f"• Volatility: {system.volatility:.2f}\n"
+                     f"• Retention: {system.history.retention or 'unbounded'}\n"
+                     f"• Live Window: {self.window} steps",
+                     fontsize=9, family='monospace', verticalalignment='top',
+                     transform=ax_text.transAxes,
+                     bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
+        status = ax_text.text(0.02, 0.62, '', fontsize=9, family='monospace',
+                              verticalalignment='top', transform=ax_text.transAxes)
+        
+        self._lines = (line_A, line_anti, line_risk, line_paradox, line_stage)
+        self._line_hi, self._line_lo, self._window_start = line_hi, line_lo, window_start
+        self._status = status
+        self.axes = (ax_state, ax_risk, ax_paradox, ax_stage, ax_history)
+        # Blitted regions: (axes, its animated artists); the status text last
+        self._regions = [(ax_state, (line_A, line_anti)), (ax_risk, (line_risk,)),
+                         (ax_paradox, (line_paradox,)), (ax_stage, (line_stage,)),
+                         (ax_history, (line_hi, line_lo, window_start)), (ax_text, (status,))]
+        for _, artists in self._regions:
+            for artist in artists:
+                artist.set_animated(True)
+    
+    def _on_draw(self, event):
+        """Capture the static background of every region after a full redraw and redraw the artists on it."""
+        canvas = self.fig.canvas
+        if canvas.is_saving():
+            # drawn at the savefig resolution: recapture on the next update
+            self._background = None
+            return
+        # padded so that antialiased pixels at the axes edges are restored too
+        self._bboxes = [ax.bbox.padded(2) for ax, _ in self._regions]
+        self._background = [canvas.copy_from_bbox(bbox) for bbox in self._bboxes]
+        for _, artists in self._regions:
+            for artist in artists:
+                self.fig.draw_artist(artist)
+    
+    def _push(self, block):
+        """Append columns of new steps to the window buffer."""
+        k = block.shape[1]
+        if k >= self.window:
+            self._buffer[:, :self.window] = block[:, -self.window:]
+            self._n = self.window
+            return
+        if self._n + k > self._buffer.shape[1]:
+            keep = min(self._n, self.window)
+            self._buffer[:, :keep] = self._buffer[:, self._n - keep:self._n]
+            self._n = keep
+        self._buffer[:, self._n:self._n + k] = block
+        self._n += k
+    
+    def _pull(self):
+        """Move the steps appended to the history since the last update into the view; return their count."""
+        history = self.system.history
+        if history.epoch != self._epoch:  # history was reset or replaced
+            self._n = 0
+            self._seen = history.first_step
+            self._epoch = history.epoch
+            self._envelope.clear()
+        k = min(history.total_steps - self._seen, len(history))
+        self._seen = history.total_steps
+        if k <= 0:
+            return 0
+        start = len(history) - k
+        block = np.stack([history.column(name)[start:] for name in self.COLUMNS]).astype(np.float64)
+        self._push(block)
+        self._envelope.add(block[2])
+        return k
+    
+    def _set_data(self):
+        """Point the persistent artists at the current window and envelope."""
+        n = min(self._n, self.window)
+        view = self._buffer[:, self._n - n:self._n]
+        x = self._x[self.window - n:]
+        for line, values in zip(self._lines, view):
+            line.set_data(x, values)
+        
+        centers, lo, hi = self._envelope.envelope()
+        count = max(self._envelope.count, 1)
+        self._line_hi.set_data(centers / count, hi)
+        self._line_lo.set_data(centers / count, lo)
+        edge = max(count - self.window, 0) / count
+        self._window_start.set_xdata([edge, edge])
+    
+    def _set_status(self, now):
+        """Refresh the status text with the latest step."""
+        system = self.system
+        rate = (len(self._times) - 1) / (now - self._times[0]) if len(self._times) > 1 else 0.0
+        if self._n:
+            A, _, XEPTQLRI, paradox, stage = self._buffer[:, self._n - 1]
+            phase = system.history.column('phase')[-1] if len(system.history) else 0
+            self._status.set_text(
+                f"LIVE STATUS\n"
+                f"• Step: {self._seen - 1}\n"
+                f"• Stage: {system.stages[int(stage)]}\n"
+                f"• Phase: {system.phases[int(phase)]}\n"
+                f"• A: {A:+.3f}\n"
+                f"• XEPTQLRI: {XEPTQLRI:.3f}\n"
+                f"• Paradox Score: {paradox:.3f}\n"
+                f"• Risk Events: {len(system.risk_events)}\n"
+                f"• Paradox Events: {len(system.paradox_events)}\n"
+                f"• Updates: {self.updates} ({rate:.1f}/s)"
+            )
+    
+    @_with_plot_style
+    def update(self):
+        """
+        Draw the steps appended since the previous update.
+        
+        Returns:
+        --------
+        int
+            Number of new steps drawn
+        """
+        k = self._pull()
+        self.updates += 1
+        now = time.perf_counter()
+        self._times.append(now)
+        self._set_data()
+        refresh_status = now - self._status_time >= LIVE_STATUS_INTERVAL
+        if refresh_status:
+            self._set_status(now)
+            self._status_time = now
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+        else:
+            regions = self._regions if refresh_status else self._regions[:-1]
+            for (ax, artists), bbox, background in zip(regions, self._bboxes, self._background):
+                canvas.restore_region(background)
+                for artist in artists:
+                    ax.draw_artist(artist)
+                canvas.blit(bbox)
+        canvas.flush_events()
+        return k
+    
+    def close(self):
+        """Close the figure."""
+        plt.close(self.fig)
+
+
+# ============================================================================
+# SYSTEM CHECKPOINTS
+# ============================================================================
+
+CHECKPOINT_FORMAT = 'xenopoulos-checkpoint'
+CHECKPOINT_VERSION = 1
 
-# Settings for Unicode and display
-matplotlib.rcParams['axes.unicode_minus'] = False
-plt.rcParams['font.family'] = ['DejaVu Sans', 'Liberation Sans', 'Arial']
-plt.rcParams['figure.constrained_layout.use'] = True
-plt.rcParams['figure.dpi'] = 100
-sns.set_style("whitegrid")
+# Rolling windows captured in a checkpoint, by attribute name
+CHECKPOINT_WINDOWS = ('_roll_A', '_roll_paradox', '_roll_abs_A', '_roll_abs_anti_A',
+                      '_roll_stages', '_roll_extreme_A', '_trend')
 
-print("="*80)
-print("XENOPOULOS GENETIC-HISTORICAL LOGIC SYSTEM v2.0")
-print("Enhanced with Paradoxical Transcendence Detection")
-print("="*80)
 
 class XenopoulosGeneticHistoricalSystem:
     """
@@ -48,7 +2420,9 @@ class XenopoulosGeneticHistoricalSystem:
     
     def __init__(self, initial_state_A=0.3, historical_horizon=200, 
                  aufhebung_threshold=0.85, volatility_factor=0.03,
-                 system_name="Default System", seed=None):
+                 system_name="Default System", seed=None, history_dtype=np.float64,
+                 rolling_windows=None, trend_window=10, retention=None, phase_schedule=None,
+                 verbose=True):
         """
         Initialize the Xenopoulos Genetic-Historical Logic System.
         
@@ -64,11 +2438,28 @@ class XenopoulosGeneticHistoricalSystem:
             Stochastic volatility factor of the dialectical process
         system_name : str
             Name identifier for the system
-        seed : int, optional
-            Random seed for reproducibility
+        seed : int or numpy.random.SeedSequence, optional
+            Root of the system's own random stream (the global NumPy
+            random state is never touched)
+        history_dtype : numpy dtype
+            Storage dtype of the history value columns (float64 or float32)
+        rolling_windows : dict, optional
+            Overrides of the operator window sizes in DEFAULT_WINDOWS
+        trend_window : int
+            Number of recent tensions in the historical trend of XEPTQLRI
+        retention : int, optional
+            Keep only the most recent ``retention`` steps of history and
+            events (None keeps everything); bounds memory for live feeds
+        phase_schedule : PhaseSchedule, dict or str, optional
+            Exogenous phase schedule, or a file readable by
+            ``PhaseSchedule.load`` (default: the seven historical phases)
+        verbose : bool
+            Print initialization and simulation progress messages
         """
-        if seed is not None:
-            np.random.seed(seed)
+        self.verbose = verbose
+        self.seed_sequence = _as_seed_sequence(seed)
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self.scoring_rng = np.random.default_rng(scoring_seed_sequence(self.seed_sequence))
         
         self.A = np.clip(initial_state_A, 0, 1)
         self.horizon = historical_horizon
@@ -77,22 +2468,31 @@ class XenopoulosGeneticHistoricalSystem:
         self.system_name = system_name
         self.creation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.system_id = hashlib.md5(f"{system_name}{initial_state_A}{historical_horizon}".encode()).hexdigest()[:8]
+        self.phase_schedule = _as_phase_schedule(phase_schedule, self.horizon)
+        
+        # Historical tracking
+        self.history = HistoryStore(self.horizon, dtype=history_dtype, retention=retention)
+        self._report_cache = None
+        self._report_version = None
+        self._digest_cache = None
+        self._digest_version = None
+        
+        # Rolling-window statistics queried by the operators
+        self.windows = _resolve_windows(rolling_windows)
+        self.trend_window = int(trend_window)
+        self._init_rolling_windows()
+        
+        # Noise tape (drawn lazily, one block at a time)
+        self._noise_u = None
+        self._noise_z = None
+        self._noise_pos = NOISE_BLOCK_STEPS
         
         # Initial dialectical negation ¬ᴰA
         self.anti_A = self._enhanced_dialectical_negation(self.A)
         
-        # Historical tracking
-        self.history_A = []
-        self.history_anti_A = []
-        self.history_tension = []
-        self.history_XEPTQLRI = []
-        self.history_true_XEPTQLRI = []
-        self.history_stages = []
-        self.history_true_stages = []
-        self.history_paradox_scores = []
-        self.risk_events = []
-        self.paradox_events = []
-        self.phase_history = []
+        # Simulation cursor: next step of the historical process and the state A it starts from
+        self._next_step = 0
+        self._current_A = self.A
         
         # Enhanced dialectical stages with paradox detection
         self.stages = {
@@ -119,6 +2519,26 @@ class XenopoulosGeneticHistoricalSystem:
             6: "Meta-Stability Phase"
         }
         
+        # Columnar risk and paradox event logs
+        self.risk_events = EventLog(
+            RISK_EVENT_DTYPE,
+            labels={'stage': self.stages, 'risk': RISK_LEVELS, 'phase': self.phases},
+            type_field='risk', score_field='XEPTQLRI'
+        )
+        self.paradox_events = EventLog(
+            PARADOX_EVENT_DTYPE,
+            labels={'type': PARADOX_EVENT_TYPES, 'stage': self.stages},
+            derived={'description': ('type', PARADOX_EVENT_DESCRIPTIONS)},
+            type_field='type', score_field='paradox_score'
+        )
+        
+        # Running aggregates behind the analysis report
+        self._aggregates = ReportAggregates(len(self.stages), len(self.phases))
+        
+        # Operator timings (see ``enable_profiling``)
+        self.profile = None
+        self._profiling = False
+        
         # System metadata
         self.metadata = {
             'system_id': self.system_id,
@@ -127,56 +2547,188 @@ class XenopoulosGeneticHistoricalSystem:
             'horizon': self.horizon,
             'aufhebung_threshold': self.aufhebung_threshold,
             'volatility': self.volatility,
-            'stage_count': len(self.stages)
+            'stage_count': len(self.stages),
+            'rolling_windows': dict(self.windows),
+            'trend_window': self.trend_window,
+            'retention': self.history.retention,
+            'phase_schedule': self.phase_schedule.to_dict(),
+            'seed_entropy': self.seed_sequence.entropy,
+            'seed_spawn_key': list(self.seed_sequence.spawn_key)
         }
         
-        print(f"⚡ ENHANCED XENOPOULOS SYSTEM INITIALIZED")
-        print(f"   System ID: {self.system_id}")
-        print(f"   Name: {self.system_name}")
-        print(f"   Initial State (A): {self.A:.3f}")
-        print(f"   Dialectical Negation (¬ᴰA): {self.anti_A:.3f}")
-        print(f"   Historical Horizon: {self.horizon} steps")
-        print(f"   Aufhebung Threshold: {self.aufhebung_threshold}")
-        print(f"   Enhanced Stages: {len(self.stages)} stages")
+        if self.verbose:
+            print(f"⚡ ENHANCED XENOPOULOS SYSTEM INITIALIZED")
+            print(f"   System ID: {self.system_id}")
+            print(f"   Name: {self.system_name}")
+            print(f"   Initial State (A): {self.A:.3f}")
+            print(f"   Dialectical Negation (¬ᴰA): {self.anti_A:.3f}")
+            print(f"   Historical Horizon: {self.horizon} steps")
+            print(f"   Aufhebung Threshold: {self.aufhebung_threshold}")
+            print(f"   Enhanced Stages: {len(self.stages)} stages")
+    
+    # ============================================================================
+    # HISTORY COLUMNS
+    # ============================================================================
+    
+    @property
+    def history_A(self):
+        return self.history.column('A')
+    
+    @property
+    def history_anti_A(self):
+        return self.history.column('anti_A')
+    
+    @property
+    def history_tension(self):
+        return self.history.column('tension')
+    
+    @property
+    def history_XEPTQLRI(self):
+        return self.history.column('XEPTQLRI')
+    
+    @property
+    def history_true_XEPTQLRI(self):
+        return self.history.column('true_XEPTQLRI')
+    
+    @property
+    def history_raw_XEPTQLRI(self):
+        return self.history.column('raw_XEPTQLRI')
+    
+    @property
+    def history_stages(self):
+        return self.history.column('stages')
+    
+    @property
+    def history_true_stages(self):
+        return self.history.column('true_stages')
+    
+    @property
+    def history_paradox_scores(self):
+        return self.history.column('paradox_scores')
+    
+    @property
+    def phase_history(self):
+        return self.history.column('phase')
+    
+    # ============================================================================
+    # ROLLING-WINDOW STATISTICS
+    # ============================================================================
+    
+    def _init_rolling_windows(self, shape=()):
+        """Create the rolling windows queried by the per-step operators."""
+        w = self.windows
+        self._roll_A = RollingWindow(w['negation_memory'], shape)
+        self._roll_paradox = RollingWindow(w['paradox_feedback'], shape)
+        self._roll_abs_A = RollingWindow(w['paradox_persistence'], shape)
+        self._roll_abs_anti_A = RollingWindow(w['paradox_persistence'], shape)
+        self._roll_stages = CategoryWindow(w['permanent_dialectics'], 10, shape)
+        self._roll_extreme_A = RollingWindow(w['extremity_memory'], shape)
+        self._trend = RollingTrend(self.trend_window, shape)
+    
+    def _update_rolling_windows(self, current_A, current_anti_A, current_tension, paradox_score, stage_idx):
+        """Advance every rolling window by one recorded step."""
+        abs_A = np.abs(current_A)
+        self._trend.push(current_tension)
+        self._roll_A.push(current_A)
+        self._roll_paradox.push(paradox_score)
+        self._roll_abs_A.push(abs_A)
+        self._roll_abs_anti_A.push(np.abs(current_anti_A))
+        self._roll_stages.push(stage_idx)
+        self._roll_extreme_A.push(abs_A > 0.8)
+    
+    def _record_step(self, current_A, current_anti_A, current_tension, enhanced_XEPTQLRI,
+                     stage_idx, paradox_score, current_phase, raw_XEPTQLRI):
+        """Append one step to the history, the report aggregates and the rolling windows."""
+        evicted = self.history.append(current_A, current_anti_A, current_tension,
+                                      enhanced_XEPTQLRI, enhanced_XEPTQLRI,
+                                      stage_idx, stage_idx, paradox_score, current_phase,
+                                      raw_XEPTQLRI)
+        self._aggregates.add(self.history.row())
+        if evicted and self._aggregates.remove(self.history.evicted_row()):
+            self._aggregates.resync(self.history)
+        self._update_rolling_windows(current_A, current_anti_A, current_tension, paradox_score, stage_idx)
+    
+    # ============================================================================
+    # STOCHASTIC NOISE TAPE
+    # ============================================================================
+    
+    def _draw_noise_block(self):
+        """Draw the next block of the per-step noise tape."""
+        self._noise_u = self.rng.random(NOISE_BLOCK_STEPS)
+        self._noise_z = np.empty((NOISE_BLOCK_STEPS, NOISE_NORMALS))
+        self._noise_z[:, :Z_XEPTQLRI] = self.rng.standard_normal((NOISE_BLOCK_STEPS, Z_XEPTQLRI))
+        self._noise_z[:, Z_XEPTQLRI] = self.scoring_rng.standard_normal(NOISE_BLOCK_STEPS)
+        self._noise_pos = 0
+    
+    def _next_step_noise(self):
+        """
+        Return the noise row (uniform, normals) for the next dialectical step.
+        
+        All operators of one step share a single row, so the random stream is
+        consumed identically whatever branches the operators take.
+        """
+        if self._noise_pos >= NOISE_BLOCK_STEPS:
+            self._draw_noise_block()
+        u = self._noise_u[self._noise_pos]
+        z = self._noise_z[self._noise_pos]
+        self._noise_pos += 1
+        return u, z
+    
+    def _take_noise_rows(self, n):
+        """Consume the next ``n`` rows of the noise tape at once, as (u, z) arrays."""
+        u = np.empty(n)
+        z = np.empty((n, NOISE_NORMALS))
+        filled = 0
+        while filled < n:
+            if self._noise_pos >= NOISE_BLOCK_STEPS:
+                self._draw_noise_block()
+            k = min(NOISE_BLOCK_STEPS - self._noise_pos, n - filled)
+            u[filled:filled + k] = self._noise_u[self._noise_pos:self._noise_pos + k]
+            z[filled:filled + k] = self._noise_z[self._noise_pos:self._noise_pos + k]
+            self._noise_pos += k
+            filled += k
+        return u, z
     
     # ============================================================================
     # CORE DIALECTICAL OPERATORS
     # ============================================================================
     
-    def _enhanced_dialectical_negation(self, state):
+    def _enhanced_dialectical_negation(self, state, noise=None):
         """
         Enhanced ¬ᴰ operator with historical memory and paradox awareness.
         
         According to Xenopoulos: "Not 'not-A' but 'the internal opposition that preserves A'"
         """
-        preservation_factor = 0.8 + 0.2 * np.random.rand()
+        u, z = self._next_step_noise() if noise is None else noise
+        preservation_factor = 0.8 + 0.2 * u
         
         historical_effect = 0.0
-        if len(self.history_A) > 0:
-            recent_mean = np.mean(self.history_A[-10:] if len(self.history_A) >= 10 else self.history_A)
-            historical_effect = 0.1 * np.tanh(recent_mean)
+        if self._roll_A.count > 0:
+            recent_mean = self._roll_A.mean()
+            historical_effect = 0.1 * _tanh(float(recent_mean))
         
         paradox_feedback = 0.0
-        if len(self.history_paradox_scores) > 0 and np.mean(self.history_paradox_scores[-5:]) > 0.7:
-            paradox_feedback = 0.05 * np.random.randn()
+        if self._roll_paradox.count > 0 and self._roll_paradox.mean() > 0.7:
+            paradox_feedback = 0.05 * z[Z_PARADOX_FEEDBACK]
         
         enhanced_negation = -state * preservation_factor * (1 + historical_effect + paradox_feedback)
-        stochastic_component = self.volatility * 0.1 * np.random.randn()
+        stochastic_component = self.volatility * 0.1 * z[Z_NEGATION]
         
         return enhanced_negation + stochastic_component
     
-    def _dialectical_conjunction_intensity(self, state, anti_state):
+    def _dialectical_conjunction_intensity(self, state, anti_state, noise=None):
         """
         Calculate intensity of (A ∧ᴰ ¬ᴰA) with paradox awareness.
         
         According to Xenopoulos: "Creates logically valid contradictions"
         """
+        u, z = self._next_step_noise() if noise is None else noise
         raw_intensity = np.abs(state * anti_state)
         
         if abs(state) > 0.8 and abs(anti_state) > 0.8:
-            complexity_factor = 1.5 + self.volatility * np.random.randn()
+            complexity_factor = 1.5 + self.volatility * z[Z_CONJUNCTION]
         else:
-            complexity_factor = 1 + self.volatility * np.random.randn()
+            complexity_factor = 1 + self.volatility * z[Z_CONJUNCTION]
         
         intensity = np.clip(raw_intensity * complexity_factor, 0, 1)
         return intensity
@@ -194,10 +2746,8 @@ class XenopoulosGeneticHistoricalSystem:
             tension_paradox = 0
         
         persistence_score = 0
-        if len(self.history_A) > 10:
-            recent_states = self.history_A[-10:]
-            recent_anti = self.history_anti_A[-10:]
-            if np.mean([abs(s) for s in recent_states]) > 0.7 and np.mean([abs(a) for a in recent_anti]) > 0.7:
+        if self.history.total_steps > self._roll_abs_A.window:
+            if self._roll_abs_A.mean() > 0.7 and self._roll_abs_anti_A.mean() > 0.7:
                 persistence_score = 0.3
         
         paradox_score = (extremity_score * 0.4 + 
@@ -220,9 +2770,9 @@ class XenopoulosGeneticHistoricalSystem:
             if abs(current_A) > 0.7 or abs(current_anti_A) > 0.7:
                 return 7, self.stages[7]  # τ₇: False Stability
         
-        if len(self.history_stages) > 20:
-            recent_stages = self.history_stages[-20:]
-            if len(set(recent_stages)) >= 4 and np.std(recent_stages) > 1.5:
+        if self.history.total_steps > self._roll_stages.window:
+            recent_stages = self._roll_stages
+            if recent_stages.distinct >= 4 and recent_stages.variance() > 1.5 ** 2:
                 return 8, self.stages[8]  # τ₈: Permanent Dialectics
         
         if paradox_score > 0.8 and tension_score > 0.6:
@@ -242,10 +2792,117 @@ class XenopoulosGeneticHistoricalSystem:
         else:
             return 5, self.stages[5]
     
-    def _calculate_enhanced_XEPTQLRI(self, tension, historical_trend, current_A, current_anti_A, paradox_score):
+    def classify_history_stages(self, aufhebung_threshold=None):
+        """
+        Reclassify the stored history at once with ``classify_stages``.
+        
+        With the system's own threshold this reproduces ``history_stages``
+        (for float64 histories; float32 storage rounds the inputs). If a
+        retention window has dropped the start of the history, the first
+        ``window`` retained steps keep their recorded stages as τ₈ context.
+        
+        Parameters:
+        -----------
+        aufhebung_threshold : float, optional
+            Threshold to classify with (defaults to the system's own)
+        """
+        if aufhebung_threshold is None:
+            aufhebung_threshold = self.aufhebung_threshold
+        window = self._roll_stages.window
+        k = min(window, len(self.history)) if self.history.first_step > 0 else 0
+        recorded = self.history_stages[:k]
+        rest = classify_stages(
+            self.history_tension[k:], self.history_A[k:], self.history_anti_A[k:],
+            self.history_paradox_scores[k:], aufhebung_threshold, window,
+            first_step=self.history.first_step + k, prior_stages=recorded
+        )
+        return np.concatenate((recorded, rest))
+    
+    def rescore(self, thresholds):
+        """
+        What-if rescoring of the stored trajectory for alternative thresholds.
+        
+        The Aufhebung threshold affects neither the state dynamics nor the
+        dynamics random stream, and enters XEPTQLRI only through
+        ``scale_XEPTQLRI`` of the stored raw index, so a single simulation
+        answers for every threshold. XEPTQLRI is rescored for all thresholds
+        at once; stages are reclassified with ``classify_history_stages``.
+        Risk and paradox events are re-detected from the rescored columns
+        (the FALSE_STABILITY type and every event's stage depend on the
+        reclassified stages). For float64 histories the XEPTQLRI values,
+        stages and events equal those of a simulation run with each
+        threshold (report moments up to floating-point rounding). If a
+        retention window has dropped the start of the history, the XEPTQLRI
+        values are still exact but the stages use the recorded τ₈ context
+        (see ``classify_history_stages``).
+        
+        Parameters:
+        -----------
+        thresholds : sequence of float
+            Alternative Aufhebung thresholds
+        
+        Returns:
+        --------
+        dict
+            'thresholds' (K,), 'XEPTQLRI' (K, T) and 'stages' (K, T)
+            arrays, plus per-threshold lists of 'risk_events' and
+            'paradox_events' (EventLog) and 'reports' (as
+            ``enhanced_analysis_report``)
+        """
+        if len(self.history) == 0:
+            raise ValueError("No stored trajectory to rescore")
+        thresholds = np.atleast_1d(np.asarray(thresholds, dtype=np.float64))
+        XEPTQLRI = scale_XEPTQLRI(self.history_raw_XEPTQLRI.astype(np.float64), thresholds[:, None])
+        stages = np.stack([self.classify_history_stages(thr) for thr in thresholds])
+        
+        steps = self.history.steps()
+        columns = {name: self.history.column(name) for name in ('A', 'anti_A', 'paradox_scores')}
+        simultaneous = np.flatnonzero((np.abs(columns['A']) > 0.85) & (np.abs(columns['anti_A']) > 0.85))
+        meta = np.flatnonzero(columns['paradox_scores'] > 0.9)
+        risk_events, paradox_events, reports = [], [], []
+        for k in range(len(thresholds)):
+            hit = np.flatnonzero(XEPTQLRI[k] > 0.7)
+            records = np.empty(len(hit), dtype=RISK_EVENT_DTYPE)
+            records['step'] = steps[hit]
+            records['XEPTQLRI'] = XEPTQLRI[k, hit]
+            records['true_XEPTQLRI'] = XEPTQLRI[k, hit]
+            records['tension'] = self.history_tension[hit]
+            records['stage'] = stages[k, hit]
+            records['risk'] = XEPTQLRI[k, hit] > 1.0
+            records['phase'] = self.phase_history[hit]
+            records['paradox_score'] = self.history_paradox_scores[hit]
+            events = EventLog(RISK_EVENT_DTYPE, labels=self.risk_events.labels,
+                              type_field='risk', score_field='XEPTQLRI')
+            events.extend(records)
+            risk_events.append(events)
+            
+            columns['stages'] = stages[k]
+            events = EventLog(PARADOX_EVENT_DTYPE, labels=self.paradox_events.labels,
+                              derived=self.paradox_events.derived,
+                              type_field='type', score_field='paradox_score')
+            events.extend(self._paradox_event_records(
+                steps, columns, [simultaneous, np.flatnonzero(stages[k] == 7), meta]))
+            paradox_events.append(events)
+            
+            agg = ReportAggregates(len(self.stages), len(self.phases))
+            agg.rebuild(self.history, events, XEPTQLRI[k], stages[k])
+            reports.append(self._compute_analysis_report(agg, XEPTQLRI[k], stages[k]))
+        
+        return {
+            'thresholds': thresholds,
+            'XEPTQLRI': XEPTQLRI,
+            'stages': stages,
+            'risk_events': risk_events,
+            'paradox_events': paradox_events,
+            'reports': reports,
+        }
+    
+    def _calculate_raw_XEPTQLRI(self, tension, historical_trend, current_A, current_anti_A, paradox_score,
+                                noise=None):
         """
-        Enhanced XEPTQLRI calculation with paradox awareness.
+        Threshold-free XEPTQLRI with paradox awareness (see ``scale_XEPTQLRI``).
         """
+        u, z = self._next_step_noise() if noise is None else noise
         trend_factor = 1.0
         if historical_trend > 0.1:
             trend_factor = 1.5
@@ -263,203 +2920,486 @@ class XenopoulosGeneticHistoricalSystem:
         if abs(current_A) > 0.8 and abs(current_anti_A) > 0.8:
             extremity_multiplier = 1.5
         
-        enhanced_XEPTQLRI = (tension * trend_factor * paradox_factor * extremity_multiplier) / self.aufhebung_threshold
+        raw_XEPTQLRI = tension * trend_factor * paradox_factor * extremity_multiplier
         
-        stochastic_factor = 1 + (self.volatility * 0.3 * np.random.randn())
-        enhanced_XEPTQLRI = enhanced_XEPTQLRI * stochastic_factor
+        stochastic_factor = 1 + (self.volatility * 0.3 * z[Z_XEPTQLRI])
+        raw_XEPTQLRI = raw_XEPTQLRI * stochastic_factor
         
-        if len(self.history_A) > 50:
-            recent_extremity = np.mean([abs(x) > 0.8 for x in self.history_A[-50:]])
+        if self.history.total_steps > self._roll_extreme_A.window:
+            recent_extremity = self._roll_extreme_A.mean()
             if recent_extremity > 0.7:
-                enhanced_XEPTQLRI *= 1.3
+                raw_XEPTQLRI *= 1.3
         
-        return np.clip(enhanced_XEPTQLRI, 0, 3.0)
+        return raw_XEPTQLRI
     
     # ============================================================================
     # SIMULATION AND ANALYSIS
     # ============================================================================
     
-    def simulate_enhanced_historical_process(self):
+    def simulate_enhanced_historical_process(self, backend='auto'):
         """
         Simulate historical process with enhanced paradox detection.
+        
+        Runs the steps of the horizon not simulated yet: all of them for a
+        new system, the remainder for one restored from a checkpoint taken
+        part-way through a run.
+        
+        Parameters:
+        -----------
+        backend : str
+            'python' steps through the operators in Python; 'jit' runs the
+            numba-compiled step kernel (bitwise identical results, requires
+            numba and no retention window); 'auto' uses 'jit' when numba is
+            installed, the history is unbounded and the horizon is at least
+            JIT_MIN_STEPS, and 'python' otherwise
         """
-        print(f"\n🌌 SIMULATING {self.system_name.upper()} WITH PARADOX DETECTION...")
-        print(f"   Enhanced stages: {len(self.stages)}")
-        print(f"   System ID: {self.system_id}")
+        kernel = self._resolve_backend(backend)
         
-        current_A = self.A
-        current_anti_A = self.anti_A
-        
-        # Enhanced phase boundaries
-        phase_boundaries = [
-            int(self.horizon * 0.2),
-            int(self.horizon * 0.4),
-            int(self.horizon * 0.6),
-            int(self.horizon * 0.75),
-            int(self.horizon * 0.85),
-            int(self.horizon * 0.95),
-            self.horizon
-        ]
-        
-        for step in range(self.horizon):
-            # Determine current phase
-            current_phase = 0
-            for p, boundary in enumerate(phase_boundaries):
-                if step < boundary:
-                    current_phase = p
-                    break
-            
-            # Phase parameters
-            phase_params = {
-                0: {"pressure": 0.02, "volatility": 0.01},
-                1: {"pressure": 0.05, "volatility": 0.03},
-                2: {"pressure": 0.10, "volatility": 0.05},
-                3: {"pressure": 0.15, "volatility": 0.08},
-                4: {"pressure": 0.20, "volatility": 0.12},
-                5: {"pressure": 0.25, "volatility": 0.15},
-                6: {"pressure": 0.30, "volatility": 0.20}
-            }
-            
-            params = phase_params[current_phase]
-            
-            # Update dialectical negation
-            historical_factor = 1 + 0.003 * step
-            current_anti_A = self._enhanced_dialectical_negation(current_A) * historical_factor
-            
-            # Calculate current tension
-            current_tension = self._dialectical_conjunction_intensity(current_A, current_anti_A)
-            
-            # Apply dialectical pressure
-            dialectical_pressure = current_tension * params["pressure"]
-            
-            # Add phase-specific patterns
-            phase_pattern = {
-                0: 0.01 * np.sin(step * 0.05),
-                1: 0.02 * np.sin(step * 0.08),
-                2: 0.03 * np.sin(step * 0.12),
-                3: 0.04 * np.sin(step * 0.18),
-                4: 0.05 * np.sin(step * 0.25),
-                5: 0.06 * np.sin(step * 0.35),
-                6: 0.03 * np.sin(step * 0.10)
-            }
-            historical_trend = phase_pattern[current_phase]
-            
-            # Add systemic noise
-            systemic_noise = params["volatility"] * np.random.randn()
-            
-            # Update A
-            current_A = current_A + dialectical_pressure + historical_trend + systemic_noise
-            current_A = np.clip(current_A, -1.2, 1.2)
+        if self.verbose:
+            print(f"\n🌌 SIMULATING {self.system_name.upper()} WITH PARADOX DETECTION...")
+            print(f"   Enhanced stages: {len(self.stages)}")
+            print(f"   System ID: {self.system_id}")
+            print(f"   Backend: {'jit' if kernel is not None else 'python'}")
+        
+        chunk_steps = KERNEL_CHUNK_STEPS if kernel is not None else max(self.horizon, 1)
+        for _ in self._advance(kernel, chunk_steps):
+            pass
+        
+        if self.verbose:
+            print(f"\r   ✅ Enhanced simulation completed: {self.horizon} steps")
+            print(f"   ⚡ Risk events detected: {len(self.risk_events)}")
+            print(f"   🔮 Paradox events detected: {len(self.paradox_events)}")
+            print(f"   🎭 Final Stage: {self.stages[self.history_stages[-1]]}")
+            print(f"   📊 Final Paradox Score: {self.history_paradox_scores[-1]:.3f}")
+        
+        return self
+    
+    def simulate_chunks(self, chunk_steps=STREAM_CHUNK_STEPS, backend='auto', checkpoint=None):
+        """
+        Generator version of ``simulate_enhanced_historical_process``.
+        
+        Simulates the horizon ``chunk_steps`` steps at a time and yields
+        each chunk as soon as it is computed; the rolling windows and random
+        streams carry over, so the concatenated chunks equal the history and
+        events of an in-memory run. Without a retention window the history
+        and event logs are cut back to a trailing context of
+        STREAM_CONTEXT_STEPS steps (or the τ₈ or trend window, if longer)
+        before each new chunk, so peak memory depends on ``chunk_steps``,
+        not on the horizon. The report aggregates still cover the whole
+        run, and after the last chunk the system holds that chunk and the
+        context before it, so the report's current and true-state analysis
+        see as many recent steps as after an in-memory run.
+        
+        The run starts at the system's simulation cursor, so a system
+        restored with ``load_checkpoint`` yields only the chunks it has not
+        simulated yet. With ``checkpoint``, the system is saved there at
+        every chunk boundary, once the consumer asks for the next chunk; an
+        interrupted stream resumes from the last boundary with
+        ``load_checkpoint(checkpoint).simulate_chunks(...)``.
+        
+        Parameters:
+        -----------
+        chunk_steps : int
+            Steps per chunk (at most the retention window, if any)
+        backend : str
+            Step backend, as in ``simulate_enhanced_historical_process``
+        checkpoint : str, optional
+            File rewritten with ``save_checkpoint`` after every chunk
+        
+        Yields:
+        -------
+        dict
+            'start' and 'stop' (steps of the run), 'steps' (absolute history
+            steps), one array per HistoryStore column, and the chunk's
+            'risk_events' and 'paradox_events' as structured record arrays
+        """
+        chunk_steps = int(chunk_steps)
+        retention = self.history.retention
+        if chunk_steps < 1:
+            raise ValueError(f"chunk_steps must be positive, got {chunk_steps}")
+        if retention is not None and chunk_steps > retention:
+            raise ValueError(f"chunk_steps ({chunk_steps}) exceeds the retention of {retention} steps")
+        kernel = self._resolve_backend(backend)
+        context = max(STREAM_CONTEXT_STEPS, self.trend_window, self._roll_stages.window)
+        
+        for start, stop in self._advance(kernel, chunk_steps):
+            n = stop - start
+            chunk = {'start': start, 'stop': stop,
+                     'steps': np.arange(self.history.total_steps - n, self.history.total_steps)}
+            for name in HistoryStore.COLUMNS:
+                chunk[name] = self.history.column(name)[-n:].copy()
+            chunk['risk_events'] = self.risk_events.select(step_range=(start, stop))
+            chunk['paradox_events'] = self.paradox_events.select(step_range=(start, stop))
+            yield chunk
             
-            # Calculate historical trend for XEPTQLRI
-            if step > 10:
-                recent_trend = np.polyfit(range(10), self.history_tension[-10:], 1)[0] if len(self.history_tension) >= 10 else 0
+            if retention is None and stop < self.horizon:
+                self.history.trim(context)
+                self.risk_events.prune_before(self.history.first_step)
+                self.paradox_events.prune_before(self.history.first_step)
+            if checkpoint is not None:
+                self.save_checkpoint(checkpoint)
+    
+    def stream_to_csv(self, path, chunk_steps=STREAM_CHUNK_STEPS, backend='auto'):
+        """
+        Simulate with ``simulate_chunks`` and append every chunk to a CSV file.
+        
+        The columns are those of the CSV written by
+        ``export_comprehensive_analysis``; memory stays bounded by the chunk.
+        
+        Parameters:
+        -----------
+        path : str
+            Destination CSV file (overwritten)
+        chunk_steps : int
+            Steps per chunk
+        backend : str
+            Step backend, as in ``simulate_enhanced_historical_process``
+        """
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for i, chunk in enumerate(self.simulate_chunks(chunk_steps, backend)):
+                self._history_frame(chunk, chunk['steps']).to_csv(f, index=False, header=(i == 0))
+        return path
+    
+    def _resolve_backend(self, backend):
+        """Return the compiled step kernel for ``backend``, or None for the Python loop."""
+        if backend not in ('auto', 'python', 'jit'):
+            raise ValueError(f"Unknown backend '{backend}' (expected 'auto', 'python' or 'jit')")
+        if backend == 'python':
+            return None
+        if backend == 'auto':
+            if self.history.retention is not None or self.horizon < JIT_MIN_STEPS:
+                return None
+            return _jit_step_kernel()
+        if self.history.retention is not None:
+            raise ValueError("backend='jit' does not support a retention window")
+        kernel = _jit_step_kernel()
+        if kernel is None:
+            raise ImportError("backend='jit' requires numba")
+        return kernel
+    
+    def _advance(self, kernel, chunk_steps):
+        """
+        Run the rest of the historical process ``chunk_steps`` at a time, yielding each (start, stop).
+        
+        Starts at the simulation cursor, which is advanced after every
+        chunk, so an interrupted or checkpointed run continues where it
+        stopped instead of starting again at step 0.
+        """
+        for start in range(self._next_step, self.horizon, chunk_steps):
+            stop = min(start + chunk_steps, self.horizon)
+            if kernel is None:
+                self._current_A = self._simulate_python(self._current_A, start, stop)
             else:
-                recent_trend = 0
+                self._current_A = self._simulate_kernel(kernel, self._current_A, start, stop)
+            self._next_step = stop
+            yield start, stop
+    
+    def _simulate_python(self, current_A, start, stop):
+        """Step through steps ``start`` .. ``stop - 1`` one operator call at a time; return A."""
+        for block_start in range(start, stop, KERNEL_CHUNK_STEPS):
+            block_stop = min(block_start + KERNEL_CHUNK_STEPS, stop)
             
-            # Calculate paradox score
-            paradox_score = self._calculate_paradox_score(current_A, current_anti_A, current_tension)
+            # Exogenous phase, pressure, volatility and trend of the whole block
+            phases, pressures, volatilities, trends = (
+                column.tolist() for column in self.phase_schedule.segment(block_start, block_stop))
             
-            # Calculate enhanced XEPTQLRI
-            enhanced_XEPTQLRI = self._calculate_enhanced_XEPTQLRI(
-                current_tension, recent_trend, current_A, current_anti_A, paradox_score
-            )
+            for step, current_phase, pressure, volatility, historical_trend in zip(
+                    range(block_start, block_stop), phases, pressures, volatilities, trends):
+                # One noise row shared by all operators of this step
+                noise = self._next_step_noise()
+                
+                # Update dialectical negation
+                historical_factor = 1 + 0.003 * step
+                current_anti_A = self._enhanced_dialectical_negation(current_A, noise) * historical_factor
+                
+                # Calculate current tension
+                current_tension = self._dialectical_conjunction_intensity(current_A, current_anti_A, noise)
+                
+                # Apply dialectical pressure
+                dialectical_pressure = current_tension * pressure
+                
+                # Add systemic noise
+                systemic_noise = volatility * noise[1][Z_SYSTEMIC]
+                
+                # Update A (phase-specific trend included)
+                current_A = current_A + dialectical_pressure + historical_trend + systemic_noise
+                current_A = np.clip(current_A, -1.2, 1.2)
+                
+                enhanced_XEPTQLRI, stage_idx, stage_name, paradox_score = self._process_step(
+                    step, current_A, current_anti_A, current_tension, current_phase, noise
+                )
+                
+                # Progress indicator
+                if self.verbose and step % 50 == 0 and step > 0:
+                    sys.stdout.write(f"\r   Progress: {step}/{self.horizon} steps | "
+                                   f"Current Stage: {stage_name[:20]} | "
+                                   f"Paradox Score: {paradox_score:.2f}")
+                    sys.stdout.flush()
+        return current_A
+    
+    def _simulate_kernel(self, kernel, current_A, start, stop):
+        """Run steps ``start`` .. ``stop - 1`` through ``_step_kernel`` in blocks of KERNEL_CHUNK_STEPS; return A."""
+        windows = self._pack_kernel_windows()
+        lap = self._profile_laps('simulate')
+        for block_start in range(start, stop, KERNEL_CHUNK_STEPS):
+            block_stop = min(block_start + KERNEL_CHUNK_STEPS, stop)
+            steps = np.arange(block_start, block_stop)
+            n = len(steps)
+            phase, pressure, phase_volatility, exogenous_trend = self.phase_schedule.segment(
+                block_start, block_stop)
+            lap('phase_schedule')
+            u, z = self._take_noise_rows(n)
+            lap('noise')
             
-            # Enhanced stage classification
-            stage_idx, stage_name = self._enhanced_stage_classification(
-                current_tension, current_A, current_anti_A, paradox_score
+            out = {name: np.empty(n) for name in ('A', 'anti_A', 'tension', 'paradox_scores',
+                                                   'raw_XEPTQLRI', 'XEPTQLRI')}
+            stage = np.empty(n, dtype=np.int8)
+            flags = np.empty(n, dtype=np.int8)
+            current_A = kernel(
+                current_A, block_start, self.history.total_steps, u, z, pressure,
+                phase_volatility, exogenous_trend, self.aufhebung_threshold, self.volatility,
+                self.trend_window, *windows,
+                out['A'], out['anti_A'], out['tension'], out['paradox_scores'], out['raw_XEPTQLRI'],
+                out['XEPTQLRI'], stage, flags
             )
+            lap('step_kernel')
+            out.update(true_XEPTQLRI=out['XEPTQLRI'], stages=stage, true_stages=stage, phase=phase)
+            self._record_block(steps, out, flags)
+            lap('record_block')
             
-            # Detect paradox events
-            self._detect_paradox_events(step, current_A, current_anti_A, paradox_score, stage_idx)
-            
-            # Store enhanced history
-            self.history_A.append(current_A)
-            self.history_anti_A.append(current_anti_A)
-            self.history_tension.append(current_tension)
-            self.history_XEPTQLRI.append(enhanced_XEPTQLRI)
-            self.history_true_XEPTQLRI.append(enhanced_XEPTQLRI)
-            self.history_stages.append(stage_idx)
-            self.history_true_stages.append(stage_idx)
-            self.history_paradox_scores.append(paradox_score)
-            self.phase_history.append(current_phase)
-            
-            # Detect risk events
-            if enhanced_XEPTQLRI > 0.7:
-                risk_level = "CRITICAL" if enhanced_XEPTQLRI > 1.0 else "HIGH"
-                self.risk_events.append({
-                    'step': step,
-                    'XEPTQLRI': enhanced_XEPTQLRI,
-                    'true_XEPTQLRI': enhanced_XEPTQLRI,
-                    'tension': current_tension,
-                    'stage': stage_name,
-                    'risk': risk_level,
-                    'phase': self.phases[current_phase],
-                    'paradox_score': paradox_score
-                })
-            
-            # Progress indicator
-            if step % 50 == 0 and step > 0:
-                sys.stdout.write(f"\r   Progress: {step}/{self.horizon} steps | "
-                               f"Current Stage: {stage_name[:20]} | "
-                               f"Paradox Score: {paradox_score:.2f}")
+            if self.verbose:
+                sys.stdout.write(f"\r   Progress: {steps[-1] + 1}/{self.horizon} steps | "
+                               f"Current Stage: {self.stages[stage[-1]][:20]} | "
+                               f"Paradox Score: {out['paradox_scores'][-1]:.2f}")
                 sys.stdout.flush()
+        self._unpack_kernel_windows(windows)
+        return current_A
+    
+    def _pack_kernel_windows(self):
+        """Copy the rolling-window state into the flat arrays taken by ``_step_kernel``."""
+        float_windows = [getattr(self, attr) for attr in KERNEL_FLOAT_WINDOWS]
+        rw_buf = np.zeros((len(float_windows), max(w.window for w in float_windows)))
+        for k, w in enumerate(float_windows):
+            rw_buf[k, :w.window] = w.buffer
+        rw_size = np.array([w.window for w in float_windows], dtype=np.int64)
+        rw_total = np.array([w.total for w in float_windows], dtype=np.float64)
+        rw_int = np.array([[w.count, w._pos, w._pushes] for w in float_windows], dtype=np.int64)
+        
+        cat = self._roll_stages
+        cat_int = np.array([cat.distinct, cat.total, cat.total_sq, cat.count, cat._pos], dtype=np.int64)
+        trend = self._trend
+        tr_sums = np.array([trend.sum_y, trend.sum_xy], dtype=np.float64)
+        tr_int = np.array([trend.count, trend._pos, trend._pushes], dtype=np.int64)
+        return (rw_buf, rw_size, rw_total, rw_int, RollingWindow.RESYNC_EVERY,
+                cat.buffer.copy(), cat.counts.copy(), cat_int,
+                trend.buffer.copy(), tr_sums, tr_int, trend._x_mean, trend._sxx, trend._resync_every)
+    
+    def _unpack_kernel_windows(self, packed):
+        """Write the state arrays of ``_pack_kernel_windows`` back into the rolling windows."""
+        (rw_buf, _, rw_total, rw_int, _, cat_buf, cat_counts, cat_int,
+         tr_buf, tr_sums, tr_int, _, _, _) = packed
+        for k, attr in enumerate(KERNEL_FLOAT_WINDOWS):
+            w = getattr(self, attr)
+            w.buffer[...] = rw_buf[k, :w.window]
+            w.total = rw_total[k]
+            w.count, w._pos, w._pushes = rw_int[k].tolist()
+        cat = self._roll_stages
+        cat.buffer[...] = cat_buf
+        cat.counts[...] = cat_counts
+        cat.distinct, cat.total, cat.total_sq = cat_int[:3]
+        cat.count, cat._pos = cat_int[3:].tolist()
+        trend = self._trend
+        trend.buffer[...] = tr_buf
+        trend.sum_y, trend.sum_xy = tr_sums
+        trend.count, trend._pos, trend._pushes = tr_int.tolist()
+    
+    def _record_block(self, steps, columns, flags):
+        """Record a block of kernel steps: history, report aggregates and events from the flags."""
+        n0 = len(self.history)
+        self.history.extend(columns)
+        self._aggregates.add_block({name: self.history.column(name)[n0:] for name in HistoryStore.COLUMNS})
+        
+        hit = np.flatnonzero(flags & FLAG_RISK)
+        if len(hit):
+            records = np.empty(len(hit), dtype=RISK_EVENT_DTYPE)
+            records['step'] = steps[hit]
+            records['XEPTQLRI'] = columns['XEPTQLRI'][hit]
+            records['true_XEPTQLRI'] = columns['XEPTQLRI'][hit]
+            records['tension'] = columns['tension'][hit]
+            records['stage'] = columns['stages'][hit]
+            records['risk'] = columns['XEPTQLRI'][hit] > 1.0
+            records['phase'] = columns['phase'][hit]
+            records['paradox_score'] = columns['paradox_scores'][hit]
+            self.risk_events.extend(records)
+        
+        hits = [np.flatnonzero(flags & (1 << (code + FLAG_PARADOX_SHIFT)))
+                for code in range(len(PARADOX_EVENT_TYPES))]
+        records = self._paradox_event_records(steps, columns, hits)
+        if len(records):
+            self.paradox_events.extend(records)
+            for code, h in enumerate(hits):
+                self._aggregates.count_paradox_event(code, len(h))
+    
+    @staticmethod
+    def _paradox_event_records(steps, columns, hits):
+        """Paradox event records for the row indices ``hits[code]`` of each event type."""
+        hit = np.concatenate(hits)
+        # Events of one step are emitted in type-code order
+        order = np.argsort(hit, kind='stable')
+        hit = hit[order]
+        records = np.empty(len(hit), dtype=PARADOX_EVENT_DTYPE)
+        records['step'] = steps[hit]
+        records['type'] = np.repeat(np.arange(len(hits)), [len(h) for h in hits])[order]
+        records['A_value'] = columns['A'][hit]
+        records['anti_A_value'] = columns['anti_A'][hit]
+        records['paradox_score'] = columns['paradox_scores'][hit]
+        records['stage'] = columns['stages'][hit]
+        return records
+    
+    def _process_step(self, step, current_A, current_anti_A, current_tension, current_phase, noise):
+        """Score, classify and record one step; return (XEPTQLRI, stage, stage name, paradox score)."""
+        # Calculate historical trend for XEPTQLRI
+        if step > self.trend_window and self._trend.full:
+            recent_trend = self._trend.slope()
+        else:
+            recent_trend = 0
         
-        print(f"\r   ✅ Enhanced simulation completed: {self.horizon} steps")
-        print(f"   ⚡ Risk events detected: {len(self.risk_events)}")
-        print(f"   🔮 Paradox events detected: {len(self.paradox_events)}")
-        print(f"   🎭 Final Stage: {self.stages[self.history_stages[-1]]}")
-        print(f"   📊 Final Paradox Score: {self.history_paradox_scores[-1]:.3f}")
+        # Calculate paradox score
+        paradox_score = self._calculate_paradox_score(current_A, current_anti_A, current_tension)
         
-        return self
+        # Calculate enhanced XEPTQLRI
+        raw_XEPTQLRI = self._calculate_raw_XEPTQLRI(
+            current_tension, recent_trend, current_A, current_anti_A, paradox_score, noise
+        )
+        enhanced_XEPTQLRI = scale_XEPTQLRI(raw_XEPTQLRI, self.aufhebung_threshold)
+        
+        # Enhanced stage classification
+        stage_idx, stage_name = self._enhanced_stage_classification(
+            current_tension, current_A, current_anti_A, paradox_score
+        )
+        
+        # Detect paradox events
+        self._detect_paradox_events(step, current_A, current_anti_A, paradox_score, stage_idx)
+        
+        # Store enhanced history
+        self._record_step(current_A, current_anti_A, current_tension, enhanced_XEPTQLRI,
+                          stage_idx, paradox_score, current_phase, raw_XEPTQLRI)
+        
+        # Detect risk events
+        self._detect_risk_event(step, enhanced_XEPTQLRI, current_tension, stage_idx, current_phase,
+                                paradox_score)
+        
+        if self.history.retention is not None:
+            self._prune_events()
+        
+        return enhanced_XEPTQLRI, stage_idx, stage_name, paradox_score
+    
+    def _prune_events(self):
+        """Drop events that refer to steps no longer retained in the history."""
+        first_step = self.history.first_step
+        self.risk_events.prune_before(first_step)
+        for type_code in self.paradox_events.prune_before(first_step)['type'].tolist():
+            self._aggregates.count_paradox_event(type_code, -1)
+    
+    def observe(self, observation, phase=0):
+        """
+        Push one observed state into the system and score it online.
+        
+        The observation replaces the self-driven update of A: its dialectical
+        negation, tension, paradox score, XEPTQLRI and stage are computed with
+        the same operators and rolling windows as the simulation, and the step
+        is recorded in the (optionally retention-bounded) history.
+        
+        Parameters:
+        -----------
+        observation : float
+            Observed system state A (clipped to [-1.2, 1.2])
+        phase : int
+            Index into ``self.phases`` used to label the step
+        
+        Returns:
+        --------
+        dict
+            Step index, A, negation, tension, paradox score, XEPTQLRI,
+            stage index and name, and the risk/paradox events emitted
+        """
+        step = self.history.total_steps
+        
+        noise = self._next_step_noise()
+        current_A = np.clip(observation, -1.2, 1.2)
+        current_anti_A = self._enhanced_dialectical_negation(current_A, noise)
+        current_tension = self._dialectical_conjunction_intensity(current_A, current_anti_A, noise)
+        
+        enhanced_XEPTQLRI, stage_idx, stage_name, paradox_score = self._process_step(
+            step, current_A, current_anti_A, current_tension, phase, noise
+        )
+        
+        new_risk = self.risk_events.since(step)
+        return {
+            'step': step,
+            'A': float(current_A),
+            'anti_A': float(current_anti_A),
+            'tension': float(current_tension),
+            'paradox_score': float(paradox_score),
+            'XEPTQLRI': float(enhanced_XEPTQLRI),
+            'stage': int(stage_idx),
+            'stage_name': stage_name,
+            'risk_event': new_risk[0] if new_risk else None,
+            'paradox_events': self.paradox_events.since(step),
+        }
+    
+    def monitor(self, feed, phase=0):
+        """
+        Generator that scores each observation of ``feed`` with ``observe``.
+        
+        Parameters:
+        -----------
+        feed : iterable of float
+            Observed states, e.g. a live data source
+        phase : int
+            Index into ``self.phases`` used to label the steps
+        """
+        for observation in feed:
+            yield self.observe(observation, phase)
     
     def _detect_paradox_events(self, step, current_A, current_anti_A, paradox_score, stage_idx):
         """
         Detect and record special paradox events.
         """
+        # Codes index PARADOX_EVENT_TYPES
         if abs(current_A) > 0.85 and abs(current_anti_A) > 0.85:
-            self.paradox_events.append({
-                'step': step,
-                'type': 'SIMULTANEOUS_EXTREMITY',
-                'A_value': float(current_A),
-                'anti_A_value': float(current_anti_A),
-                'paradox_score': float(paradox_score),
-                'stage': self.stages[stage_idx],
-                'description': 'Both A and ¬A at extreme values simultaneously'
-            })
+            self._record_paradox_event(0, step, current_A, current_anti_A, paradox_score, stage_idx)
         
         if stage_idx == 7:
-            self.paradox_events.append({
-                'step': step,
-                'type': 'FALSE_STABILITY',
-                'A_value': float(current_A),
-                'anti_A_value': float(current_anti_A),
-                'paradox_score': float(paradox_score),
-                'stage': self.stages[stage_idx],
-                'description': 'System appears stable but is at extreme values'
-            })
+            self._record_paradox_event(1, step, current_A, current_anti_A, paradox_score, stage_idx)
         
         if paradox_score > 0.9:
-            self.paradox_events.append({
-                'step': step,
-                'type': 'META_PARADOX',
-                'A_value': float(current_A),
-                'anti_A_value': float(current_anti_A),
-                'paradox_score': float(paradox_score),
-                'stage': self.stages[stage_idx],
-                'description': 'Extreme paradox score detected'
-            })
-    
-    def _calculate_stability_deception_index(self):
+            self._record_paradox_event(2, step, current_A, current_anti_A, paradox_score, stage_idx)
+    
+    def _detect_risk_event(self, step, XEPTQLRI, tension, stage_idx, phase, paradox_score):
+        """Record a risk event when XEPTQLRI exceeds 0.7."""
+        if XEPTQLRI > 0.7:
+            risk_level = 1 if XEPTQLRI > 1.0 else 0  # RISK_LEVELS: HIGH, CRITICAL
+            self.risk_events.append(step, XEPTQLRI, XEPTQLRI, tension, stage_idx, risk_level, phase,
+                                    paradox_score)
+    
+    def _record_paradox_event(self, type_code, step, current_A, current_anti_A, paradox_score, stage_idx):
+        """Append one paradox event and count it in the report aggregates."""
+        self.paradox_events.append(step, type_code, current_A, current_anti_A, paradox_score, stage_idx)
+        self._aggregates.count_paradox_event(type_code)
+    
+    def _calculate_stability_deception_index(self, XEPTQLRI=None):
         """
         Calculate how deceptive the apparent stability is.
         """
-        if len(self.history_XEPTQLRI) < 50:
+        if len(self.history) < 50:
             return 0.0
+        if XEPTQLRI is None:
+            XEPTQLRI = self.history_XEPTQLRI
         
-        recent_risk = np.mean(self.history_XEPTQLRI[-50:])
-        recent_A_abs = np.mean([abs(x) for x in self.history_A[-50:]])
-        recent_anti_abs = np.mean([abs(x) for x in self.history_anti_A[-50:]])
+        recent_risk = np.mean(XEPTQLRI[-50:])
+        recent_A_abs = np.mean(np.abs(self.history_A[-50:]))
+        recent_anti_abs = np.mean(np.abs(self.history_anti_A[-50:]))
         
         if recent_risk < 0.5:
             if recent_A_abs > 0.7 or recent_anti_abs > 0.7:
@@ -478,12 +3418,34 @@ class XenopoulosGeneticHistoricalSystem:
     def enhanced_analysis_report(self):
         """
         Generate comprehensive enhanced analysis report.
+        
+        The report is computed once per history version and cached; every
+        call returns an independent copy of the cached report.
         """
-        if not self.history_XEPTQLRI:
+        if len(self.history) == 0:
             self.simulate_enhanced_historical_process()
         
-        XEPTQLRI_array = np.array(self.history_XEPTQLRI)
-        paradox_array = np.array(self.history_paradox_scores)
+        if self._report_cache is None or self._report_version != self.history.version:
+            self._report_cache = self._compute_analysis_report()
+            self._report_version = self.history.version
+        return copy.deepcopy(self._report_cache)
+    
+    def _compute_analysis_report(self, agg=None, XEPTQLRI=None, stages=None):
+        """
+        Assemble the report from the running aggregates in O(1).
+        
+        ``agg``, ``XEPTQLRI`` and ``stages`` substitute rescored aggregates
+        and columns for the recorded ones (see ``rescore``).
+        """
+        if agg is None:
+            agg = self._aggregates
+        if XEPTQLRI is None:
+            XEPTQLRI = self.history_XEPTQLRI
+        if stages is None:
+            stages = self.history_stages
+        n = agg.n
+        low, medium, high, extreme = agg.risk_counts
+        event_counts = dict(zip(PARADOX_EVENT_TYPES, agg.paradox_event_counts))
         
         # Enhanced metrics
         report = {
@@ -491,62 +3453,51 @@ class XenopoulosGeneticHistoricalSystem:
                 'name': self.system_name,
                 'id': self.system_id,
                 'creation_time': self.creation_time,
-                'total_steps': len(self.history_A)
+                'total_steps': n
             },
             'metrics': {
-                'mean_XEPTQLRI': float(np.mean(XEPTQLRI_array)),
-                'max_XEPTQLRI': float(np.max(XEPTQLRI_array)),
-                'min_XEPTQLRI': float(np.min(XEPTQLRI_array)),
-                'final_XEPTQLRI': float(XEPTQLRI_array[-1]),
-                'std_XEPTQLRI': float(np.std(XEPTQLRI_array)),
-                'mean_tension': float(np.mean(self.history_tension)),
-                'max_tension': float(np.max(self.history_tension)),
-                'mean_paradox_score': float(np.mean(paradox_array)),
-                'max_paradox_score': float(np.max(paradox_array)),
-                'stability_deception': float(self._calculate_stability_deception_index()),
-                'permanent_transcendence_score': float(np.mean([abs(x) > 0.8 for x in self.history_A])),
-                'simultaneous_extremity_score': float(np.mean([abs(a) > 0.8 and abs(b) > 0.8 
-                                                              for a, b in zip(self.history_A, self.history_anti_A)]))
+                'mean_XEPTQLRI': float(agg.mean_XEPTQLRI),
+                'max_XEPTQLRI': float(agg.extremum('max_XEPTQLRI')),
+                'min_XEPTQLRI': float(agg.extremum('min_XEPTQLRI')),
+                'final_XEPTQLRI': float(XEPTQLRI[-1]),
+                'std_XEPTQLRI': agg.std_XEPTQLRI(),
+                'mean_tension': float(agg.sum_tension / n),
+                'max_tension': float(agg.extremum('max_tension')),
+                'mean_paradox_score': float(agg.sum_paradox_score / n),
+                'max_paradox_score': float(agg.extremum('max_paradox_score')),
+                'stability_deception': float(self._calculate_stability_deception_index(XEPTQLRI)),
+                'permanent_transcendence_score': agg.extreme_count / n,
+                'simultaneous_extremity_score': agg.simultaneous_extreme_count / n
             },
             'current_state': {
-                'stage': self.stages[self.history_stages[-1]],
-                'stage_index': int(self.history_stages[-1]),
+                'stage': self.stages[stages[-1]],
+                'stage_index': int(stages[-1]),
                 'A_value': float(self.history_A[-1]),
                 'anti_A_value': float(self.history_anti_A[-1]),
                 'paradox_score': float(self.history_paradox_scores[-1]),
                 'phase': self.phases[self.phase_history[-1]]
             },
             'distribution': {
-                'stages': {},
-                'phases': {},
+                'stages': {name: agg.stage_counts[idx] for idx, name in self.stages.items()},
+                'phases': {name: agg.phase_counts[idx] for idx, name in self.phases.items()},
                 'risk_levels': {
-                    'low': np.sum(XEPTQLRI_array < 0.5),
-                    'medium': np.sum((XEPTQLRI_array >= 0.5) & (XEPTQLRI_array < 1.0)),
-                    'high': np.sum((XEPTQLRI_array >= 1.0) & (XEPTQLRI_array < 2.0)),
-                    'extreme': np.sum(XEPTQLRI_array >= 2.0)
+                    'low': low,
+                    'medium': medium,
+                    'high': high,
+                    'extreme': extreme
                 }
             },
             'paradox_analysis': {
-                'total_paradox_events': len(self.paradox_events),
-                'simultaneous_extremity_events': len([e for e in self.paradox_events if e['type'] == 'SIMULTANEOUS_EXTREMITY']),
-                'false_stability_events': len([e for e in self.paradox_events if e['type'] == 'FALSE_STABILITY']),
-                'meta_paradox_events': len([e for e in self.paradox_events if e['type'] == 'META_PARADOX']),
-                'paradox_persistence': float(np.mean(paradox_array > 0.7))
+                'total_paradox_events': sum(agg.paradox_event_counts),
+                'simultaneous_extremity_events': event_counts['SIMULTANEOUS_EXTREMITY'],
+                'false_stability_events': event_counts['FALSE_STABILITY'],
+                'meta_paradox_events': event_counts['META_PARADOX'],
+                'paradox_persistence': agg.persistent_paradox_count / n
             }
         }
         
-        # Stage distribution
-        for idx, name in self.stages.items():
-            count = np.sum(np.array(self.history_stages) == idx)
-            report['distribution']['stages'][name] = int(count)
-        
-        # Phase distribution
-        for idx, name in self.phases.items():
-            count = np.sum(np.array(self.phase_history) == idx)
-            report['distribution']['phases'][name] = int(count)
-        
         # Determine true system state
-        true_state = self._determine_true_system_state()
+        true_state = self._determine_true_system_state(XEPTQLRI, stages)
         report['true_system_state'] = true_state
         
         # Generate enhanced recommendations
@@ -555,22 +3506,25 @@ class XenopoulosGeneticHistoricalSystem:
         
         return report
     
-    def _determine_true_system_state(self):
+    def _determine_true_system_state(self, XEPTQLRI=None, stages=None):
         """
         Determine the true state of the system beyond apparent stability.
         """
-        if len(self.history_A) < 100:
+        if len(self.history) < 100:
             return "INSUFFICIENT_DATA"
+        if XEPTQLRI is None:
+            XEPTQLRI = self.history_XEPTQLRI
+        if stages is None:
+            stages = self.history_stages
         
-        recent_A = self.history_A[-100:]
-        recent_anti = self.history_anti_A[-100:]
+        recent_A = np.abs(self.history_A[-100:])
+        recent_anti = np.abs(self.history_anti_A[-100:])
         recent_paradox = self.history_paradox_scores[-100:]
-        recent_stages = self.history_stages[-100:]
+        recent_stages = stages[-100:]
         
-        time_at_extremes = np.mean([abs(x) > 0.8 for x in recent_A])
-        simultaneous_extremes = np.mean([abs(a) > 0.8 and abs(b) > 0.8 
-                                        for a, b in zip(recent_A, recent_anti)])
-        paradox_persistence = np.mean([p > 0.7 for p in recent_paradox])
+        time_at_extremes = np.mean(recent_A > 0.8)
+        simultaneous_extremes = np.mean((recent_A > 0.8) & (recent_anti > 0.8))
+        paradox_persistence = np.mean(recent_paradox > 0.7)
         stage_variability = np.std(recent_stages)
         
         # Decision tree
@@ -589,7 +3543,7 @@ class XenopoulosGeneticHistoricalSystem:
         elif stage_variability > 2.0:
             return "CHAOTIC_DIALECTICS"
         
-        elif np.mean(self.history_XEPTQLRI[-100:]) < 0.3:
+        elif np.mean(XEPTQLRI[-100:]) < 0.3:
             if time_at_extremes > 0.3:
                 return "FALSE_STABILITY_REGIME"
             else:
@@ -674,13 +3628,38 @@ class XenopoulosGeneticHistoricalSystem:
     # VISUALIZATION
     # ============================================================================
     
-    def create_paradox_detection_dashboard(self):
+    @_with_plot_style
+    def create_paradox_detection_dashboard(self, max_points=PLOT_MAX_POINTS,
+                                           density_points=DENSITY_MIN_POINTS):
         """
         Create comprehensive dashboard focusing on paradox detection.
+        
+        Parameters:
+        -----------
+        max_points : int, optional
+            Most points drawn per series; longer series are drawn through a
+            min/max decimation that keeps their envelope, so rendering time
+            does not grow with the horizon (None draws every point)
+        density_points : int, optional
+            Histories longer than this draw the phase-space and tension vs
+            paradox panels as binned 2-D densities colored by the per-bin
+            mean paradox score (most frequent stage for tension vs paradox)
+            instead of one marker per step (None always scatters)
         """
-        if not self.history_XEPTQLRI:
+        from matplotlib.patches import Rectangle
+
+        if len(self.history) == 0:
             self.simulate_enhanced_historical_process()
         
+        lap = self._profile_laps('dashboard')
+        
+        # Panels plot retained rows by position; events carry absolute steps
+        first_step = self.history.first_step
+        n = len(self.history)
+        history_A, history_anti_A = self.history_A, self.history_anti_A
+        paradox_scores = self.history_paradox_scores
+        dense = density_points is not None and n > density_points
+        
         fig = plt.figure(figsize=(20, 24))
         fig.suptitle(f'PARADOX DETECTION DASHBOARD: {self.system_name}\n'
                     f'Enhanced Xenopoulos Genetic-Historical Logic System v2.0\n'
@@ -689,29 +3668,30 @@ class XenopoulosGeneticHistoricalSystem:
         
         gs = fig.add_gridspec(6, 4, hspace=0.25, wspace=0.25, height_ratios=[1.2, 1, 1, 1, 1, 1.5])
         
+        lap('layout')
+        
         # 1. Main Paradox Visualization
         ax1 = fig.add_subplot(gs[0, :])
         
+        # One span per contiguous phase run, reaching the start of the next
         phase_colors = ['#e6f3ff', '#fff0e6', '#ffe6e6', '#ffcccc', '#ffb3b3', '#ff9999', '#ff6666']
-        for phase in range(7):
-            indices = np.where(np.array(self.phase_history) == phase)[0]
-            if len(indices) > 0:
-                for i in range(0, len(indices), 2):
-                    if i+1 < len(indices):
-                        ax1.axvspan(indices[i], indices[i+1], 
-                                   alpha=0.15, color=phase_colors[phase])
-        
-        ax1.plot(self.history_A, 'b-', linewidth=2.5, alpha=0.9, 
-                label='A (System State)')
-        ax1.plot(self.history_anti_A, 'r-', linewidth=2.5, alpha=0.7, 
-                label='¬ᴰA (Dialectical Negation)', linestyle='--')
+        starts, stops, phases = _runs(self.phase_history)
+        for start, stop, phase in zip(starts.tolist(), np.minimum(stops, n - 1).tolist(), phases.tolist()):
+            ax1.axvspan(start, stop, alpha=0.15, color=phase_colors[phase])
         
-        extreme_indices = [i for i, (a, anti) in enumerate(zip(self.history_A, self.history_anti_A)) 
-                          if abs(a) > 0.8 or abs(anti) > 0.8]
-        if extreme_indices:
-            ax1.scatter(extreme_indices, [self.history_A[i] for i in extreme_indices], 
+        ax1.plot(*_decimate(history_A, max_points), 'b-', linewidth=2.5, alpha=0.9, 
+                label='A (System State)')
+        ax1.plot(*_decimate(history_anti_A, max_points), 'r--', linewidth=2.5, alpha=0.7, 
+                label='¬ᴰA (Dialectical Negation)')
+        
+        # Extreme markers at the decimated positions of both envelopes
+        shown = np.union1d(_envelope_indices(history_A, max_points),
+                           _envelope_indices(history_anti_A, max_points))
+        extreme_indices = shown[(np.abs(history_A[shown]) > 0.8) | (np.abs(history_anti_A[shown]) > 0.8)]
+        if len(extreme_indices) > 0:
+            ax1.scatter(extreme_indices, history_A[extreme_indices], 
                        color='red', s=10, alpha=0.5, label='Extreme A values')
-            ax1.scatter(extreme_indices, [self.history_anti_A[i] for i in extreme_indices], 
+            ax1.scatter(extreme_indices, history_anti_A[extreme_indices], 
                        color='darkred', s=10, alpha=0.5, label='Extreme ¬A values')
         
         ax1.set_title('SYSTEM STATE EVOLUTION with Paradox Detection', fontsize=14, fontweight='bold')
@@ -722,11 +3702,13 @@ class XenopoulosGeneticHistoricalSystem:
         ax1.grid(True, alpha=0.2)
         ax1.legend(loc='upper right', fontsize=9, ncol=3)
         
+        lap('panel_1')
+        
         # 2. Paradox Score Timeline
         ax2 = fig.add_subplot(gs[1, 0])
-        ax2.plot(self.history_paradox_scores, 'purple', linewidth=2, alpha=0.8)
-        ax2.fill_between(range(len(self.history_paradox_scores)), 
-                        self.history_paradox_scores, alpha=0.3, color='purple')
+        steps_shown, paradox_shown = _decimate(paradox_scores, max_points)
+        ax2.plot(steps_shown, paradox_shown, 'purple', linewidth=2, alpha=0.8)
+        ax2.fill_between(steps_shown, paradox_shown, alpha=0.3, color='purple')
         ax2.axhline(y=0.7, color='red', linestyle='--', alpha=0.7, label='Paradox Threshold (0.7)')
         ax2.set_title('Paradox Score Timeline', fontsize=12, fontweight='bold')
         ax2.set_xlabel('Step')
@@ -735,9 +3717,11 @@ class XenopoulosGeneticHistoricalSystem:
         ax2.legend(loc='upper left')
         ax2.grid(True, alpha=0.2)
         
+        lap('panel_2')
+        
         # 3. Enhanced XEPTQLRI
         ax3 = fig.add_subplot(gs[1, 1])
-        ax3.plot(self.history_XEPTQLRI, 'darkgreen', linewidth=2, alpha=0.8)
+        ax3.plot(*_decimate(self.history_XEPTQLRI, max_points), 'darkgreen', linewidth=2, alpha=0.8)
         ax3.axhline(y=1.0, color='darkred', linestyle='-', alpha=0.7, label='Critical (1.0)')
         ax3.axhline(y=0.7, color='orange', linestyle='--', alpha=0.7, label='Warning (0.7)')
         ax3.axhline(y=2.0, color='black', linestyle=':', alpha=0.7, label='Extreme (2.0)')
@@ -747,9 +3731,11 @@ class XenopoulosGeneticHistoricalSystem:
         ax3.legend(loc='upper left')
         ax3.grid(True, alpha=0.2)
         
+        lap('panel_3')
+        
         # 4. Stage Distribution
         ax4 = fig.add_subplot(gs[1, 2])
-        stage_counts = [np.sum(np.array(self.history_stages) == i) for i in range(10)]
+        stage_counts = np.bincount(self.history_stages, minlength=10)
         colors = ['#2E8B57', '#FFD700', '#FF8C00', '#DC143C', '#8A2BE2', 
                  '#000000', '#FF00FF', '#00FFFF', '#FF1493', '#9400D3']
         bars = ax4.bar(range(10), stage_counts, color=colors, alpha=0.8)
@@ -763,11 +3749,18 @@ class XenopoulosGeneticHistoricalSystem:
             ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
                     str(count), ha='center', va='bottom', fontsize=8)
         
+        lap('panel_4')
+        
         # 5. Phase Space
         ax5 = fig.add_subplot(gs[1, 3])
-        scatter = ax5.scatter(self.history_A, self.history_anti_A, 
-                             c=self.history_paradox_scores, cmap='RdYlBu_r',
-                             s=20, alpha=0.7, edgecolors='black', linewidth=0.5)
+        if dense:
+            scatter = _density_mesh(ax5, history_A, history_anti_A, paradox_scores,
+                                    extent=((-1.2, 1.2), (-1.2, 1.2)), cmap='RdYlBu_r')
+        else:
+            shown = np.union1d(shown, _envelope_indices(paradox_scores, max_points))
+            scatter = ax5.scatter(history_A[shown], history_anti_A[shown], 
+                                 c=paradox_scores[shown], cmap='RdYlBu_r',
+                                 s=20, alpha=0.7, edgecolors='black', linewidth=0.5)
         
         ax5.add_patch(Rectangle((0.8, 0.8), 0.4, 0.4, alpha=0.1, color='red', 
                                label='Paradox Zone I (+,+)'))
@@ -782,28 +3775,41 @@ class XenopoulosGeneticHistoricalSystem:
         ax5.set_xlim(-1.2, 1.2)
         ax5.set_ylim(-1.2, 1.2)
         ax5.grid(True, alpha=0.2)
-        plt.colorbar(scatter, ax=ax5, label='Paradox Score')
+        plt.colorbar(scatter, ax=ax5, label='Mean Paradox Score' if dense else 'Paradox Score')
+        
+        lap('panel_5')
         
         # 6. Tension vs Paradox Score
         ax6 = fig.add_subplot(gs[2, 0])
-        scatter = ax6.scatter(self.history_tension, self.history_paradox_scores,
-                             c=self.history_stages, cmap='tab20', s=30, alpha=0.7)
+        history_tension = self.history_tension
+        if dense:
+            scatter = _density_mesh(ax6, history_tension, paradox_scores, self.history_stages,
+                                    statistic='mode', cmap='tab20')
+        else:
+            shown = np.union1d(_envelope_indices(history_tension, max_points),
+                               _envelope_indices(paradox_scores, max_points))
+            scatter = ax6.scatter(history_tension[shown], paradox_scores[shown],
+                                 c=self.history_stages[shown], cmap='tab20', s=30, alpha=0.7)
         ax6.set_title('Tension vs Paradox Score', fontsize=12, fontweight='bold')
         ax6.set_xlabel('Dialectical Tension')
         ax6.set_ylabel('Paradox Score')
         ax6.grid(True, alpha=0.2)
-        plt.colorbar(scatter, ax=ax6, label='Stage')
+        plt.colorbar(scatter, ax=ax6, label='Most Frequent Stage' if dense else 'Stage')
+        
+        lap('panel_6')
         
         # 7. Moving Averages
         ax7 = fig.add_subplot(gs[2, 1])
         window = 20
-        if len(self.history_A) > window:
-            moving_avg_A = np.convolve(self.history_A, np.ones(window)/window, mode='valid')
-            moving_avg_anti = np.convolve(self.history_anti_A, np.ones(window)/window, mode='valid')
+        if n > window:
+            moving_avg_A = np.convolve(history_A, np.ones(window)/window, mode='valid')
+            moving_avg_anti = np.convolve(history_anti_A, np.ones(window)/window, mode='valid')
             
-            ax7.plot(range(window-1, len(self.history_A)), moving_avg_A, 
+            steps_shown, avg_shown = _decimate(moving_avg_A, max_points)
+            ax7.plot(steps_shown + window - 1, avg_shown, 
                     'b-', linewidth=2, alpha=0.8, label=f'A ({window}-step MA)')
-            ax7.plot(range(window-1, len(self.history_anti_A)), moving_avg_anti,
+            steps_shown, avg_shown = _decimate(moving_avg_anti, max_points)
+            ax7.plot(steps_shown + window - 1, avg_shown,
                     'r-', linewidth=2, alpha=0.6, label=f'¬A ({window}-step MA)')
             ax7.set_title(f'{window}-Step Moving Averages', fontsize=12, fontweight='bold')
             ax7.set_xlabel('Step')
@@ -811,16 +3817,18 @@ class XenopoulosGeneticHistoricalSystem:
             ax7.legend()
             ax7.grid(True, alpha=0.2)
         
+        lap('panel_7')
+        
         # 8. Extremity Analysis
         ax8 = fig.add_subplot(gs[2, 2])
-        extremity_A = [abs(x) for x in self.history_A]
-        extremity_anti = [abs(x) for x in self.history_anti_A]
-        simultaneous_extremity = [1 if a > 0.8 and b > 0.8 else 0 
-                                 for a, b in zip(extremity_A, extremity_anti)]
-        
-        ax8.plot(extremity_A, 'b-', alpha=0.6, label='|A|')
-        ax8.plot(extremity_anti, 'r-', alpha=0.6, label='|¬A|')
-        ax8.plot(simultaneous_extremity, 'purple', linewidth=2, alpha=0.8, label='Simultaneous Extremity')
+        extremity_A = np.abs(history_A)
+        extremity_anti = np.abs(history_anti_A)
+        simultaneous_extremity = ((extremity_A > 0.8) & (extremity_anti > 0.8)).astype(np.int8)
+        
+        ax8.plot(*_decimate(extremity_A, max_points), 'b-', alpha=0.6, label='|A|')
+        ax8.plot(*_decimate(extremity_anti, max_points), 'r-', alpha=0.6, label='|¬A|')
+        ax8.plot(*_decimate(simultaneous_extremity, max_points), 'purple', linewidth=2, alpha=0.8,
+                 label='Simultaneous Extremity')
         ax8.axhline(y=0.8, color='orange', linestyle='--', alpha=0.5, label='Extreme Threshold')
         ax8.set_title('Extremity Analysis', fontsize=12, fontweight='bold')
         ax8.set_xlabel('Step')
@@ -828,6 +3836,8 @@ class XenopoulosGeneticHistoricalSystem:
         ax8.legend(loc='upper right', fontsize=8)
         ax8.grid(True, alpha=0.2)
         
+        lap('panel_8')
+        
         # 9. Stage Transitions with Paradox Events
         ax9 = fig.add_subplot(gs[2, 3])
         
@@ -835,16 +3845,18 @@ class XenopoulosGeneticHistoricalSystem:
         change_points = np.where(stage_changes != 0)[0]
         
         if len(change_points) > 0:
-            ax9.plot(change_points, [self.history_stages[i] for i in change_points], 
+            change_points = change_points[_envelope_indices(self.history_stages[change_points], max_points)]
+            ax9.plot(change_points, self.history_stages[change_points], 
                     'bo-', alpha=0.7, markersize=6, label='Stage Transitions')
         
-        if self.paradox_events:
-            for event in self.paradox_events:
-                color = {'SIMULTANEOUS_EXTREMITY': 'red', 
+        event_colors = {'SIMULTANEOUS_EXTREMITY': 'red', 
                         'FALSE_STABILITY': 'orange', 
-                        'META_PARADOX': 'purple'}.get(event['type'], 'black')
-                ax9.scatter(event['step'], self.history_stages[event['step']], 
-                          color=color, s=50, alpha=0.8)
+                        'META_PARADOX': 'purple'}
+        for event_type, color in event_colors.items():
+            rows = _thin_positions(self.paradox_events.select(types=event_type)['step'] - first_step,
+                                   n, max_points)
+            if len(rows) > 0:
+                ax9.scatter(rows, self.history_stages[rows], color=color, s=50, alpha=0.8)
         
         ax9.set_title('Stage Transitions with Paradox Events', fontsize=12, fontweight='bold')
         ax9.set_xlabel('Step')
@@ -853,9 +3865,11 @@ class XenopoulosGeneticHistoricalSystem:
         ax9.set_yticklabels([f'τ{i}' for i in range(10)])
         ax9.grid(True, alpha=0.2)
         
+        lap('panel_9')
+        
         # 10. XEPTQLRI Distribution
         ax10 = fig.add_subplot(gs[3, 0])
-        bins = np.linspace(0, max(self.history_XEPTQLRI) + 0.1, 30)
+        bins = np.linspace(0, self.history_XEPTQLRI.max() + 0.1, 30)
         ax10.hist(self.history_XEPTQLRI, bins=bins, color='green', alpha=0.7, edgecolor='black')
         ax10.axvline(x=1.0, color='red', linestyle='-', linewidth=2, label='Critical')
         ax10.axvline(x=0.7, color='orange', linestyle='--', linewidth=2, label='Warning')
@@ -865,14 +3879,16 @@ class XenopoulosGeneticHistoricalSystem:
         ax10.set_ylabel('Frequency')
         ax10.legend()
         
+        lap('panel_10')
+        
         # 11. Paradox Event Timeline
         ax11 = fig.add_subplot(gs[3, 1])
         if self.paradox_events:
-            for event in self.paradox_events:
-                color = {'SIMULTANEOUS_EXTREMITY': 'red', 
-                        'FALSE_STABILITY': 'orange', 
-                        'META_PARADOX': 'purple'}.get(event['type'], 'gray')
-                ax11.scatter(event['step'], 1, color=color, s=100, alpha=0.7)
+            for event_type, color in event_colors.items():
+                rows = _thin_positions(self.paradox_events.select(types=event_type)['step'] - first_step,
+                                       n, max_points)
+                if len(rows) > 0:
+                    ax11.scatter(rows, np.ones(len(rows)), color=color, s=100, alpha=0.7)
             ax11.set_title('Paradox Event Timeline', fontsize=12, fontweight='bold')
             ax11.set_xlabel('Step')
             ax11.set_yticks([])
@@ -881,9 +3897,11 @@ class XenopoulosGeneticHistoricalSystem:
                      ha='center', va='center', fontsize=14, transform=ax11.transAxes)
             ax11.set_title('Paradox Event Timeline', fontsize=12, fontweight='bold')
         
+        lap('panel_11')
+        
         # 12. Phase Distribution
         ax12 = fig.add_subplot(gs[3, 2])
-        phase_counts = [np.sum(np.array(self.phase_history) == i) for i in range(7)]
+        phase_counts = np.bincount(self.phase_history, minlength=7)
         phase_labels = [f'P{i}' for i in range(7)]
         colors = ['#e6f3ff', '#fff0e6', '#ffe6e6', '#ffcccc', '#ffb3b3', '#ff9999', '#ff6666']
         
@@ -892,19 +3910,21 @@ class XenopoulosGeneticHistoricalSystem:
                                            startangle=90)
         ax12.set_title('Phase Distribution', fontsize=12, fontweight='bold')
         
+        lap('panel_12')
+        
         # 13. Correlation Matrix
         ax13 = fig.add_subplot(gs[3, 3])
         
-        data_for_corr = np.array([
+        data_for_corr = np.vstack([
             self.history_A,
             self.history_anti_A,
             self.history_tension,
             self.history_XEPTQLRI,
             self.history_paradox_scores,
             self.history_stages
-        ]).T
+        ])
         
-        corr_matrix = np.corrcoef(data_for_corr.T)
+        corr_matrix = np.corrcoef(data_for_corr)
         
         im = ax13.imshow(corr_matrix, cmap='coolwarm', vmin=-1, vmax=1)
         ax13.set_title('Correlation Matrix', fontsize=12, fontweight='bold')
@@ -923,6 +3943,8 @@ class XenopoulosGeneticHistoricalSystem:
         
         plt.colorbar(im, ax=ax13)
         
+        lap('panel_13')
+        
         # 14. Detailed Analysis Report
         ax14 = fig.add_subplot(gs[4:, :])
         ax14.axis('off')
@@ -998,119 +4020,397 @@ class XenopoulosGeneticHistoricalSystem:
                  bbox=dict(boxstyle='round', facecolor=box_color, alpha=0.9,
                           edgecolor=border_color, linewidth=3))
         
-        plt.tight_layout()
+        lap('panel_14')
+        
         return fig
     
+    def render_dashboard(self, path=None, format=None, dpi=150, cache=True,
+                         max_points=PLOT_MAX_POINTS, density_points=DENSITY_MIN_POINTS):
+        """
+        Render the paradox detection dashboard to an image file, reusing cached renderings.
+        
+        The image is looked up in the render cache under a digest of the
+        history, parameters and figure options and only drawn when absent,
+        so rerendering an unchanged system costs a digest and a file copy.
+        The creation time shown in the report box is not part of the digest:
+        an identical rerun gets the image of the run that first rendered it.
+        
+        Parameters:
+        -----------
+        path : str, optional
+            Destination file; by default the path of the cache entry itself
+            is returned (treat it as read-only)
+        format : str, optional
+            Image format such as 'png' or 'svg' (default: from the suffix of
+            ``path``, else 'png')
+        dpi : float
+            Resolution of raster formats
+        cache : RenderCache, str or bool
+            Store to reuse, or its directory (True: the default
+            ``RenderCache()``); False always redraws and requires ``path``
+        max_points, density_points : int, optional
+            As for ``create_paradox_detection_dashboard``
+        
+        Returns:
+        --------
+        str
+            Path of the image
+        """
+        if format is None:
+            format = os.path.splitext(path)[1][1:].lower() if path else ''
+            format = format or 'png'
+        cache = _as_render_cache(cache)
+        
+        def write(target):
+            fig = self.create_paradox_detection_dashboard(max_points=max_points,
+                                                          density_points=density_points)
+            try:
+                fig.savefig(target, format=format, dpi=dpi, bbox_inches='tight', facecolor='white')
+            finally:
+                plt.close(fig)
+        
+        if cache is None:
+            if path is None:
+                raise ValueError("render_dashboard needs a path when no render cache is used")
+            write(path)
+            return path
+        
+        if len(self.history) == 0:
+            self.simulate_enhanced_historical_process()
+        key = self._render_key('dashboard', format=format, dpi=dpi, max_points=max_points,
+                               density_points=density_points)
+        suffix = f'.{format}'
+        if path is None:
+            return cache.get(key, suffix) or cache.put(key, suffix, write)
+        if not cache.copy_to(key, suffix, path):
+            shutil.copyfile(cache.put(key, suffix, write), path)
+        return path
+    
+    def create_live_dashboard(self, window=LIVE_WINDOW_STEPS, history_points=LIVE_HISTORY_POINTS):
+        """
+        Live, in-place updating dashboard of this system (see ``LiveDashboard``).
+        
+        Feed steps with ``observe`` (or iterate ``simulate_chunks``) and
+        call ``update()`` on the returned dashboard to draw them.
+        
+        Parameters:
+        -----------
+        window : int
+            Latest steps drawn at full resolution
+        history_points : int
+            Buckets of the decimated whole-history envelope
+        """
+        return LiveDashboard(self, window=window, history_points=history_points)
+    
+    def content_digest(self):
+        """
+        SHA-256 hex digest of the data behind the dashboard and exports.
+        
+        Covers the constructor parameters, the retained history columns and
+        their step range, both event logs and the analysis report without
+        its creation time, so an identical rerun of a simulation has the
+        same digest. Cached until the history changes.
+        """
+        if self._digest_cache is None or self._digest_version != self.history.version:
+            report = self.enhanced_analysis_report()
+            report['system_info'].pop('creation_time', None)
+            h = hashlib.sha256()
+            h.update(json.dumps([self._constructor_params(), report], sort_keys=True,
+                                default=str).encode('utf-8'))
+            h.update(np.array([self.history.first_step, self.history.total_steps], dtype=np.int64))
+            for name in HistoryStore.COLUMNS:
+                column = np.ascontiguousarray(self.history.column(name))
+                h.update(f'{name}:{column.dtype.str}:{len(column)}'.encode('utf-8'))
+                h.update(column)
+            for log in (self.risk_events, self.paradox_events):
+                records = np.ascontiguousarray(log.records)
+                h.update(f'events:{len(records)}'.encode('utf-8'))
+                h.update(records)
+            self._digest_cache = h.hexdigest()
+            self._digest_version = self.history.version
+        return self._digest_cache
+    
+    def _render_key(self, artifact, **options):
+        """Render-cache key of ``artifact`` of this system drawn with ``options``."""
+        spec = {'artifact': artifact, 'options': options, 'version': RENDER_CACHE_VERSION,
+                'content': self.content_digest()}
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+    
     # ============================================================================
     # EXPORT FUNCTIONALITY
     # ============================================================================
     
-    def export_comprehensive_analysis(self):
+    @_with_plot_style
+    def _history_frame(self, columns, steps):
+        """DataFrame of the exported CSV columns for the given history columns."""
+        stage_names = np.array([self.stages[i] for i in range(len(self.stages))], dtype=object)
+        phase_names = np.array([self.phases[i] for i in range(len(self.phases))], dtype=object)
+        return pd.DataFrame({
+            'step': steps,
+            'A': columns['A'],
+            'anti_A': columns['anti_A'],
+            'tension': columns['tension'],
+            'XEPTQLRI': columns['XEPTQLRI'],
+            'paradox_score': columns['paradox_scores'],
+            'stage': columns['stages'],
+            'stage_name': stage_names[columns['stages']],
+            'phase': columns['phase'],
+            'phase_name': phase_names[columns['phase']]
+        }, copy=False)
+    
+    def export_comprehensive_analysis(self, individual=False, processes=None, pool=None, cache=None):
         """
         Export comprehensive analysis with multiple formats.
+        
+        Figures are rendered in worker processes with the non-interactive
+        Agg backend while the JSON report, CSV data and summary are written
+        by the calling process. Workers read the history and event logs as
+        memory-mapped shared arrays rather than pickled copies, and reuse
+        the report computed here. The wall time of every artifact is kept in
+        ``export_timings`` (and in the profile while profiling).
+        
+        With a render cache, figures and CSV data already exported for the
+        same history, parameters and options (see ``content_digest``) are
+        copied from the cache instead of being redrawn or rewritten.
+        
+        Parameters:
+        -----------
+        individual : bool
+            Also export the phase-space, time-series and stage-distribution
+            figures
+        processes : int, optional
+            Rendering processes (default: the CPU count), at most one per
+            figure; even a single figure renders in a worker while the files
+            are written. 1 renders in the calling process afterwards
+        pool : concurrent.futures.Executor, optional
+            Pool from ``render_pool`` to render in, e.g. one shared by the
+            exports of a whole sweep (``processes`` is then ignored)
+        cache : RenderCache, str or bool, optional
+            Render cache to reuse and fill, or its directory (True: the
+            default ``RenderCache()``)
         """
-        if not self.history_XEPTQLRI:
+        if len(self.history) == 0:
             self.simulate_enhanced_historical_process()
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_filename = f"xenopoulos_v2_{self.system_id}_{timestamp}"
+        figures = {key: f"{base_filename}{EXPORT_FIGURES[key][0]}"
+                   for key in ('dashboard_png',) + (INDIVIDUAL_FIGURES if individual else ())}
         
         exports = {}
+        timings = {}
+        last = time.perf_counter()
+        
+        def lap(key):
+            nonlocal last
+            now = time.perf_counter()
+            timings[key] = now - last
+            last = now
         
-        # 1. Export JSON report
         report = self.enhanced_analysis_report()
-        json_file = f"{base_filename}_report.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-        exports['json_report'] = json_file
-        
-        # 2. Export CSV data
-        df = pd.DataFrame({
-            'step': range(len(self.history_A)),
-            'A': self.history_A,
-            'anti_A': self.history_anti_A,
-            'tension': self.history_tension,
-            'XEPTQLRI': self.history_XEPTQLRI,
-            'paradox_score': self.history_paradox_scores,
-            'stage': self.history_stages,
-            'stage_name': [self.stages[s] for s in self.history_stages],
-            'phase': self.phase_history,
-            'phase_name': [self.phases[p] for p in self.phase_history]
-        })
-        
-        csv_file = f"{base_filename}_data.csv"
-        df.to_csv(csv_file, index=False, encoding='utf-8')
-        exports['csv_data'] = csv_file
-        
-        # 3. Export dashboard visualization
+        cache = _as_render_cache(cache)
+        pending = dict(figures)
+        if cache is not None:
+            keys = {key: self._export_key(key) for key in ('csv_data',) + tuple(figures)}
+            lap('content_digest')
+            for key, path in figures.items():
+                if cache.copy_to(keys[key], '.png', path):
+                    del pending[key]
+                    lap(key)
+        if pool is None:
+            processes = processes or os.cpu_count() or 1
+        own_pool = shared_dir = None
+        futures = []
+        try:
+            # 1. Start rendering the figures
+            if pending and (pool is not None or processes > 1):
+                shared_dir = tempfile.mkdtemp(prefix='xenopoulos-render-', dir=SHARED_ARRAY_DIR)
+                paths = _share_arrays(self._render_arrays(), shared_dir)
+                state = self._render_state(report)
+                if pool is None:
+                    pool = own_pool = render_pool(min(processes, len(pending)))
+                futures = [pool.submit(_render_task, (key, path, state, paths))
+                           for key, path in pending.items()]
+                lap('render_setup')
+            
+            # 2. Export JSON report
+            json_file = f"{base_filename}_report.json"
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            exports['json_report'] = json_file
+            lap('json_report')
+            
+            # 3. Export CSV data
+            csv_file = f"{base_filename}_data.csv"
+            if cache is None or not cache.copy_to(keys['csv_data'], '.csv', csv_file):
+                df = self._history_frame({name: self.history.column(name) for name in HistoryStore.COLUMNS},
+                                         self.history.steps())
+                df.to_csv(csv_file, index=False, encoding='utf-8')
+                if cache is not None:
+                    cache.put(keys['csv_data'], '.csv', functools.partial(shutil.copyfile, csv_file))
+            exports['csv_data'] = csv_file
+            lap('csv_data')
+            
+            # 4. Export summary report
+            summary_file = f"{base_filename}_summary.txt"
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                f.write(f"XENOPOULOS SYSTEM v2.0 - COMPREHENSIVE ANALYSIS SUMMARY\n")
+                f.write("="*70 + "\n\n")
+                f.write(f"System: {self.system_name}\n")
+                f.write(f"ID: {self.system_id}\n")
+                f.write(f"Analysis Time: {timestamp}\n\n")
+                f.write(f"TRUE SYSTEM STATE: {report['true_system_state']}\n\n")
+                f.write("KEY METRICS:\n")
+                f.write(f"  Max XEPTQLRI: {report['metrics']['max_XEPTQLRI']:.3f}\n")
+                f.write(f"  Mean Paradox Score: {report['metrics']['mean_paradox_score']:.3f}\n")
+                f.write(f"  Stability Deception: {report['metrics']['stability_deception']:.3f}\n")
+                f.write(f"  Paradox Events: {report['paradox_analysis']['total_paradox_events']}\n\n")
+            
+            exports['summary_txt'] = summary_file
+            lap('summary_txt')
+            
+            # 5. Collect the figures (worker render times), or render them here
+            if futures:
+                for future in futures:
+                    key, seconds = future.result()
+                    timings[key] = seconds
+                lap('render_wait')
+            else:
+                for key, path in pending.items():
+                    self._render_figure(key, path)
+                    lap(key)
+            if cache is not None:
+                for key, path in pending.items():
+                    cache.put(keys[key], '.png', functools.partial(shutil.copyfile, path))
+            exports.update(figures)
+        finally:
+            if own_pool is not None:
+                own_pool.shutdown(cancel_futures=True)
+            if shared_dir is not None:
+                shutil.rmtree(shared_dir, ignore_errors=True)
+        
+        self.export_timings = timings
+        if self._profiling:
+            for key, seconds in timings.items():
+                self.profile.add(f'export.{key}', seconds)
+        
+        # 6. Export operator timings next to the report
+        if self.profile is not None:
+            exports['profile_json'] = self.profile.save(f"{base_filename}_profile.json")
+        
+        print(f"\n✅ COMPREHENSIVE ANALYSIS EXPORTED:")
+        for key, filepath in exports.items():
+            seconds = f" ({timings[key]:.2f}s)" if key in timings else ""
+            print(f"   📁 {key}: {filepath}{seconds}")
+        
+        return exports
+    
+    def _export_key(self, key):
+        """Render-cache key of an export artifact (the dashboard shares ``render_dashboard``'s)."""
+        if key == 'dashboard_png':
+            return self._render_key('dashboard', format='png', dpi=150, max_points=PLOT_MAX_POINTS,
+                                    density_points=DENSITY_MIN_POINTS)
+        return self._render_key(key)
+    
+    def _render_arrays(self):
+        """History columns and event records shared with rendering processes."""
+        arrays = {f'history.{name}': self.history.column(name) for name in HistoryStore.COLUMNS}
+        arrays['risk_events'] = self.risk_events.records
+        arrays['paradox_events'] = self.paradox_events.records
+        return arrays
+    
+    def _render_state(self, report):
+        """Picklable state (besides the shared arrays) of a ``_render_view``."""
+        return {
+            'params': self._constructor_params(),
+            'system_id': self.system_id,
+            'creation_time': self.creation_time,
+            'history_first_step': self.history.first_step,
+            'report': report,
+        }
+    
+    @classmethod
+    def _render_view(cls, state, arrays):
+        """System over shared (read-only) arrays that can draw the export figures."""
+        system = cls(verbose=False, **state['params'])
+        system.system_id = state['system_id']
+        system.creation_time = state['creation_time']
+        system.metadata['system_id'] = system.system_id
+        system.metadata['creation_time'] = system.creation_time
+        system.history.adopt({name: arrays[f'history.{name}'] for name in HistoryStore.COLUMNS},
+                             first_step=state['history_first_step'])
+        system.risk_events.adopt(arrays['risk_events'])
+        system.paradox_events.adopt(arrays['paradox_events'])
+        system._report_cache = state['report']
+        system._report_version = system.history.version
+        return system
+    
+    def _render_figure(self, key, path):
+        """Render the export figure ``key`` (an EXPORT_FIGURES key) to ``path``."""
+        getattr(self, EXPORT_FIGURES[key][1])(path)
+        return path
+    
+    @_with_plot_style
+    def _save_dashboard(self, path):
+        """Save the paradox detection dashboard as a PNG."""
         fig = self.create_paradox_detection_dashboard()
-        dashboard_file = f"{base_filename}_dashboard.png"
-        fig.savefig(dashboard_file, dpi=150, bbox_inches='tight', facecolor='white')
-        exports['dashboard_png'] = dashboard_file
+        fig.savefig(path, dpi=150, bbox_inches='tight', facecolor='white')
         plt.close(fig)
-        
-        # 4. Export summary report
-        summary_file = f"{base_filename}_summary.txt"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(f"XENOPOULOS SYSTEM v2.0 - COMPREHENSIVE ANALYSIS SUMMARY\n")
-            f.write("="*70 + "\n\n")
-            f.write(f"System: {self.system_name}\n")
-            f.write(f"ID: {self.system_id}\n")
-            f.write(f"Analysis Time: {timestamp}\n\n")
-            f.write(f"TRUE SYSTEM STATE: {report['true_system_state']}\n\n")
-            f.write("KEY METRICS:\n")
-            f.write(f"  Max XEPTQLRI: {report['metrics']['max_XEPTQLRI']:.3f}\n")
-            f.write(f"  Mean Paradox Score: {report['metrics']['mean_paradox_score']:.3f}\n")
-            f.write(f"  Stability Deception: {report['metrics']['stability_deception']:.3f}\n")
-            f.write(f"  Paradox Events: {report['paradox_analysis']['total_paradox_events']}\n\n")
-        
-        exports['summary_txt'] = summary_file
-        
-        print(f"\n✅ COMPREHENSIVE ANALYSIS EXPORTED:")
-        for key, filepath in exports.items():
-            print(f"   📁 {key}: {filepath}")
-        
-        return exports
     
     def _export_individual_visualizations(self, base_filename):
         """Export individual visualization components."""
+        for key in INDIVIDUAL_FIGURES:
+            self._render_figure(key, f"{base_filename}{EXPORT_FIGURES[key][0]}")
+    
+    @_with_plot_style
+    def _save_phase_space(self, path):
+        """Save the phase-space figure."""
         fig1, ax1 = plt.subplots(figsize=(10, 8))
-        scatter = ax1.scatter(self.history_A, self.history_anti_A, 
-                             c=self.history_paradox_scores, cmap='RdYlBu_r',
-                             s=30, alpha=0.7)
+        dense = len(self.history) > DENSITY_MIN_POINTS
+        if dense:
+            scatter = _density_mesh(ax1, self.history_A, self.history_anti_A,
+                                    self.history_paradox_scores, cmap='RdYlBu_r')
+        else:
+            scatter = ax1.scatter(self.history_A, self.history_anti_A, 
+                                 c=self.history_paradox_scores, cmap='RdYlBu_r',
+                                 s=30, alpha=0.7)
         ax1.set_title(f'Phase Space: {self.system_name}', fontsize=14)
         ax1.set_xlabel('A Value')
         ax1.set_ylabel('¬A Value')
         ax1.grid(True, alpha=0.3)
-        plt.colorbar(scatter, ax=ax1, label='Paradox Score')
-        plt.tight_layout()
-        plt.savefig(f"{base_filename}_phase_space.png", dpi=120, bbox_inches='tight')
+        plt.colorbar(scatter, ax=ax1, label='Mean Paradox Score' if dense else 'Paradox Score')
+        plt.savefig(path, dpi=120, bbox_inches='tight')
         plt.close(fig1)
-        
+    
+    @_with_plot_style
+    def _save_timeseries(self, path):
+        """Save the state and indicator time-series figure (min/max-decimated)."""
         fig2, (ax2a, ax2b) = plt.subplots(2, 1, figsize=(12, 8))
         
-        ax2a.plot(self.history_A, 'b-', label='A', alpha=0.8)
-        ax2a.plot(self.history_anti_A, 'r--', label='¬A', alpha=0.8)
+        ax2a.plot(*_decimate(self.history_A), 'b-', label='A', alpha=0.8)
+        ax2a.plot(*_decimate(self.history_anti_A), 'r--', label='¬A', alpha=0.8)
         ax2a.set_title('System State Evolution', fontsize=12)
         ax2a.set_xlabel('Step')
         ax2a.set_ylabel('Value')
         ax2a.legend()
         ax2a.grid(True, alpha=0.3)
         
-        ax2b.plot(self.history_XEPTQLRI, 'green', label='XEPTQLRI', alpha=0.8)
-        ax2b.plot(self.history_paradox_scores, 'purple', label='Paradox Score', alpha=0.8)
+        ax2b.plot(*_decimate(self.history_XEPTQLRI), 'green', label='XEPTQLRI', alpha=0.8)
+        ax2b.plot(*_decimate(self.history_paradox_scores), 'purple', label='Paradox Score', alpha=0.8)
         ax2b.set_title('Risk and Paradox Indicators', fontsize=12)
         ax2b.set_xlabel('Step')
         ax2b.set_ylabel('Score')
         ax2b.legend()
         ax2b.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(f"{base_filename}_timeseries.png", dpi=120, bbox_inches='tight')
+        plt.savefig(path, dpi=120, bbox_inches='tight')
         plt.close(fig2)
-        
+    
+    @_with_plot_style
+    def _save_stage_distribution(self, path):
+        """Save the dialectical stage distribution figure."""
         fig3, ax3 = plt.subplots(figsize=(10, 6))
-        stage_counts = [np.sum(np.array(self.history_stages) == i) for i in range(10)]
+        stage_counts = np.bincount(self.history_stages, minlength=10)
         colors = ['#2E8B57', '#FFD700', '#FF8C00', '#DC143C', '#8A2BE2', 
                  '#000000', '#FF00FF', '#00FFFF', '#FF1493', '#9400D3']
         bars = ax3.bar(range(10), stage_counts, color=colors, alpha=0.8)
@@ -1124,8 +4424,7 @@ class XenopoulosGeneticHistoricalSystem:
             ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
                     str(count), ha='center', va='bottom', fontsize=9)
         
-        plt.tight_layout()
-        plt.savefig(f"{base_filename}_stages.png", dpi=120, bbox_inches='tight')
+        plt.savefig(path, dpi=120, bbox_inches='tight')
         plt.close(fig3)
     
     # ============================================================================
@@ -1134,7 +4433,7 @@ class XenopoulosGeneticHistoricalSystem:
     
     def get_system_summary(self):
         """Get a quick summary of the system state."""
-        if not self.history_XEPTQLRI:
+        if len(self.history) == 0:
             return "System not yet simulated"
         
         report = self.enhanced_analysis_report()
@@ -1142,7 +4441,7 @@ class XenopoulosGeneticHistoricalSystem:
         summary = (
             f"System: {self.system_name}\n"
             f"ID: {self.system_id}\n"
-            f"Steps: {len(self.history_A)}\n"
+            f"Steps: {len(self.history)}\n"
             f"Current Stage: {report['current_state']['stage']}\n"
             f"True State: {report['true_system_state']}\n"
             f"Max XEPTQLRI: {report['metrics']['max_XEPTQLRI']:.3f}\n"
@@ -1155,19 +4454,997 @@ class XenopoulosGeneticHistoricalSystem:
     
     def reset_system(self):
         """Reset the system to initial state."""
-        self.history_A = []
-        self.history_anti_A = []
-        self.history_tension = []
-        self.history_XEPTQLRI = []
-        self.history_true_XEPTQLRI = []
-        self.history_stages = []
-        self.history_true_stages = []
-        self.history_paradox_scores = []
-        self.risk_events = []
-        self.paradox_events = []
-        self.phase_history = []
+        self.history.clear()
+        self._next_step = 0
+        self._current_A = self.A
+        self._init_rolling_windows()
+        self._aggregates.clear()
+        self.risk_events.clear()
+        self.paradox_events.clear()
+        
+        if self.verbose:
+            print(f"✅ System {self.system_name} reset to initial state")
+    
+    # ============================================================================
+    # PROFILING
+    # ============================================================================
+    
+    def enable_profiling(self, reset=False):
+        """
+        Time the operators and report/plot stages listed in PROFILED_METHODS.
+        
+        The Python step loop is timed per operator; the compiled kernel runs
+        all operators fused, so its blocks are timed as ``simulate.*`` laps
+        instead. Dashboard panels and export artifacts are timed as laps of
+        their stage. Disabled profiling costs nothing: the timing wrappers
+        only exist while profiling is enabled.
+        
+        Parameters:
+        -----------
+        reset : bool
+            Discard the timings collected so far
+        
+        Returns:
+        --------
+        OperatorProfile
+            The collected timings (also available as ``self.profile``)
+        """
+        if self.profile is None:
+            self.profile = OperatorProfile()
+        elif reset:
+            self.profile.reset()
+        if not self._profiling:
+            for name, method in PROFILED_METHODS.items():
+                setattr(self, method, self.profile.wrap(name, getattr(self, method)))
+            self._profiling = True
+        return self.profile
+    
+    def disable_profiling(self):
+        """Remove the timing wrappers; the collected profile stays readable."""
+        for method in PROFILED_METHODS.values():
+            self.__dict__.pop(method, None)
+        self._profiling = False
+        return self.profile
+    
+    def _profile_laps(self, stage):
+        """Lap timer of the sub-stages of ``stage`` while profiling (a no-op otherwise)."""
+        return self.profile.laps(stage) if self._profiling else _no_lap
+    
+    # ============================================================================
+    # CHECKPOINT / RESTORE
+    # ============================================================================
+    
+    def _constructor_params(self):
+        """JSON-serializable constructor parameters (without the seed) of this system."""
+        return {
+            'initial_state_A': self.metadata['initial_state'],
+            'historical_horizon': self.horizon,
+            'aufhebung_threshold': self.aufhebung_threshold,
+            'volatility_factor': self.volatility,
+            'system_name': self.system_name,
+            'history_dtype': self.history.dtype.str,
+            'rolling_windows': dict(self.windows),
+            'trend_window': self.trend_window,
+            'retention': self.history.retention,
+            'phase_schedule': self.phase_schedule.to_dict(),
+        }
+    
+    def save_checkpoint(self, path):
+        """
+        Write a binary snapshot of the complete system state.
+        
+        The snapshot is an uncompressed ``.npz`` archive holding the
+        parameters, RNG states and simulation cursor (next step and current
+        state A) as a JSON header, the noise tape, every
+        retained history column, the rolling-window and report aggregates
+        and the event logs as structured record arrays. The file is written
+        to a temporary name and renamed, so an interrupted save never corrupts the previous one.
+        
+        Parameters:
+        -----------
+        path : str
+            Destination file (conventionally ``*.npz``)
+        """
+        header = {
+            'format': CHECKPOINT_FORMAT,
+            'version': CHECKPOINT_VERSION,
+            'params': self._constructor_params(),
+            'seed_entropy': self.seed_sequence.entropy,
+            'seed_spawn_key': list(self.seed_sequence.spawn_key),
+            'system_id': self.system_id,
+            'creation_time': self.creation_time,
+            'A': float(self.A),
+            'anti_A': float(self.anti_A),
+            'next_step': self._next_step,
+            'current_A': float(self._current_A),
+            'rng_state': self.rng.bit_generator.state,
+            'scoring_rng_state': self.scoring_rng.bit_generator.state,
+            'noise_pos': self._noise_pos,
+            'history_first_step': self.history.first_step,
+            'history_capacity': self.history.capacity,
+        }
+        
+        arrays = {'header': np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8)}
+        if self._noise_u is not None:
+            arrays['noise_u'] = self._noise_u
+            arrays['noise_z'] = self._noise_z
+        for name in HistoryStore.COLUMNS:
+            arrays[f'history.{name}'] = self.history.column(name)
+        for attr in CHECKPOINT_WINDOWS:
+            for field, value in _window_state(getattr(self, attr)).items():
+                arrays[f'window.{attr}.{field}'] = value
+        for field, value in self._aggregates.get_state().items():
+            arrays[f'aggregates.{field}'] = value
+        arrays['risk_events'] = self.risk_events.records
+        arrays['paradox_events'] = self.paradox_events.records
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        return path
+    
+    @classmethod
+    def load_checkpoint(cls, path, verbose=False):
+        """
+        Restore a system saved with ``save_checkpoint``.
+        
+        The restored system continues bitwise identically to the one that
+        was saved: the same history, rolling windows, events and random
+        stream positions. A simulation checkpointed part-way (e.g. between
+        ``simulate_chunks`` chunks) resumes at its next step when
+        ``simulate_enhanced_historical_process`` or ``simulate_chunks`` is
+        called on the restored system.
+        
+        Parameters:
+        -----------
+        path : str
+            Checkpoint file written by ``save_checkpoint``
+        verbose : bool
+            Verbosity of the restored system
+        """
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        header = json.loads(arrays.pop('header').tobytes().decode('utf-8'))
+        if header.get('format') != CHECKPOINT_FORMAT:
+            raise ValueError(f"{path} is not a Xenopoulos system checkpoint")
+        if header.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {header.get('version')} "
+                             f"(expected {CHECKPOINT_VERSION})")
+        
+        params = dict(header['params'])
+        params['history_dtype'] = np.dtype(params['history_dtype'])
+        seed = np.random.SeedSequence(header['seed_entropy'],
+                                      spawn_key=tuple(header['seed_spawn_key']))
+        system = cls(seed=seed, verbose=False, **params)
+        
+        system.system_id = header['system_id']
+        system.creation_time = header['creation_time']
+        system.metadata['system_id'] = system.system_id
+        system.metadata['creation_time'] = system.creation_time
+        system.A = np.float64(header['A'])
+        system.anti_A = np.float64(header['anti_A'])
+        system._next_step = header['next_step']
+        system._current_A = np.float64(header['current_A'])
+        
+        system.rng.bit_generator.state = header['rng_state']
+        system.scoring_rng.bit_generator.state = header['scoring_rng_state']
+        system._noise_u = arrays.get('noise_u')
+        system._noise_z = arrays.get('noise_z')
+        system._noise_pos = header['noise_pos']
+        
+        system.history = HistoryStore(header['history_capacity'], dtype=params['history_dtype'],
+                                      retention=params['retention'])
+        system.history.restore({name: arrays[f'history.{name}'] for name in HistoryStore.COLUMNS},
+                               first_step=header['history_first_step'])
+        system._report_cache = None
+        for attr in CHECKPOINT_WINDOWS:
+            prefix = f'window.{attr}.'
+            _load_window_state(getattr(system, attr),
+                               {key[len(prefix):]: value for key, value in arrays.items()
+                                if key.startswith(prefix)})
+        
+        system.risk_events.extend(arrays['risk_events'])
+        system.paradox_events.extend(arrays['paradox_events'])
+        system._aggregates.set_state({key[len('aggregates.'):]: value for key, value in arrays.items()
+                                      if key.startswith('aggregates.')})
+        
+        system.verbose = verbose
+        if verbose:
+            print(f"✅ System {system.system_name} restored from {path} "
+                  f"({len(system.history)} steps)")
+        return system
+
+
+# ============================================================================
+# VECTORIZED ENSEMBLE ENGINE
+# ============================================================================
+
+class XenopoulosEnsemble:
+    """
+    Vectorized ensemble of independent Xenopoulos Genetic-Historical systems.
+    
+    All members advance together, one historical step at a time, as NumPy
+    arrays of shape (n_members,). Member i reproduces exactly the histories of
+    a XenopoulosGeneticHistoricalSystem built with the same parameters and
+    seed ``seed_sequences[i]`` (see ``member_system``). Member streams are
+    spawned from one root seed, so a member's history does not depend on
+    how many members run together or in which process.
+    """
+    
+    HISTORY_COLUMNS = ('A', 'anti_A', 'tension', 'XEPTQLRI', 'paradox_score', 'stage')
+    
+    def __init__(self, n_members, initial_state_A=0.3, historical_horizon=200,
+                 aufhebung_threshold=0.85, volatility_factor=0.03,
+                 system_name="Default Ensemble", seeds=None, seed=None,
+                 record=None, history_dtype=np.float64, rolling_windows=None,
+                 trend_window=10, phase_schedule=None, verbose=True):
+        """
+        Initialize an ensemble of Xenopoulos systems.
+        
+        Parameters:
+        -----------
+        n_members : int
+            Number of independent systems (Monte Carlo realizations)
+        initial_state_A, aufhebung_threshold, volatility_factor : float or array
+            System parameters, either shared or one value per member
+        historical_horizon : int
+            Number of time steps, common to all members
+        system_name : str
+            Name identifier for the ensemble
+        seeds : sequence of int or SeedSequence, optional
+            One random seed per member
+        seed : int or SeedSequence, optional
+            Root seed; member i uses ``member_seed_sequence(seed, i)`` when
+            ``seeds`` is not given
+        record : sequence of str, optional
+            History columns to keep (default: all of HISTORY_COLUMNS)
+        history_dtype : numpy dtype
+            Storage dtype of the recorded float columns
+        rolling_windows : dict, optional
+            Overrides of the operator window sizes in DEFAULT_WINDOWS
+        trend_window : int
+            Number of recent tensions in the historical trend of XEPTQLRI
+        phase_schedule : PhaseSchedule, dict or str, optional
+            Exogenous phase schedule shared by all members (default: the
+            seven historical phases)
+        verbose : bool
+            Print simulation progress messages
+        """
+        self.verbose = verbose
+        self.n_members = int(n_members)
+        self.horizon = historical_horizon
+        self.system_name = system_name
+        self.phase_schedule = _as_phase_schedule(phase_schedule, self.horizon)
+        
+        n = self.n_members
+        self.initial_state_A = np.broadcast_to(np.asarray(initial_state_A, dtype=float), (n,)).copy()
+        self.aufhebung_threshold = np.broadcast_to(np.asarray(aufhebung_threshold, dtype=float), (n,)).copy()
+        self.volatility = np.broadcast_to(np.asarray(volatility_factor, dtype=float), (n,)).copy()
+        
+        if seeds is None:
+            self.seed_sequence = _as_seed_sequence(seed)
+            self.seed_sequences = spawn_seed_sequences(self.seed_sequence, n)
+        else:
+            self.seed_sequence = None
+            self.seed_sequences = [_as_seed_sequence(s) for s in seeds]
+        if len(self.seed_sequences) != n:
+            raise ValueError(f"Expected {n} seeds, got {len(self.seed_sequences)}")
+        self._streams = [np.random.default_rng(ss) for ss in self.seed_sequences]
+        self._scoring_streams = [np.random.default_rng(scoring_seed_sequence(ss))
+                                 for ss in self.seed_sequences]
+        
+        self.record = tuple(self.HISTORY_COLUMNS if record is None else record)
+        unknown = set(self.record) - set(self.HISTORY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown history columns: {sorted(unknown)}")
+        self.history_dtype = np.dtype(history_dtype)
+        
+        self.histories = {}
+        self.phase_history = np.zeros(0, dtype=np.int8)
+        self.risk_event_counts = np.zeros(n, dtype=np.int64)
+        self.critical_event_counts = np.zeros(n, dtype=np.int64)
+        self.paradox_event_counts = {
+            'SIMULTANEOUS_EXTREMITY': np.zeros(n, dtype=np.int64),
+            'FALSE_STABILITY': np.zeros(n, dtype=np.int64),
+            'META_PARADOX': np.zeros(n, dtype=np.int64)
+        }
+        
+        # Noise tape, laid out (step, member) for contiguous per-step access
+        self._noise_u = np.empty((NOISE_BLOCK_STEPS, n))
+        self._noise_z = np.empty((NOISE_BLOCK_STEPS, NOISE_NORMALS, n))
+        self._noise_pos = NOISE_BLOCK_STEPS
+        
+        # Rolling-window statistics, one lane per member
+        self.windows = _resolve_windows(rolling_windows)
+        self.trend_window = int(trend_window)
+        self._init_rolling_windows((n,))
+        self._steps_done = 0
+        
+        self.A = np.clip(self.initial_state_A, 0, 1)
+        self.anti_A = self._batch_negation(self.A, *self._next_step_noise())
+    
+    # ============================================================================
+    # BATCHED NOISE TAPE
+    # ============================================================================
+    
+    def _draw_noise_block(self):
+        """Draw the next noise tape block of every member from its own streams."""
+        for i, (stream, scoring) in enumerate(zip(self._streams, self._scoring_streams)):
+            self._noise_u[:, i] = stream.random(NOISE_BLOCK_STEPS)
+            self._noise_z[:, :Z_XEPTQLRI, i] = stream.standard_normal((NOISE_BLOCK_STEPS, Z_XEPTQLRI))
+            self._noise_z[:, Z_XEPTQLRI, i] = scoring.standard_normal(NOISE_BLOCK_STEPS)
+        self._noise_pos = 0
+    
+    def _next_step_noise(self):
+        """Return the (uniform, normals) noise rows of all members for one step."""
+        if self._noise_pos >= NOISE_BLOCK_STEPS:
+            self._draw_noise_block()
+        u = self._noise_u[self._noise_pos]
+        z = self._noise_z[self._noise_pos]
+        self._noise_pos += 1
+        return u, z
+    
+    # ============================================================================
+    # BATCHED DIALECTICAL OPERATORS
+    # ============================================================================
+    
+    _init_rolling_windows = XenopoulosGeneticHistoricalSystem._init_rolling_windows
+    _update_rolling_windows = XenopoulosGeneticHistoricalSystem._update_rolling_windows
+    
+    def _batch_negation(self, state, u, z):
+        """¬ᴰ operator applied to every member."""
+        preservation_factor = 0.8 + 0.2 * u
+        
+        historical_effect = 0.0
+        paradox_feedback = 0.0
+        if self._steps_done > 0:
+            recent_mean = self._roll_A.mean()
+            historical_effect = 0.1 * _tanh(recent_mean)
+            
+            recent_paradox = self._roll_paradox.mean()
+            paradox_feedback = np.where(recent_paradox > 0.7, 0.05 * z[Z_PARADOX_FEEDBACK], 0.0)
+        
+        enhanced_negation = -state * preservation_factor * (1 + historical_effect + paradox_feedback)
+        stochastic_component = self.volatility * 0.1 * z[Z_NEGATION]
+        
+        return enhanced_negation + stochastic_component
+    
+    def _batch_conjunction_intensity(self, state, anti_state, z):
+        """(A ∧ᴰ ¬ᴰA) intensity applied to every member."""
+        raw_intensity = np.abs(state * anti_state)
+        extreme = (np.abs(state) > 0.8) & (np.abs(anti_state) > 0.8)
+        complexity_factor = np.where(extreme,
+                                     1.5 + self.volatility * z[Z_CONJUNCTION],
+                                     1 + self.volatility * z[Z_CONJUNCTION])
+        return np.clip(raw_intensity * complexity_factor, 0, 1)
+    
+    def _batch_paradox_score(self, state, anti_state, tension):
+        """Paradox score applied to every member."""
+        extremity_score = np.minimum(np.abs(state), np.abs(anti_state))
+        symmetry_score = 1 - np.abs(np.abs(state) - np.abs(anti_state))
+        tension_paradox = np.where((extremity_score > 0.7) & (tension < 0.3), 0.5, 0)
+        
+        persistence_score = 0
+        if self._steps_done > self._roll_abs_A.window:
+            persistent = (self._roll_abs_A.mean() > 0.7) & (self._roll_abs_anti_A.mean() > 0.7)
+            persistence_score = np.where(persistent, 0.3, 0)
+        
+        paradox_score = (extremity_score * 0.4 + 
+                        symmetry_score * 0.3 + 
+                        tension_paradox * 0.2 + 
+                        persistence_score * 0.1)
+        
+        return np.clip(paradox_score, 0, 1)
+    
+    def _batch_XEPTQLRI(self, tension, historical_trend, state, anti_state, paradox_score, z):
+        """Enhanced XEPTQLRI applied to every member."""
+        trend_factor = np.where(historical_trend > 0.1, 1.5, 1.0)
+        
+        paradox_factor = np.where(paradox_score > 0.7, np.where(tension < 0.3, 1.8, 2.0), 1.0)
+        
+        extreme = (np.abs(state) > 0.8) & (np.abs(anti_state) > 0.8)
+        extremity_multiplier = np.where(extreme, 1.5, 1.0)
+        
+        raw_XEPTQLRI = tension * trend_factor * paradox_factor * extremity_multiplier
+        
+        stochastic_factor = 1 + (self.volatility * 0.3 * z[Z_XEPTQLRI])
+        raw_XEPTQLRI = raw_XEPTQLRI * stochastic_factor
+        
+        if self._steps_done > self._roll_extreme_A.window:
+            recent_extremity = self._roll_extreme_A.mean()
+            raw_XEPTQLRI = np.where(recent_extremity > 0.7, raw_XEPTQLRI * 1.3, raw_XEPTQLRI)
+        
+        return scale_XEPTQLRI(raw_XEPTQLRI, self.aufhebung_threshold)
+    
+    def _batch_stage_classification(self, tension, state, anti_state, paradox_score):
+        """Enhanced stage classification applied to every member."""
+        thr = self.aufhebung_threshold
+        stage = np.select(
+            [tension < 0.15, tension < 0.35, tension < 0.55, tension < 0.75, tension < thr],
+            [0, 1, 2, 3, 4], default=5
+        )
+        stage = np.where((paradox_score > 0.8) & (tension > 0.6), 9, stage)
+        
+        if self._steps_done > self._roll_stages.window:
+            recent_stages = self._roll_stages
+            permanent = (recent_stages.distinct >= 4) & (recent_stages.variance() > 1.5 ** 2)
+            stage = np.where(permanent, 8, stage)
+        
+        abs_A = np.abs(state)
+        abs_anti = np.abs(anti_state)
+        false_stability = (tension < 0.3) & ((abs_A > 0.7) | (abs_anti > 0.7))
+        stage = np.where(false_stability, 7, stage)
+        paradoxical = (abs_A > 0.8) & (abs_anti > 0.8) & (tension < 0.4)
+        stage = np.where(paradoxical, 6, stage)
+        
+        return stage
+    
+    # ============================================================================
+    # SIMULATION
+    # ============================================================================
+    
+    def simulate_enhanced_historical_process(self, aggregator=None):
+        """
+        Simulate the historical process of all members simultaneously.
         
-        print(f"✅ System {self.system_name} reset to initial state")
+        Parameters:
+        -----------
+        aggregator : TrajectoryAggregator, optional
+            Receives every step of every member as it is computed, so
+            per-step envelopes are available even with ``record=()``
+        """
+        n, T = self.n_members, self.horizon
+        if self.verbose:
+            print(f"\n🌌 SIMULATING ENSEMBLE {self.system_name.upper()}: {n} members x {T} steps...")
+        
+        # Histories are stored (step, member) and exposed as (member, step) views
+        storage = {}
+        for col in self.record:
+            dtype = np.int8 if col == 'stage' else self.history_dtype
+            storage[col] = np.empty((T, n), dtype=dtype)
+        self.phase_history = np.empty(T, dtype=np.int8)
+        
+        current_A = self.A
+        phases, pressures, volatilities, trends = (
+            column.tolist() for column in self.phase_schedule.segment(0, T))
+        
+        for step, current_phase, pressure, volatility, historical_trend in zip(
+                range(T), phases, pressures, volatilities, trends):
+            u, z = self._next_step_noise()
+            
+            historical_factor = 1 + 0.003 * step
+            current_anti_A = self._batch_negation(current_A, u, z) * historical_factor
+            
+            current_tension = self._batch_conjunction_intensity(current_A, current_anti_A, z)
+            
+            dialectical_pressure = current_tension * pressure
+            systemic_noise = volatility * z[Z_SYSTEMIC]
+            
+            current_A = current_A + dialectical_pressure + historical_trend + systemic_noise
+            current_A = np.clip(current_A, -1.2, 1.2)
+            
+            if step > self.trend_window and self._trend.full:
+                recent_trend = self._trend.slope()
+            else:
+                recent_trend = 0
+            
+            paradox_score = self._batch_paradox_score(current_A, current_anti_A, current_tension)
+            
+            enhanced_XEPTQLRI = self._batch_XEPTQLRI(
+                current_tension, recent_trend, current_A, current_anti_A, paradox_score, z
+            )
+            
+            stage_idx = self._batch_stage_classification(
+                current_tension, current_A, current_anti_A, paradox_score
+            )
+            
+            self._count_events(current_A, current_anti_A, paradox_score, stage_idx, enhanced_XEPTQLRI)
+            
+            # Store history and advance rolling windows
+            values = {
+                'A': current_A,
+                'anti_A': current_anti_A,
+                'tension': current_tension,
+                'XEPTQLRI': enhanced_XEPTQLRI,
+                'paradox_score': paradox_score,
+                'stage': stage_idx
+            }
+            for col, column in storage.items():
+                column[step] = values[col]
+            self.phase_history[step] = current_phase
+            if aggregator is not None:
+                aggregator.update_step(step, values)
+            
+            self._update_rolling_windows(current_A, current_anti_A, current_tension, paradox_score, stage_idx)
+            self._steps_done += 1
+        
+        self.A = current_A
+        self.histories = {col: column.T for col, column in storage.items()}
+        
+        if self.verbose:
+            print(f"   ✅ Ensemble simulation completed: {n} members x {T} steps")
+            print(f"   ⚡ Mean risk events per member: {self.risk_event_counts.mean():.1f}")
+        
+        return self
+    
+    def _count_events(self, state, anti_state, paradox_score, stage_idx, XEPTQLRI):
+        """Accumulate per-member risk and paradox event counts for one step."""
+        self.risk_event_counts += XEPTQLRI > 0.7
+        self.critical_event_counts += XEPTQLRI > 1.0
+        counts = self.paradox_event_counts
+        counts['SIMULTANEOUS_EXTREMITY'] += (np.abs(state) > 0.85) & (np.abs(anti_state) > 0.85)
+        counts['FALSE_STABILITY'] += stage_idx == 7
+        counts['META_PARADOX'] += paradox_score > 0.9
+    
+    # ============================================================================
+    # MEMBER ACCESS
+    # ============================================================================
+    
+    def member_history(self, i):
+        """Recorded history columns of member ``i``."""
+        return {col: values[i] for col, values in self.histories.items()}
+    
+    def member_system(self, i, system_name=None, verbose=None):
+        """
+        Build the scalar XenopoulosGeneticHistoricalSystem equivalent to member ``i``.
+        
+        Simulating the returned system reproduces ``member_history(i)``.
+        """
+        return XenopoulosGeneticHistoricalSystem(
+            initial_state_A=float(self.initial_state_A[i]),
+            historical_horizon=self.horizon,
+            aufhebung_threshold=float(self.aufhebung_threshold[i]),
+            volatility_factor=float(self.volatility[i]),
+            system_name=system_name or f"{self.system_name} #{i}",
+            seed=self.seed_sequences[i],
+            rolling_windows=self.windows,
+            trend_window=self.trend_window,
+            phase_schedule=self.phase_schedule,
+            verbose=self.verbose if verbose is None else verbose
+        )
+    
+    def ensemble_summary(self):
+        """Per-member summary metrics as a dict of arrays."""
+        summary = {
+            'member': np.arange(self.n_members),
+            'risk_events': self.risk_event_counts.copy(),
+            'critical_events': self.critical_event_counts.copy()
+        }
+        for event_type, counts in self.paradox_event_counts.items():
+            summary[f'{event_type.lower()}_events'] = counts.copy()
+        if 'XEPTQLRI' in self.histories:
+            summary['max_XEPTQLRI'] = self.histories['XEPTQLRI'].max(axis=1)
+            summary['mean_XEPTQLRI'] = self.histories['XEPTQLRI'].mean(axis=1)
+        if 'paradox_score' in self.histories:
+            summary['paradox_persistence'] = (self.histories['paradox_score'] > 0.7).mean(axis=1)
+        return summary
+
+
+# ============================================================================
+# STREAMING ENSEMBLE AGGREGATION
+# ============================================================================
+
+class TrajectoryAggregator:
+    """
+    Mergeable per-step summaries of many member trajectories.
+    
+    For every step and metric it keeps the count, mean and sum of squared
+    deviations (merged with Chan's parallel formula), the exact min and max,
+    and a fixed-range histogram used as quantile sketch. All summaries are
+    additive, so aggregators filled by separate workers or processes merge
+    exactly. Memory depends on horizon and bins, not on the member count.
+    Values outside a metric's range land in the edge bins and are counted
+    per step in ``clipped``.
+    """
+    
+    DEFAULT_RANGES = {
+        'XEPTQLRI': (0.0, 3.0),
+        'tension': (0.0, 1.0),
+        'paradox_score': (0.0, 1.0),
+        'A': (-1.2, 1.2),
+        # ¬A before the (1 + 0.003 * step) historical factor, which __init__
+        # applies for the last step of the horizon
+        'anti_A': (-1.6, 1.6)
+    }
+    
+    # Column names of XenopoulosGeneticHistoricalSystem.history
+    SYSTEM_COLUMNS = {
+        'XEPTQLRI': 'XEPTQLRI',
+        'tension': 'tension',
+        'paradox_score': 'paradox_scores',
+        'A': 'A',
+        'anti_A': 'anti_A'
+    }
+    
+    def __init__(self, horizon, ranges=None, bins=256):
+        """
+        Parameters:
+        -----------
+        horizon : int
+            Number of steps of the aggregated trajectories
+        ranges : dict, optional
+            Metric name -> (low, high) histogram range (default: DEFAULT_RANGES).
+            Values outside the range are counted in ``clipped`` and fall into
+            the edge bins.
+        bins : int
+            Histogram bins per step; quantile resolution is (high - low) / bins
+        """
+        self.horizon = int(horizon)
+        self.ranges = dict(self.DEFAULT_RANGES if ranges is None else ranges)
+        if ranges is None:
+            growth = 1 + 0.003 * max(self.horizon - 1, 0)
+            low, high = self.ranges['anti_A']
+            self.ranges['anti_A'] = (low * growth, high * growth)
+        self.bins = int(bins)
+        T = self.horizon
+        self.count = {m: np.zeros(T, dtype=np.int64) for m in self.ranges}
+        self.mean = {m: np.zeros(T) for m in self.ranges}
+        self.m2 = {m: np.zeros(T) for m in self.ranges}
+        self.min = {m: np.full(T, np.inf) for m in self.ranges}
+        self.max = {m: np.full(T, -np.inf) for m in self.ranges}
+        self.hist = {m: np.zeros((T, self.bins), dtype=np.int64) for m in self.ranges}
+        self.clipped = {m: np.zeros(T, dtype=np.int64) for m in self.ranges}
+    
+    def _bin_index(self, metric, values, steps):
+        """Histogram bins of ``values`` at ``steps``, counting values outside the range."""
+        low, high = self.ranges[metric]
+        outside = (values < low) | (values > high)
+        if outside.any():
+            self.clipped[metric][steps] += outside.sum(axis=0)
+            warnings.warn(f"{metric} values outside the histogram range [{low:g}, {high:g}] "
+                          "were put in the edge bins; its quantiles are biased near the edges",
+                          RuntimeWarning, stacklevel=3)
+        idx = np.floor((values - low) * (self.bins / (high - low))).astype(np.int64)
+        return np.clip(idx, 0, self.bins - 1)
+    
+    def _combine(self, metric, steps, n_b, mean_b, m2_b, min_b, max_b):
+        """Chan's parallel update of the moments at ``steps``."""
+        n_a = self.count[metric][steps]
+        mean_a = self.mean[metric][steps]
+        n = n_a + n_b
+        safe_n = np.maximum(n, 1)
+        delta = mean_b - mean_a
+        self.mean[metric][steps] = mean_a + delta * (n_b / safe_n)
+        self.m2[metric][steps] = self.m2[metric][steps] + m2_b + delta * delta * (n_a * n_b / safe_n)
+        self.count[metric][steps] = n
+        self.min[metric][steps] = np.minimum(self.min[metric][steps], min_b)
+        self.max[metric][steps] = np.maximum(self.max[metric][steps], max_b)
+    
+    def update(self, trajectories, start=0):
+        """
+        Add finished trajectories.
+        
+        ``trajectories`` maps metric names to arrays of shape (steps,) for one
+        member or (members, steps) for several, covering steps
+        ``start`` .. ``start + steps - 1``. Metrics not tracked are ignored.
+        """
+        for metric, values in trajectories.items():
+            if metric not in self.ranges:
+                continue
+            values = np.atleast_2d(np.asarray(values, dtype=float))
+            k, length = values.shape
+            steps = slice(start, start + length)
+            mean_b = values.mean(axis=0)
+            m2_b = ((values - mean_b) ** 2).sum(axis=0)
+            self._combine(metric, steps, k, mean_b, m2_b, values.min(axis=0), values.max(axis=0))
+            flat = (np.arange(length) * self.bins + self._bin_index(metric, values, steps)).ravel()
+            self.hist[metric][steps] += np.bincount(flat, minlength=length * self.bins).reshape(length, self.bins)
+        return self
+    
+    def update_step(self, step, values):
+        """Add the values of many members at a single step (e.g. from an ensemble)."""
+        for metric, column in values.items():
+            if metric not in self.ranges:
+                continue
+            column = np.asarray(column, dtype=float).ravel()
+            mean_b = column.mean()
+            m2_b = ((column - mean_b) ** 2).sum()
+            self._combine(metric, step, column.size, mean_b, m2_b, column.min(), column.max())
+            self.hist[metric][step] += np.bincount(self._bin_index(metric, column, step), minlength=self.bins)
+        return self
+    
+    def update_system(self, system):
+        """Add the history of a simulated XenopoulosGeneticHistoricalSystem."""
+        columns = {m: system.history.column(c) for m, c in self.SYSTEM_COLUMNS.items() if m in self.ranges}
+        return self.update(columns)
+    
+    def update_chunk(self, chunk):
+        """Add one chunk yielded by ``XenopoulosGeneticHistoricalSystem.simulate_chunks``."""
+        columns = {m: chunk[c] for m, c in self.SYSTEM_COLUMNS.items() if m in self.ranges}
+        return self.update(columns, start=chunk['start'])
+    
+    def update_ensemble(self, ensemble):
+        """Add the recorded histories of a simulated XenopoulosEnsemble."""
+        return self.update(ensemble.histories)
+    
+    def merge(self, other):
+        """Merge another aggregator with the same horizon, ranges and bins into this one."""
+        if (other.horizon, other.bins, other.ranges) != (self.horizon, self.bins, self.ranges):
+            raise ValueError("Cannot merge aggregators with different horizon, bins or ranges")
+        steps = slice(None)
+        for metric in self.ranges:
+            self._combine(metric, steps, other.count[metric], other.mean[metric], other.m2[metric],
+                          other.min[metric], other.max[metric])
+            self.hist[metric] += other.hist[metric]
+            self.clipped[metric] += other.clipped[metric]
+        return self
+    
+    def quantile(self, metric, q):
+        """Per-step ``q`` quantile of a metric, interpolated within histogram bins."""
+        hist = self.hist[metric]
+        count = self.count[metric]
+        low, high = self.ranges[metric]
+        width = (high - low) / self.bins
+        cum = np.cumsum(hist, axis=1)
+        target = q * count
+        j = np.argmax(cum >= target[:, None], axis=1)
+        rows = np.arange(self.horizon)
+        in_bin = hist[rows, j]
+        before = cum[rows, j] - in_bin
+        frac = np.clip((target - before) / np.maximum(in_bin, 1), 0, 1)
+        values = np.clip(low + width * (j + frac), self.min[metric], self.max[metric])
+        return np.where(count > 0, values, np.nan)
+    
+    def envelope(self, quantiles=(0.05, 0.5, 0.95)):
+        """
+        Per-step envelope of every metric.
+        
+        Returns a dict with 'steps', 'quantiles' and, per metric, the arrays
+        'mean', 'std', 'min', 'max', 'count', 'clipped' and one 'qNN' array per
+        quantile (e.g. 'q05', 'q50', 'q95'), ready for plot_ensemble_envelope.
+        """
+        envelope = {'steps': np.arange(self.horizon), 'quantiles': tuple(quantiles)}
+        for metric in self.ranges:
+            count = self.count[metric]
+            valid = count > 0
+            summary = {
+                'count': count.copy(),
+                'clipped': self.clipped[metric].copy(),
+                'mean': np.where(valid, self.mean[metric], np.nan),
+                'std': np.where(valid, np.sqrt(self.m2[metric] / np.maximum(count, 1)), np.nan),
+                'min': np.where(valid, self.min[metric], np.nan),
+                'max': np.where(valid, self.max[metric], np.nan)
+            }
+            for q in quantiles:
+                summary[_quantile_key(q)] = self.quantile(metric, q)
+            envelope[metric] = summary
+        return envelope
+
+
+def _quantile_key(q):
+    """Envelope key of a quantile, e.g. 0.05 -> 'q05', 0.5 -> 'q50'."""
+    return f"q{round(q * 100):02d}"
+
+
+@_with_plot_style
+def plot_ensemble_envelope(envelope, metrics=None, fig=None):
+    """
+    Plot per-step ensemble envelopes (outer quantile band, median and mean).
+    """
+    metrics = [m for m in (metrics or ('XEPTQLRI', 'tension', 'paradox_score')) if m in envelope]
+    quantiles = sorted(envelope['quantiles'])
+    steps = envelope['steps']
+    if fig is None:
+        fig = plt.figure(figsize=(14, 3.5 * len(metrics)))
+    axes = fig.subplots(len(metrics), 1, squeeze=False)[:, 0]
+    colors = {'XEPTQLRI': 'darkgreen', 'tension': 'darkorange', 'paradox_score': 'purple'}
+    
+    for ax, metric in zip(axes, metrics):
+        summary = envelope[metric]
+        color = colors.get(metric, 'steelblue')
+        lo_key, hi_key = _quantile_key(quantiles[0]), _quantile_key(quantiles[-1])
+        ax.fill_between(steps, summary[lo_key], summary[hi_key], color=color, alpha=0.2,
+                        label=f'{quantiles[0]:.0%}–{quantiles[-1]:.0%} band')
+        if 0.5 in quantiles:
+            ax.plot(steps, summary['q50'], color=color, linewidth=2, label='Median')
+        ax.plot(steps, summary['mean'], color=color, linestyle='--', linewidth=1, alpha=0.8, label='Mean')
+        ax.set_title(f'Ensemble Envelope: {metric}', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Step')
+        ax.set_ylabel(metric)
+        ax.grid(True, alpha=0.2)
+        ax.legend(loc='upper left', fontsize=8)
+    
+    return fig
+
+
+# ============================================================================
+# PARAMETER SWEEPS
+# ============================================================================
+
+SWEEP_PARAMETERS = ('initial_state_A', 'historical_horizon', 'aufhebung_threshold',
+                    'volatility_factor', 'trend_window', 'seed')
+
+SWEEP_METRICS = ('max_XEPTQLRI', 'mean_XEPTQLRI', 'std_XEPTQLRI', 'mean_paradox_score',
+                 'paradox_persistence', 'stability_deception', 'true_state',
+                 'final_stage_index', 'risk_events', 'paradox_events')
+
+SWEEP_CHECKPOINT_VERSION = 1
+
+
+def expand_parameter_grid(grid):
+    """
+    Expand a parameter grid into a list of samples (cartesian product).
+    
+    ``grid`` maps constructor parameter names to sequences of values.
+    """
+    names = list(grid)
+    samples = [{}]
+    for name in names:
+        samples = [dict(sample, **{name: value}) for sample in samples for value in grid[name]]
+    return samples
+
+
+def _sweep_row(sample_id, params, seed_sequence):
+    """Simulate one sample and collect its report metrics."""
+    kwargs = dict(params)
+    seed = kwargs.pop('seed', None)
+    system = XenopoulosGeneticHistoricalSystem(
+        system_name=f"Sweep Sample {sample_id}",
+        seed=seed_sequence if seed is None else seed,
+        verbose=False,
+        **kwargs
+    )
+    system.simulate_enhanced_historical_process()
+    report = system.enhanced_analysis_report()
+    metrics = report['metrics']
+    row = {'sample_id': sample_id}
+    row.update(params)
+    row.update({
+        'max_XEPTQLRI': metrics['max_XEPTQLRI'],
+        'mean_XEPTQLRI': metrics['mean_XEPTQLRI'],
+        'std_XEPTQLRI': metrics['std_XEPTQLRI'],
+        'mean_paradox_score': metrics['mean_paradox_score'],
+        'paradox_persistence': report['paradox_analysis']['paradox_persistence'],
+        'stability_deception': metrics['stability_deception'],
+        'true_state': report['true_system_state'],
+        'final_stage_index': report['current_state']['stage_index'],
+        'risk_events': len(system.risk_events),
+        'paradox_events': report['paradox_analysis']['total_paradox_events']
+    })
+    return row
+
+
+def _run_sweep_chunk(chunk):
+    """Process-pool work unit: simulate a chunk of (sample_id, params, seed_sequence)."""
+    return [_sweep_row(sample_id, params, ss) for sample_id, params, ss in chunk]
+
+
+def _read_sweep_checkpoint(path):
+    """Return (header, rows) of a sweep checkpoint, ignoring a truncated last line."""
+    header, rows = None, []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if header is None:
+                    header = record
+                else:
+                    rows.append(record)
+    except FileNotFoundError:
+        pass
+    return header, rows
+
+
+def parameter_sweep(grid=None, samples=None, base_params=None, seed=None,
+                    processes=None, chunk_size=None, checkpoint=None, verbose=True):
+    """
+    Run a parameter sweep over the system's constructor space in a process pool.
+    
+    Parameters:
+    -----------
+    grid : dict, optional
+        Parameter name -> sequence of values, expanded as a cartesian product
+    samples : list of dict, optional
+        Explicit parameter samples (used instead of ``grid``)
+    base_params : dict, optional
+        Fixed constructor parameters shared by every sample
+    seed : int or SeedSequence, optional
+        Root seed; samples without an explicit 'seed' use
+        ``member_seed_sequence(seed, sample_id)``. When resuming, the root
+        seed stored in the checkpoint is used, and a different ``seed``
+        raises ValueError
+    processes : int, optional
+        Worker processes (default: CPU count); 1 runs in the calling process
+    chunk_size : int, optional
+        Samples per work unit (default: about four units per worker)
+    checkpoint : str, optional
+        JSON Lines file where completed rows are appended; rerunning the
+        same sweep with the same checkpoint skips the completed samples
+    verbose : bool
+        Print sweep progress
+    
+    Returns:
+    --------
+    pandas.DataFrame with one row per sample: sample_id, the sample
+    parameters and the SWEEP_METRICS columns
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    if samples is None:
+        if grid is None:
+            raise ValueError("Provide either a parameter grid or a list of samples")
+        samples = expand_parameter_grid(grid)
+    base_params = dict(base_params or {})
+    samples = [{k: v.item() if isinstance(v, np.generic) else v
+                for k, v in dict(base_params, **sample).items()}
+               for sample in samples]
+    for sample in samples:
+        unknown = set(sample) - set(SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    
+    # Resume: the checkpoint header fixes the root seed of the sweep
+    header, done_rows = (None, []) if checkpoint is None else _read_sweep_checkpoint(checkpoint)
+    if header is not None:
+        if header.get('version') != SWEEP_CHECKPOINT_VERSION or header.get('n_samples') != len(samples):
+            raise ValueError(f"Checkpoint {checkpoint} belongs to a different sweep")
+        root = np.random.SeedSequence(header['root_entropy'], spawn_key=tuple(header['root_spawn_key']))
+        if seed is not None:
+            requested = _as_seed_sequence(seed)
+            if (requested.entropy, tuple(requested.spawn_key)) != (root.entropy, tuple(root.spawn_key)):
+                raise ValueError(f"Checkpoint {checkpoint} was written by a sweep with a different seed")
+        # Rewrite without a possibly truncated last line before appending
+        with open(checkpoint, 'w', encoding='utf-8') as f:
+            for record in [header] + done_rows:
+                f.write(json.dumps(record) + "\n")
+    else:
+        root = _as_seed_sequence(seed)
+        if checkpoint is not None:
+            with open(checkpoint, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'format': 'xenopoulos-sweep',
+                                    'version': SWEEP_CHECKPOINT_VERSION,
+                                    'n_samples': len(samples),
+                                    'root_entropy': root.entropy,
+                                    'root_spawn_key': list(root.spawn_key)}) + "\n")
+    
+    rows = {}
+    for row in done_rows:
+        sample_id = row['sample_id']
+        if any(row.get(k) != v for k, v in samples[sample_id].items()):
+            raise ValueError(f"Checkpoint row {sample_id} does not match the sweep parameters")
+        rows[sample_id] = row
+    
+    pending = [(i, sample, member_seed_sequence(root, i))
+               for i, sample in enumerate(samples) if i not in rows]
+    processes = processes or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(pending) // (processes * 4))
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    
+    if verbose:
+        print(f"\n🧭 PARAMETER SWEEP: {len(samples)} samples "
+              f"({len(rows)} resumed), {len(chunks)} work units on {processes} processes")
+    
+    def collect(chunk_rows):
+        for row in chunk_rows:
+            rows[row['sample_id']] = row
+        if checkpoint is not None:
+            with open(checkpoint, 'a', encoding='utf-8') as f:
+                for row in chunk_rows:
+                    f.write(json.dumps(row) + "\n")
+        if verbose:
+            sys.stdout.write(f"\r   Progress: {len(rows)}/{len(samples)} samples")
+            sys.stdout.flush()
+    
+    if processes == 1:
+        for chunk in chunks:
+            collect(_run_sweep_chunk(chunk))
+    elif chunks:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_run_sweep_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                collect(future.result())
+    
+    if verbose:
+        print(f"\r   ✅ Sweep completed: {len(rows)} samples")
+    
+    columns = ['sample_id'] + [p for p in SWEEP_PARAMETERS if any(p in s for s in samples)] + list(SWEEP_METRICS)
+    ordered = [rows[i] for i in sorted(rows)]
+    return pd.DataFrame({col: [row.get(col) for row in ordered] for col in columns})
 
 
 # ============================================================================
@@ -1290,6 +5567,7 @@ if __name__ == "__main__":
     Main execution with interactive options.
     """
     
+    print_banner()
     print("\n" + "="*80)
     print("ENHANCED XENOPOULOS SYSTEM v2.0 - MAIN MENU")
     print("="*80)